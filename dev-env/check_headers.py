@@ -2,15 +2,28 @@
 """Check headers in Google Sheet November worksheet."""
 import yaml
 from pathlib import Path
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
 import json
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+def column_label(index):
+    """Spreadsheet column label for a 1-based index (1 -> A, 27 -> AA)."""
+    label = ''
+    while index > 0:
+        index, remainder = divmod(index - 1, 26)
+        label = chr(65 + remainder) + label
+    return label
+
+
 # Load config from dev-env/test-config.yaml
 config_path = Path(__file__).parent / "test-config.yaml"
 if config_path.exists():
     with open(config_path) as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=SafeLoader)
     sheet_id = config.get('sheet_document_id', '')
 else:
     sheet_id = '1XgCsSSnWFoYX1DVmqRnyRlJCV4ortxGA-tquz1GlahY'
@@ -23,6 +36,11 @@ if not creds_path.exists():
 with open(creds_path, 'r') as f:
     cred_data = json.load(f)
 
+# Imported only once credentials were found: the Google client libraries
+# are slow to import and pointless to load when the script cannot run
+from google.oauth2.credentials import Credentials
+from googleapiclient.discovery import build
+
 creds = Credentials(
     token=cred_data.get('token'),
     refresh_token=cred_data.get('refresh_token'),
@@ -32,30 +50,27 @@ creds = Credentials(
     scopes=cred_data.get('scopes')
 )
 
-service = build('sheets', 'v4', credentials=creds)
+# Use the discovery document bundled with the client instead of fetching it
+service = build('sheets', 'v4', credentials=creds, cache_discovery=False, static_discovery=True)
 sheet = service.spreadsheets()
 
-# Get November sheet headers
-result = sheet.values().get(
+# Fetch the header row and the first data row in one round-trip
+result = sheet.values().batchGet(
     spreadsheetId=sheet_id,
-    range='November!A1:Z1'
+    ranges=['November!A1:Z1', 'November!A2:Z2']
 ).execute()
+header_range, first_row_range = result.get('valueRanges', [{}, {}])
 
-headers = result.get('values', [[]])[0] if result.get('values') else []
+headers = header_range.get('values', [[]])[0] if header_range.get('values') else []
 print('📋 Headers in November sheet:')
 for i, header in enumerate(headers, 1):
-    print(f'  Column {chr(64+i)} ({i}): {header}')
+    print(f'  Column {column_label(i)} ({i}): {header}')
 
 print(f'\n📊 Total columns: {len(headers)}')
 
-# Also get first data row to see what's there
-result = sheet.values().get(
-    spreadsheetId=sheet_id,
-    range='November!A2:Z2'
-).execute()
-
-first_row = result.get('values', [[]])[0] if result.get('values') else []
+# Also show the first data row to see what's there
+first_row = first_row_range.get('values', [[]])[0] if first_row_range.get('values') else []
 if first_row:
     print('\n📝 First data row:')
     for i, value in enumerate(first_row, 1):
-        print(f'  Column {chr(64+i)}: {value}')
+        print(f'  Column {column_label(i)}: {value}')
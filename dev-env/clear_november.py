@@ -3,15 +3,18 @@
 import sys
 import yaml
 from pathlib import Path
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
 import json
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 # Load config from dev-env/test-config.yaml
 config_path = Path(__file__).parent / "test-config.yaml"
 if config_path.exists():
     with open(config_path) as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=SafeLoader)
     sheet_id = config.get('sheet_document_id', '')
 else:
     sheet_id = '1XgCsSSnWFoYX1DVmqRnyRlJCV4ortxGA-tquz1GlahY'
@@ -24,6 +27,11 @@ if not creds_path.exists():
 with open(creds_path, 'r') as f:
     cred_data = json.load(f)
 
+# Imported only once credentials were found: the Google client libraries
+# are slow to import and pointless to load when the script cannot run
+from google.oauth2.credentials import Credentials
+from googleapiclient.discovery import build
+
 creds = Credentials(
     token=cred_data.get('token'),
     refresh_token=cred_data.get('refresh_token'),
@@ -33,7 +41,8 @@ creds = Credentials(
     scopes=cred_data.get('scopes')
 )
 
-service = build('sheets', 'v4', credentials=creds)
+# Use the discovery document bundled with the client instead of fetching it
+service = build('sheets', 'v4', credentials=creds, cache_discovery=False, static_discovery=True)
 sheet = service.spreadsheets()
 
 # Clear data rows (keep header row 1)
@@ -11,6 +11,11 @@ import yaml
 from datetime import datetime, timedelta
 from pathlib import Path
 
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
 # Add src to path (parent directory since we're in dev-env/)
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
@@ -27,7 +32,7 @@ def load_test_config():
         raise FileNotFoundError(f"test-config.yaml not found at {config_path}")
     
     with open(config_path) as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=SafeLoader)
 
 
 def create_november_tasks():
@@ -180,18 +185,22 @@ def create_november_tasks():
     }
     
     with open(daily_file, 'w') as f:
-        yaml.dump(data_dict, f, default_flow_style=False, allow_unicode=True)
+        yaml.dump(data_dict, f, Dumper=SafeDumper, default_flow_style=False, allow_unicode=True, sort_keys=False)
     
     print(f"✅ Created {len(entries)} mockup tasks for November 2025")
     print(f"   Worklog file: {daily_file}")
     print(f"\nTasks by project:")
     
+    # Tally count and hours per project in a single pass over the entries
+    totals = {}
+    for e in entries:
+        hours = (datetime.fromisoformat(e.end_time) - datetime.fromisoformat(e.start_time)).total_seconds() / 3600
+        project_totals = totals.setdefault(e.project, [0, 0.0])
+        project_totals[0] += 1
+        project_totals[1] += hours
+    
     for project in projects:
-        count = sum(1 for e in entries if e.project == project)
-        total_hours = sum(
-            (datetime.fromisoformat(e.end_time) - datetime.fromisoformat(e.start_time)).total_seconds() / 3600
-            for e in entries if e.project == project
-        )
+        count, total_hours = totals.get(project, (0, 0.0))
         print(f"   {project}: {count} tasks, {total_hours:.1f} hours")
     
     print(f"\nTotal: {len(entries)} tasks")
@@ -13,6 +13,11 @@ import yaml
 from datetime import datetime
 from pathlib import Path
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 # Add src to path (parent directory since we're in dev-env/)
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
@@ -31,7 +36,7 @@ def load_mockup_tasks():
         sys.exit(1)
     
     with open(worklog_file) as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=SafeLoader)
     
     entries = []
     for e in data['entries']:
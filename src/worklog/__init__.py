@@ -26,11 +26,24 @@ __version__ = "2.2.2"
 __author__ = "Trik16"
 __description__ = "Drudge CLI - A comprehensive work time tracking tool"
 
-from .config import WorkLogConfig
-from .models import TaskEntry, PausedTask, WorkLogData
-from .validators import WorkLogValidator
-from .managers import WorkLog, BackupManager, DailyFileManager
-from .cli import main
+from ._lazy import lazy_exports
+
+# Public names are resolved on first access so that running the CLI (which
+# imports this package) does not load every manager, YAML and Typer up front.
+_LAZY_EXPORTS = {
+    'WorkLog': '.managers',
+    'WorkLogConfig': '.config',
+    'TaskEntry': '.models',
+    'PausedTask': '.models',
+    'WorkLogData': '.models',
+    'WorkLogValidator': '.validators',
+    'BackupManager': '.managers',
+    'DailyFileManager': '.managers',
+    'main': '.cli',
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS, globals())
+
 
 __all__ = [
     'WorkLog',
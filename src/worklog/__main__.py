@@ -8,7 +8,7 @@ Or with the drudge command:
     drudge start "My Task"
 """
 
-from .cli import main
+from .cli.fast import main
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
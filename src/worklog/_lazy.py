@@ -0,0 +1,40 @@
+"""
+PEP 562 lazy exports shared by the package ``__init__`` modules.
+
+Keeps the public names importable from the package while deferring the
+submodule import until a name is first accessed.
+"""
+
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    package: str,
+    exports: Dict[str, str],
+    namespace: Dict[str, Any],
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build module-level ``__getattr__`` and ``__dir__`` for lazy exports.
+    
+    Args:
+        package: ``__name__`` of the package exposing the names
+        exports: Mapping of public name to relative submodule (e.g. ``'.config'``)
+        namespace: The package's ``globals()``; resolved names are cached here
+        
+    Returns:
+        Tuple of ``(__getattr__, __dir__)`` functions to assign in the package
+    """
+    def __getattr__(name: str) -> Any:
+        """Import a public name from its submodule on first access (PEP 562)."""
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(module_name, package), name)
+        namespace[name] = value
+        return value
+    
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(exports))
+    
+    return __getattr__, __dir__
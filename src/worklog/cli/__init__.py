@@ -3,8 +3,19 @@ CLI package for WorkLog application.
 
 This package contains all command-line interface components including
 Typer command definitions, argument parsing, and user interaction.
+The Typer application is imported on first access so that the argparse
+fast path in ``fast`` can run without loading Typer.
 """
 
-from .commands import app, main
+from typing import Any
 
-__all__ = ['app', 'main']
\ No newline at end of file
+
+def __getattr__(name: str) -> Any:
+    """Import the Typer app and entry point on first access (PEP 562)."""
+    if name in ('app', 'main'):
+        from . import commands
+        return getattr(commands, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ['app', 'main']
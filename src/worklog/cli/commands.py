@@ -5,18 +5,19 @@ This module contains all Typer CLI command definitions and integrates
 with the core WorkLog functionality through the managers package.
 """
 import logging
-from typing import Optional
-from pathlib import Path
+import re
+from typing import Optional, TYPE_CHECKING
 
 import typer
-from rich.console import Console
 
-from ..managers.worklog import WorkLog
-from ..config import WorkLogConfig
+from ..utils.console import console
+from .fast import setup_logging, sync_after_end
 from .. import __version__
 
-# Initialize Rich console and logger
-console = Console()
+if TYPE_CHECKING:
+    from ..managers.worklog import WorkLog
+
+# Initialize logger (the shared Rich console is created on first print)
 logger = logging.getLogger(__name__)
 
 # Create Typer application
@@ -29,21 +30,33 @@ app = typer.Typer(
     pretty_exceptions_show_locals=False
 )
 
+# Date targets for `clean` (YYYY-MM-DD)
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
 # Global WorkLog instance - initialized on first command
-_worklog_instance: Optional[WorkLog] = None
+_worklog_instance: Optional["WorkLog"] = None
 
 
-def get_worklog() -> WorkLog:
+def get_worklog() -> "WorkLog":
     """
     Get or create the global WorkLog instance.
     
+    The instance is reused across commands in the same process; its data is
+    only re-read when worklog.json has changed on disk since the last load.
+    The managers and YAML config are imported here rather than at module
+    level so that --help and completion never load them.
+    
     Returns:
         WorkLog: Configured WorkLog instance
     """
     global _worklog_instance
     if _worklog_instance is None:
+        from ..managers.worklog import WorkLog
+        from ..config import WorkLogConfig
         config = WorkLogConfig.load_from_yaml()
         _worklog_instance = WorkLog(config=config)
+    else:
+        _worklog_instance.reload_if_changed()
     return _worklog_instance
 
 
@@ -125,29 +138,7 @@ def end(
             raise typer.Exit(1)
     
     # Auto-sync if requested via --sync flag OR enabled in config
-    config = worklog.config
-    should_sync = sync or config.google_sheets.auto_sync
-    
-    if should_sync:
-        # Check if sync is properly configured
-        if not config.google_sheets.enabled:
-            console.print("⚠️  [yellow]Google Sheets sync is not enabled - skipping sync[/yellow]")
-            console.print("💡 Enable it in config.yaml: google_sheets.enabled = true", style="dim")
-        elif not config.sheet_document_id:
-            console.print("⚠️  [yellow]Google Sheets document ID not configured - skipping sync[/yellow]")
-            console.print("💡 Set it in config.yaml: sheet_document_id = 'your-sheet-id'", style="dim")
-        else:
-            try:
-                from ..sync.sheets import GoogleSheetsSync
-                
-                console.print("\n🔄 Syncing to Google Sheets...", style="dim")
-                sheets_sync = GoogleSheetsSync(config)
-                result = sheets_sync.sync_daily()
-                console.print(f"✅ Synced {result['count']} task(s) to Google Sheets", style="green")
-            except Exception as e:
-                console.print(f"❌ Sync failed: {e}", style="red")
-                logger.exception("Error during auto-sync")
-                console.print("💡 You can sync manually later with: drudge sync", style="dim")
+    sync_after_end(worklog, sync)
 
 
 @app.command()
@@ -265,7 +256,7 @@ def daily(
         else:
             try:
                 console.print("\n🔄 Syncing today's tasks to Google Sheets...", style="dim")
-                sheets_sync = GoogleSheetsSync(config)
+                sheets_sync = GoogleSheetsSync(config, worklog=worklog)
                 result = sheets_sync.sync_daily()
                 console.print(f"✅ Synced {result['count']} task(s) to Google Sheets", style="green")
             except Exception as e:
@@ -320,7 +311,7 @@ def sync(
     
     try:
         # Initialize Google Sheets sync
-        sheets_sync = GoogleSheetsSync(config)
+        sheets_sync = GoogleSheetsSync(config, worklog=worklog)
         
         # Determine sync mode
         if test:
@@ -398,11 +389,11 @@ def clean(
         console.print("❌ Please specify a date, task name, or use --all", style="red")
         raise typer.Exit(1)
     
-    # Check if target is a date (YYYY-MM-DD format)
-    import re
-    date_pattern = r'^\d{4}-\d{2}-\d{2}$'
+    # Check if target is a date (YYYY-MM-DD format); the shape check rejects
+    # most task names before the regex runs
+    is_date = len(target) == 10 and target[4] == '-' and target[7] == '-' and _DATE_RE.match(target)
     
-    if re.match(date_pattern, target):
+    if is_date:
         # Clean by date
         if date is not None:
             console.print("❌ Cannot use --date when target is already a date", style="red")
@@ -474,28 +465,6 @@ def version() -> None:
 # Error Handling and Main Entry
 # ============================================================================
 
-def setup_logging(verbose: bool = False) -> None:
-    """
-    Setup logging configuration for the CLI.
-    
-    Args:
-        verbose: Enable debug logging if True
-    """
-    # Ensure worklog directory exists
-    log_dir = Path.home() / '.worklog'
-    log_dir.mkdir(parents=True, exist_ok=True)
-    
-    level = logging.DEBUG if verbose else logging.INFO
-    logging.basicConfig(
-        level=level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_dir / 'worklog.log'),
-            logging.StreamHandler() if verbose else logging.NullHandler()
-        ]
-    )
-
-
 def main() -> None:
     """
     Main entry point for the CLI application.
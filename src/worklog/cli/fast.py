@@ -0,0 +1,209 @@
+"""
+Typer-free entry point for the most common WorkLog commands.
+
+Building the Typer/Click command tree costs far more than the work done
+by a quick ``drudge start`` or ``drudge end``. This module peeks at the
+subcommand and, for the hot ones, parses the handful of options with
+argparse and calls the WorkLog manager directly. Anything else (help,
+completion, unknown commands, arguments argparse rejects) falls through
+to the full Typer application so its output and errors are unchanged.
+"""
+import argparse
+import logging
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from ..utils.console import console
+
+if TYPE_CHECKING:
+    from ..managers.worklog import WorkLog
+
+logger = logging.getLogger(__name__)
+
+# Subcommands handled here; must stay in step with their Typer definitions
+FAST_COMMANDS = frozenset({'start', 'end', 'pause', 'resume', 'recent'})
+
+# Arguments that only the Typer application knows how to render
+_TYPER_ONLY_ARGS = frozenset({'--help', '-h', '--install-completion', '--show-completion'})
+
+
+class _FallBackToTyper(Exception):
+    """Raised when argparse cannot handle the command line."""
+
+
+class _FastParser(argparse.ArgumentParser):
+    """ArgumentParser that defers to Typer instead of printing usage errors."""
+
+    def error(self, message: str) -> None:
+        raise _FallBackToTyper(message)
+
+
+def _build_parser(command: str) -> argparse.ArgumentParser:
+    """
+    Build an argparse parser for a single fast subcommand.
+
+    Option names mirror the Typer definitions in commands.py.
+
+    Args:
+        command: One of FAST_COMMANDS
+
+    Returns:
+        argparse.ArgumentParser: Parser for the subcommand's arguments
+    """
+    parser = _FastParser(prog=f"drudge {command}", add_help=False, allow_abbrev=False)
+    if command == 'recent':
+        parser.add_argument('--limit', '-l', type=int, default=None)
+        return parser
+
+    # start/end take an optional task name, pause/resume require one
+    if command in ('start', 'end'):
+        parser.add_argument('task_name', nargs='?', default=None)
+    else:
+        parser.add_argument('task_name')
+    parser.add_argument('--time', '-t', default=None)
+
+    if command == 'start':
+        parser.add_argument('--project', '-P', default=None)
+        parser.add_argument('--force', '-f', action='store_true')
+        parser.add_argument('--parallel', '-p', action='store_true')
+    elif command == 'end':
+        parser.add_argument('--all', '-a', action='store_true')
+        parser.add_argument('--sync', '-s', action='store_true')
+    return parser
+
+
+def _load_worklog() -> "WorkLog":
+    """
+    Create a WorkLog from the user's configuration.
+
+    Returns:
+        WorkLog: Configured WorkLog instance
+    """
+    from ..config import WorkLogConfig
+    from ..managers.worklog import WorkLog
+    return WorkLog(config=WorkLogConfig.load_from_yaml())
+
+
+def sync_after_end(worklog: "WorkLog", sync: bool) -> None:
+    """
+    Sync completed tasks to Google Sheets after ``end`` if requested.
+
+    Runs when --sync was passed or auto_sync is enabled in the config,
+    and skips with a hint when Google Sheets is not configured.
+
+    Args:
+        worklog: WorkLog the tasks were just ended on; synced without reloading
+        sync: Whether --sync was passed on the command line
+    """
+    config = worklog.config
+    if not (sync or config.google_sheets.auto_sync):
+        return
+
+    # Check if sync is properly configured
+    if not config.google_sheets.enabled:
+        console.print("⚠️  [yellow]Google Sheets sync is not enabled - skipping sync[/yellow]")
+        console.print("💡 Enable it in config.yaml: google_sheets.enabled = true", style="dim")
+    elif not config.sheet_document_id:
+        console.print("⚠️  [yellow]Google Sheets document ID not configured - skipping sync[/yellow]")
+        console.print("💡 Set it in config.yaml: sheet_document_id = 'your-sheet-id'", style="dim")
+    else:
+        try:
+            from ..sync.sheets import GoogleSheetsSync
+
+            console.print("\n🔄 Syncing to Google Sheets...", style="dim")
+            sheets_sync = GoogleSheetsSync(config, worklog=worklog)
+            result = sheets_sync.sync_daily()
+            console.print(f"✅ Synced {result['count']} task(s) to Google Sheets", style="green")
+        except Exception as e:
+            console.print(f"❌ Sync failed: {e}", style="red")
+            logger.exception("Error during auto-sync")
+            console.print("💡 You can sync manually later with: drudge sync", style="dim")
+
+
+def run_fast_command(command: str, args: argparse.Namespace) -> int:
+    """
+    Execute a parsed fast subcommand.
+
+    Args:
+        command: One of FAST_COMMANDS
+        args: Arguments parsed by _build_parser(command)
+
+    Returns:
+        int: Process exit code
+    """
+    worklog = _load_worklog()
+
+    if command == 'start':
+        # Single-task mode auto-ends active tasks unless --parallel is given
+        success = worklog.start_task(args.task_name, custom_time=args.time, force=args.force or not args.parallel,
+                                     parallel=args.parallel, project=args.project)
+    elif command == 'end':
+        success = True
+        if args.all:
+            worklog.end_all_tasks(custom_time=args.time, include_paused=True)
+        elif args.task_name is None:
+            worklog.end_all_tasks(custom_time=args.time, include_paused=False)
+        else:
+            success = worklog.end_task(args.task_name, custom_time=args.time)
+        if success:
+            sync_after_end(worklog, args.sync)
+    elif command == 'pause':
+        success = worklog.pause_task(args.task_name, custom_time=args.time)
+    elif command == 'resume':
+        success = worklog.resume_task(args.task_name, custom_time=args.time)
+    else:
+        worklog.list_recent_tasks(limit=args.limit)
+        success = True
+
+    return 0 if success else 1
+
+
+def setup_logging(verbose: bool = False) -> None:
+    """
+    Setup logging configuration for the CLI.
+
+    Args:
+        verbose: Enable debug logging if True
+    """
+    # Ensure worklog directory exists
+    log_dir = Path.home() / '.worklog'
+    log_dir.mkdir(parents=True, exist_ok=True)
+
+    level = logging.DEBUG if verbose else logging.INFO
+    logging.basicConfig(
+        level=level,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(log_dir / 'worklog.log'),
+            logging.StreamHandler() if verbose else logging.NullHandler()
+        ]
+    )
+
+
+def main() -> None:
+    """
+    Console entry point: dispatch hot subcommands without loading Typer.
+    """
+    argv = sys.argv[1:]
+    if argv and argv[0] in FAST_COMMANDS and _TYPER_ONLY_ARGS.isdisjoint(argv):
+        command = argv[0]
+        try:
+            args = _build_parser(command).parse_args(argv[1:])
+        except _FallBackToTyper as e:
+            logger.debug(f"Falling back to Typer for {command}: {e}")
+        else:
+            try:
+                setup_logging()
+                exit_code = run_fast_command(command, args)
+            except KeyboardInterrupt:
+                console.print("\n👋 Goodbye!", style="yellow")
+                exit_code = 0
+            except Exception as e:
+                console.print(f"❌ Unexpected error: {e}", style="red")
+                logger.exception("Unexpected error in CLI")
+                exit_code = 1
+            sys.exit(exit_code)
+
+    from .commands import main as typer_main
+    typer_main()
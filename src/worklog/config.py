@@ -6,19 +6,110 @@ YAML configuration file support, and haunts integration settings.
 """
 
 import os
-import yaml
+import re
 import shutil
+from datetime import date
 from pathlib import Path
-from dataclasses import dataclass, field, asdict
-from typing import Dict, Optional, List
+from dataclasses import dataclass, field, fields, asdict
+from functools import lru_cache
+from typing import Any, Dict, Optional, List
 from importlib import resources
 
+from .utils.files import atomic_write_bytes
+from .utils.jsonio import json_dumps, json_loads
+
+
+# Sheet tab names; same as strftime("%B") under the default C locale
+_MONTH_NAMES = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
+_ISO_DATE_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+
+
+@lru_cache(maxsize=256)
+def _sheet_name_for_date(date_str: str) -> str:
+    """
+    Month name for a YYYY-MM-DD date, memoized per date string.
+    
+    Sync resolves a sheet for every task, but a worklog only spans a
+    handful of distinct dates, so each one is parsed only once.
+    
+    Args:
+        date_str: Date string in format YYYY-MM-DD
+        
+    Returns:
+        Month name (e.g., "October")
+        
+    Raises:
+        ValueError: If the string is not a valid YYYY-MM-DD date
+    """
+    # C-level ISO parsing instead of strptime; still rejects e.g. 2025-02-30
+    if not _ISO_DATE_RE.fullmatch(date_str):
+        raise ValueError(f"Invalid date: {date_str}")
+    return _MONTH_NAMES[date.fromisoformat(date_str).month - 1]
+
 
 def get_default_config_path() -> Path:
     """Get the default config file path."""
     return Path.home() / '.worklog' / 'config.yaml'
 
 
+def get_config_cache_path(config_path: Path) -> Path:
+    """Get the JSON sidecar that caches the parsed contents of a config file."""
+    return config_path.with_name(config_path.name + '.cache.json')
+
+
+def _parse_yaml_config(config_path: Path) -> Dict[str, Any]:
+    """
+    Read a config file, using the JSON sidecar cache when it is current.
+    
+    PyYAML is only imported (and the YAML only parsed) when the sidecar is
+    missing, unreadable or was written for a different version of the file.
+    The sidecar records the config's mtime and size to detect edits.
+    
+    Args:
+        config_path: Path to the YAML config file
+        
+    Returns:
+        Dict[str, Any]: Parsed top-level config mapping
+        
+    Raises:
+        FileNotFoundError: If the config file doesn't exist
+    """
+    stat = config_path.stat()
+    cache_path = get_config_cache_path(config_path)
+    try:
+        cached = json_loads(cache_path.read_bytes())
+        if cached['mtime_ns'] == stat.st_mtime_ns and cached['size'] == stat.st_size:
+            return cached['data']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass  # No usable cache - parse the YAML
+    
+    import yaml
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    with open(config_path, 'r') as f:
+        data = yaml.load(f, Loader=loader) or {}
+    
+    try:
+        payload = json_dumps({'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'data': data})
+        # YAML dates, int keys etc. would come back from JSON as other types;
+        # only cache data that a cache hit returns unchanged
+        if json_loads(payload)['data'] == data:
+            # Atomic so concurrent drudge processes never read a half-written cache
+            atomic_write_bytes(cache_path, payload)
+    except (OSError, TypeError, ValueError):
+        pass  # Read-only directory or non-JSON values - just skip caching
+    return data
+
+
+def _fields_dict(obj: Any) -> Dict[str, Any]:
+    """Map a dataclass instance's fields to their values, in declaration order."""
+    return {f.name: getattr(obj, f.name) for f in fields(obj)}
+
+
 def get_template_config() -> str:
     """
     Get the template config content from package data.
@@ -38,8 +129,10 @@ def get_template_config() -> str:
     except (FileNotFoundError, TypeError):
         # Fallback: try to find it relative to this file
         template_path = Path(__file__).parent / 'config.yaml.example'
-        if template_path.exists():
+        try:
             return template_path.read_text()
+        except FileNotFoundError:
+            pass
         
         # Last resort: generate from dataclass defaults
         # This ensures consistency with actual default values
@@ -47,6 +140,7 @@ def get_template_config() -> str:
         config_dict = asdict(default_config)
         config_dict.pop('worklog_dir', None)  # Remove internal override
         
+        import yaml
         return yaml.dump(config_dict, default_flow_style=False, sort_keys=False)
 
 
@@ -66,10 +160,12 @@ def ensure_config_exists(config_path: Optional[Path] = None) -> Path:
     # Ensure directory exists
     config_path.parent.mkdir(parents=True, exist_ok=True)
     
-    if not config_path.exists():
-        # Create from template
-        template_content = get_template_config()
-        config_path.write_text(template_content)
+    try:
+        # Exclusive create: an existing config is never overwritten
+        with open(config_path, 'x') as f:
+            f.write(get_template_config())
+    except FileExistsError:
+        pass
     
     return config_path
 
@@ -126,6 +222,7 @@ class WorkLogConfig:
         backup_enabled: Whether to create backups before destructive operations
         auto_save: Whether to automatically save after each operation
         max_backups: Maximum number of backup files to retain
+        pretty_json: Whether to indent worklog.json instead of writing it compact
         sheet_document_id: Google Sheets document ID (shared by drudge and haunts)
         timezone: Timezone for timestamps (from haunts or system default)
         projects: List of project names for categorization
@@ -141,6 +238,7 @@ class WorkLogConfig:
     backup_enabled: bool = True
     auto_save: bool = True
     max_backups: int = 5
+    pretty_json: bool = False
     sheet_document_id: str = ""  # Shared Google Sheets document ID
     timezone: str = ""  # From haunts.ini or system default
     projects: List[str] = field(default_factory=list)  # Project names only
@@ -163,16 +261,11 @@ class WorkLogConfig:
             config_path = get_default_config_path()
         
         # Auto-create config from template if it doesn't exist
-        if auto_create and not config_path.exists():
+        if auto_create:
             ensure_config_exists(config_path)
         
-        if not config_path.exists():
-            # Return default config if file still doesn't exist
-            return cls()
-        
         try:
-            with open(config_path, 'r') as f:
-                data = yaml.safe_load(f) or {}
+            data = _parse_yaml_config(config_path)
             
             # Handle nested google_sheets config
             google_sheets_data = data.pop('google_sheets', {})
@@ -187,6 +280,9 @@ class WorkLogConfig:
             
             # Create config with loaded data
             return cls(**data, google_sheets=google_sheets_config, haunts=haunts_config)
+        except FileNotFoundError:
+            # Return default config if file still doesn't exist
+            return cls()
         except Exception as e:
             # If there's an error loading, return defaults and log warning
             print(f"Warning: Could not load config from {config_path}: {e}")
@@ -205,15 +301,24 @@ class WorkLogConfig:
         # Ensure directory exists
         config_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Convert to dict and handle nested dataclasses
-        data = asdict(self)
+        # Shallow field-by-field dict; asdict() would deep-copy every value
+        data = _fields_dict(self)
+        data['projects'] = list(self.projects)
+        data['google_sheets'] = _fields_dict(self.google_sheets)
+        data['haunts'] = _fields_dict(self.haunts)
         
         # Remove None worklog_dir (internal testing override)
         if data['worklog_dir'] is None:
             data.pop('worklog_dir')
         
+        import yaml
+        # Prefer the libyaml-backed dumper; output is identical for config values
+        dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
         with open(config_path, 'w') as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(data, f, Dumper=dumper, default_flow_style=False, sort_keys=False)
+        
+        # The cache would be invalidated by the new mtime anyway; drop it eagerly
+        get_config_cache_path(config_path).unlink(missing_ok=True)
     
     def get_worklog_directory(self) -> Path:
         """Get the worklog directory path."""
@@ -244,7 +349,8 @@ class WorkLogConfig:
             
         Returns:
             Month name (e.g., "October", "November")
+            
+        Raises:
+            ValueError: If the string is not a valid YYYY-MM-DD date
         """
-        from datetime import datetime
-        dt = datetime.strptime(date, "%Y-%m-%d")
-        return dt.strftime("%B")  # Full month name
\ No newline at end of file
+        return _sheet_name_for_date(date)
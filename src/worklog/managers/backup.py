@@ -8,11 +8,11 @@ data operations and recovery.
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from datetime import datetime
-import json
 import logging
 
 from ..models import TaskEntry
 from ..config import WorkLogConfig
+from ..utils.jsonio import json_dumps
 
 logger = logging.getLogger(__name__)
 
@@ -79,16 +79,19 @@ class BackupManager:
                 backup_content.append("")
             
             # Add daily file content to backup
-            if daily_file and daily_file.exists():
-                backup_content.extend([
-                    "=== Daily File Content ===",
-                    ""
-                ])
+            if daily_file:
                 try:
-                    with open(daily_file, 'r', encoding='utf-8') as f:
-                        backup_content.extend(line.rstrip() for line in f)
+                    daily_lines = daily_file.read_bytes().decode('utf-8').splitlines()
+                except FileNotFoundError:
+                    daily_lines = None
                 except Exception as e:
-                    backup_content.append(f"Error reading daily file: {e}")
+                    daily_lines = [f"Error reading daily file: {e}"]
+                if daily_lines is not None:
+                    backup_content.extend([
+                        "=== Daily File Content ===",
+                        ""
+                    ])
+                    backup_content.extend(line.rstrip() for line in daily_lines)
             
             # Write backup file
             with open(backup_file, 'w', encoding='utf-8') as f:
@@ -127,8 +130,7 @@ class BackupManager:
         backup_file = backup_dir / f"{backup_name}.json"
         
         try:
-            with open(backup_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+            backup_file.write_bytes(json_dumps(data, pretty=True, default=str))
             
             logger.info(f"Data backup created: {backup_file}")
             return backup_file
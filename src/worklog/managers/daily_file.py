@@ -6,12 +6,13 @@ including formatting entries and maintaining chronological order.
 """
 
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Union
 from datetime import datetime, timedelta
-from functools import lru_cache
 import logging
 
 from ..config import WorkLogConfig
+from ..utils.files import atomic_write_text
+from ..utils.timestamps import parse_iso, format_datetime, format_display_time, parse_duration
 
 logger = logging.getLogger(__name__)
 
@@ -33,27 +34,11 @@ class DailyFileManager:
         """
         self.config = config or WorkLogConfig()
     
-    @lru_cache(maxsize=128)
-    def _format_display_time(self, timestamp: str) -> str:
-        """
-        Format ISO timestamp for human-readable display.
-        
-        Cached method for efficient timestamp formatting in daily logs.
-        
-        Args:
-            timestamp: ISO format timestamp string
-            
-        Returns:
-            str: Formatted timestamp for display
-        """
-        dt = datetime.fromisoformat(timestamp)
-        return dt.strftime(self.config.display_time_format)
-    
     def format_entry(
         self, 
         task_name: str, 
         action: str, 
-        timestamp: str, 
+        timestamp: Union[str, datetime], 
         duration: Optional[str] = None
     ) -> str:
         """
@@ -65,28 +50,33 @@ class DailyFileManager:
         Args:
             task_name: Name of the task
             action: Type of action ('start', 'end', 'pause', 'resume', 'completed')
-            timestamp: ISO timestamp of the action
+            timestamp: ISO timestamp of the action, or the already-parsed datetime
             duration: Optional duration string for completed tasks
             
         Returns:
             str: Formatted entry string
         """
-        display_time = self._format_display_time(timestamp)
+        display_format = self.config.display_time_format
         display_name = "[ANONYMOUS WORK]" if task_name == "__ANONYMOUS_WORK__" else task_name
         
+        if action == 'completed' and duration:
+            # For retroactive entries, use start time from duration calculation
+            end_dt = timestamp if isinstance(timestamp, datetime) else parse_iso(timestamp)
+            start_time = end_dt - timedelta(seconds=parse_duration(duration))
+            # Format the computed datetime directly rather than via an ISO round-trip
+            start_display = format_datetime(start_time, display_format)
+            return f"{start_display} {display_name} ({duration})"
+        
+        if isinstance(timestamp, datetime):
+            display_time = format_datetime(timestamp, display_format)
+        else:
+            display_time = format_display_time(timestamp, display_format)
+        
         # Format the log entry based on action type
         if action == 'start':
             return f"{display_time} {display_name} [ACTIVE]"
         elif action == 'end' and duration:
             return f"{display_time} {display_name} ({duration})"
-        elif action == 'completed' and duration:
-            # For retroactive entries, use start time from duration calculation
-            start_dt = datetime.fromisoformat(timestamp)
-            duration_parts = duration.split(':')
-            hours, minutes, seconds = int(duration_parts[0]), int(duration_parts[1]), int(duration_parts[2])
-            start_time = start_dt - timedelta(hours=hours, minutes=minutes, seconds=seconds)
-            start_display = self._format_display_time(start_time.isoformat())
-            return f"{start_display} {display_name} ({duration})"
         elif action == 'pause':
             return f"{display_time} {display_name} [PAUSED]"
         elif action == 'resume':
@@ -100,51 +90,118 @@ class DailyFileManager:
         
         Reads existing entries, adds the new entry, sorts by timestamp,
         and rewrites the file in chronological order. Removes duplicates
-        for the same task when adding completion entries.
+        for the same task when adding completion entries. Status lines that
+        already sort last are appended without a rewrite.
         
         Args:
             daily_file: Path to the daily log file
             new_entry: Formatted entry string to add
         """
+        try:
+            if self._append_in_order(daily_file, new_entry):
+                return
+        except (OSError, UnicodeDecodeError) as e:
+            logger.debug(f"Appending to {daily_file} failed, rewriting: {e}")
+        self.add_entries_chronologically(daily_file, [new_entry])
+    
+    @staticmethod
+    def _append_in_order(daily_file: Path, new_entry: str) -> bool:
+        """
+        Append a status line when it already belongs at the end of the file.
+        
+        Start, pause and resume lines never remove other lines, so when the
+        new line sorts at or after the current last line the sorted rewrite
+        would only append it. Only the tail of the file is read to check.
+        
+        Args:
+            daily_file: Path to the daily log file
+            new_entry: Formatted entry string to add
+            
+        Returns:
+            bool: True if the line was appended, False if a full rewrite is needed
+        """
+        new_entry_parts = new_entry.split(' ', 2)
+        if len(new_entry_parts) >= 3 and '(' in new_entry_parts[2] and ')' in new_entry_parts[2]:
+            # Completion entries replace the task's earlier lines
+            return False
+        
+        with open(daily_file, 'a+b') as f:
+            size = f.seek(0, 2)
+            if size:
+                tail_start = max(0, size - 4096)
+                f.seek(tail_start)
+                tail = f.read()
+                # Need a newline-terminated last line that fits in the tail
+                if not tail.endswith(b'\n'):
+                    return False
+                newline = tail.rfind(b'\n', 0, len(tail) - 1)
+                if newline < 0 and tail_start > 0:
+                    return False
+                last_line = tail[newline + 1:-1].decode('utf-8')
+                if not last_line.strip() or last_line[:19] > new_entry[:19]:
+                    return False
+            f.write(f"{new_entry}\n".encode('utf-8'))
+        
+        logger.debug(f"Appended entry to {daily_file}")
+        return True
+    
+    def add_entries_chronologically(
+        self,
+        daily_file: Path,
+        new_entries: List[str],
+        replace_existing: bool = False
+    ) -> None:
+        """
+        Add several entries to daily file with a single read and write.
+        
+        Applies the same duplicate handling as add_entry_chronologically to
+        each new entry in order, then sorts and atomically rewrites the file once.
+        
+        Args:
+            daily_file: Path to the daily log file
+            new_entries: Formatted entry strings to add, in the order they occurred
+            replace_existing: Discard the file's current entries instead of merging
+        """
         entries = []
         
         try:
-            # Read existing entries if file exists
-            if daily_file.exists():
-                with open(daily_file, 'r', encoding='utf-8') as f:
-                    entries = f.read().strip().split('\n')
+            # Read existing entries; a missing file simply means no entries yet
+            if not replace_existing:
+                try:
+                    entries = daily_file.read_text(encoding='utf-8').strip().split('\n')
                     entries = [entry for entry in entries if entry.strip()]
+                except FileNotFoundError:
+                    pass
             
-            # Extract task name from new entry for duplicate detection
-            # Format: "YYYY-MM-DD HH:MM:SS TaskName [STATUS]" or "YYYY-MM-DD HH:MM:SS TaskName (duration)"
-            new_entry_parts = new_entry.split(' ', 2)
-            if len(new_entry_parts) >= 3:
-                new_task_identifier = new_entry_parts[2]  # Everything after timestamp
+            for new_entry in new_entries:
+                # Extract task name from new entry for duplicate detection
+                # Format: "YYYY-MM-DD HH:MM:SS TaskName [STATUS]" or "YYYY-MM-DD HH:MM:SS TaskName (duration)"
+                new_entry_parts = new_entry.split(' ', 2)
+                if len(new_entry_parts) >= 3:
+                    new_task_identifier = new_entry_parts[2]  # Everything after timestamp
+                    
+                    # If this is a completion entry (contains duration in parentheses), 
+                    # remove any existing entries for the same task
+                    if '(' in new_task_identifier and ')' in new_task_identifier:
+                        task_name = new_task_identifier.split('(')[0].strip()
+                        # Remove existing entries for this task (both [ACTIVE], [PAUSED], etc.)
+                        entries = [entry for entry in entries if not (
+                            len(entry.split(' ', 2)) >= 3 and
+                            entry.split(' ', 2)[2].startswith(task_name + ' ')
+                        )]
                 
-                # If this is a completion entry (contains duration in parentheses), 
-                # remove any existing entries for the same task
-                if '(' in new_task_identifier and ')' in new_task_identifier:
-                    task_name = new_task_identifier.split('(')[0].strip()
-                    # Remove existing entries for this task (both [ACTIVE], [PAUSED], etc.)
-                    entries = [entry for entry in entries if not (
-                        len(entry.split(' ', 2)) >= 3 and
-                        entry.split(' ', 2)[2].startswith(task_name + ' ')
-                    )]
-            
-            # Add new entry
-            entries.append(new_entry)
+                # Add new entry
+                entries.append(new_entry)
             
             # Sort entries chronologically by timestamp (first 19 characters: YYYY-MM-DD HH:MM:SS)
             entries.sort(key=lambda x: x[:19] if len(x) >= 19 else x)
             
-            # Write sorted entries back to file
+            # Write sorted entries back to file in one atomic replace
             daily_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(daily_file, 'w', encoding='utf-8') as f:
-                for entry in entries:
-                    f.write(f"{entry}\n")
+            atomic_write_text(daily_file, ''.join(f"{entry}\n" for entry in entries))
                     
-            logger.debug(f"Added entry to {daily_file}: {new_entry}")
+            logger.debug(f"Added {len(new_entries)} entries to {daily_file}")
             
         except Exception as e:
             logger.error(f"Failed to add entry to daily file {daily_file}: {e}")
-            raise IOError(f"Daily file operation failed: {e}")
\ No newline at end of file
+            raise IOError(f"Daily file operation failed: {e}")
@@ -6,25 +6,27 @@ time tracking functionality and integrates with other components.
 """
 
 import json
-from datetime import datetime, timedelta
+import os
+import time
+import uuid
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Optional, List, Any, Union
+from typing import Dict, Optional, List, Any, Union, Tuple
 from contextlib import contextmanager
-from functools import lru_cache
+from itertools import islice
 import logging
 
-from rich.console import Console
-from rich.table import Table
-
 from ..models import TaskEntry, PausedTask, WorkLogData
 from ..config import WorkLogConfig
 from ..validators import WorkLogValidator
 from ..utils.decorators import requires_data, auto_save
+from ..utils.console import console
+from ..utils.files import atomic_write_bytes
+from ..utils.jsonio import json_dumps, json_dumps_line, json_loads
+from ..utils.timestamps import parse_iso, format_display_time, format_duration
 from .backup import BackupManager
 from .daily_file import DailyFileManager
 
-# Initialize rich console for beautiful output
-console = Console()
 logger = logging.getLogger(__name__)
 
 
@@ -40,6 +42,9 @@ class WorkLog:
     """
     
     ANONYMOUS_TASK_NAME = "__ANONYMOUS_WORK__"
+    ANONYMOUS_DISPLAY_NAME = "[ANONYMOUS WORK]"
+    # Journal size after which the next save rewrites the full snapshot
+    JOURNAL_COMPACT_BYTES = 256 * 1024
     
     def __init__(self, config: Optional[WorkLogConfig] = None) -> None:
         """
@@ -63,7 +68,32 @@ class WorkLog:
         else:
             self.worklog_dir = Path.home() / self.config.worklog_dir_name
         self.worklog_file = self.worklog_dir / 'worklog.json'
+        # Append-only log of changes made since worklog.json was last written
+        self.journal_file = self.worklog_dir / 'worklog.journal.jsonl'
         self._data: Optional[WorkLogData] = None
+        # Journal bookkeeping, see _save_data()
+        self._journal_id: Optional[str] = None
+        self._journal_size = 0
+        self._persisted_entries: Optional[List[TaskEntry]] = None
+        self._persisted_count = 0
+        self._persisted_last: Optional[TaskEntry] = None
+        self._persisted_state: Optional[dict] = None
+        # Snapshot/journal fingerprint when data was last loaded or saved
+        self._data_signature: Optional[tuple] = None
+        # Pending daily-file lines while inside _batched_updates()
+        self._daily_buffer: Optional[List[str]] = None
+        # True while auto_save is deferred to the end of _batched_updates()
+        self._save_deferred = False
+        # (expires_at, date_str, daily_file) for today, refreshed at local midnight
+        self._today_cache: Optional[Tuple[float, str, Path]] = None
+        # Daily file paths for explicit dates, see _get_daily_file_path()
+        self._daily_path_cache: Dict[str, Path] = {}
+        # Completed entries grouped by task and by start date, see _entry_index()
+        self._task_index: Optional[Dict[str, List[TaskEntry]]] = None
+        self._date_index: Optional[Dict[str, List[TaskEntry]]] = None
+        # Entries list the indexes were built from (compared by identity) and its length
+        self._indexed_entries: Optional[List[TaskEntry]] = None
+        self._indexed_count = 0
         
         self._ensure_directory()
         self._migrate_old_file()
@@ -82,6 +112,25 @@ class WorkLog:
             self._data = self._load_data()
         return self._data
     
+    def reload_if_changed(self) -> bool:
+        """
+        Drop cached data if worklog.json or its journal was modified by someone else.
+        
+        Compares the files' current mtime/size with the ones recorded on the
+        last load/save; on mismatch the data is reloaded lazily on next access.
+        
+        Returns:
+            bool: True if cached data was discarded, False otherwise
+        """
+        if self._data is None:
+            return False
+        if self._disk_signature() == self._data_signature:
+            return False
+        logger.debug(f"{self.worklog_file} changed on disk, reloading")
+        self._data = None
+        self._drop_entry_index()
+        return True
+    
     def _ensure_directory(self) -> None:
         """
         Create the worklog directory structure if it doesn't exist.
@@ -120,22 +169,29 @@ class WorkLog:
         historical data and maintaining backward compatibility.
         """
         old_file = Path.home() / '.worklog.json'
-        if old_file.exists() and not self.worklog_file.exists():
-            try:
-                with open(old_file, 'r') as f:
-                    data = f.read()
-                with open(self.worklog_file, 'w') as f:
-                    f.write(data)
-                console.print(f"✅ Migrated worklog data to {self.worklog_file}")
-                
-                # Backup and remove old file
-                backup_file = Path.home() / '.worklog.json.backup'
-                old_file.rename(backup_file)
-                console.print(f"📦 Backup created at {backup_file}")
-                
-            except Exception as e:
-                logger.error(f"Migration failed: {e}")
-                console.print(f"⚠️ Migration failed: {e}", style="yellow")
+        try:
+            # Open both files directly: a missing legacy file or an existing
+            # worklog.json (exclusive create) means there is nothing to migrate
+            with open(old_file, 'rb') as src, open(self.worklog_file, 'xb') as dst:
+                dst.write(src.read())
+        except (FileNotFoundError, FileExistsError):
+            return
+        except Exception as e:
+            logger.error(f"Migration failed: {e}")
+            console.print(f"⚠️ Migration failed: {e}", style="yellow")
+            return
+        
+        try:
+            console.print(f"✅ Migrated worklog data to {self.worklog_file}")
+            
+            # Backup and remove old file
+            backup_file = Path.home() / '.worklog.json.backup'
+            old_file.rename(backup_file)
+            console.print(f"📦 Backup created at {backup_file}")
+            
+        except Exception as e:
+            logger.error(f"Migration failed: {e}")
+            console.print(f"⚠️ Migration failed: {e}", style="yellow")
     
     @contextmanager
     def _file_operation(self, file_path: Path, mode: str = 'r'):
@@ -154,7 +210,7 @@ class WorkLog:
             ...     f.write(content)
         """
         try:
-            with open(file_path, mode, encoding='utf-8') as f:
+            with open(file_path, mode, encoding=None if 'b' in mode else 'utf-8') as f:
                 yield f
         except FileNotFoundError:
             if 'r' in mode:
@@ -166,11 +222,12 @@ class WorkLog:
     
     def _load_data(self) -> WorkLogData:
         """
-        Load worklog data from JSON file with error handling and validation.
+        Load worklog data from the JSON snapshot and replay the journal.
         
         Loads the complete worklog state from the JSON database, handling
         legacy formats and providing sensible defaults for missing fields.
-        Performs data validation and structure migration as needed.
+        Changes appended to the journal since the last snapshot are then
+        replayed on top of it.
         
         Returns:
             WorkLogData: Complete worklog state with all tasks and sessions
@@ -179,33 +236,22 @@ class WorkLog:
             json.JSONDecodeError: If JSON file is corrupted
             FileNotFoundError: If worklog file doesn't exist (creates new)
         """
-        if not self.worklog_file.exists():
-            console.print("📝 Creating new worklog database", style="green")
-            return WorkLogData()
-        
+        # Whatever gets loaded is a new entries list; never reuse an old index
+        self._drop_entry_index()
         try:
-            with self._file_operation(self.worklog_file) as f:
-                raw_data = json.load(f)
+            # Slurp and parse in one go; a missing file means a new database
+            raw_data = json_loads(self.worklog_file.read_bytes())
             
             # Convert raw dict to structured data with validation
             # Handle both old format (without project) and new format (with project)
-            entries = []
-            for entry in raw_data.get('entries', []):
-                if isinstance(entry, dict):
-                    # Filter out any fields that TaskEntry doesn't support
-                    # This provides forward/backward compatibility
-                    valid_fields = {'task', 'start_time', 'end_time', 'duration', 'project'}
-                    filtered_entry = {k: v for k, v in entry.items() if k in valid_fields}
-                    entries.append(TaskEntry(**filtered_entry))
-                else:
-                    entries.append(TaskEntry(*entry))
+            entries = [self._entry_from_raw(entry) for entry in raw_data.get('entries', [])]
             
             paused_tasks = [
                 PausedTask(**task) if isinstance(task, dict) else PausedTask(*task)
                 for task in raw_data.get('paused_tasks', [])
             ]
             
-            return WorkLogData(
+            data = WorkLogData(
                 entries=entries,
                 active_tasks=raw_data.get('active_tasks', {}),
                 paused_tasks=paused_tasks,
@@ -213,6 +259,17 @@ class WorkLog:
                 active_task_projects=raw_data.get('active_task_projects', {})
             )
             
+            self._journal_id = raw_data.get('journal_id')
+            self._replay_journal(data)
+            self._mark_persisted(data)
+            return data
+            
+        except FileNotFoundError:
+            console.print("📝 Creating new worklog database", style="green")
+            data = WorkLogData()
+            self._journal_id = None
+            self._mark_persisted(data)
+            return data
         except json.JSONDecodeError as e:
             console.print(f"❌ Corrupted worklog file: {e}", style="red")
             console.print("🔄 Creating backup and starting fresh", style="yellow")
@@ -222,11 +279,17 @@ class WorkLog:
             try:
                 self.worklog_file.rename(backup_file)
                 console.print(f"💾 Corrupted file saved as: {backup_file}", style="dim")
+                # The journal only makes sense on top of that snapshot; keep it with it
+                if self.journal_file.exists():
+                    self.journal_file.rename(self.journal_file.with_suffix('.jsonl.corrupted'))
             except OSError as backup_error:
                 console.print(f"⚠️  Could not backup corrupted file: {backup_error}", style="yellow")
             
             logger.warning(f"JSON corruption in {self.worklog_file}: {e}")
-            return WorkLogData()
+            data = WorkLogData()
+            self._journal_id = None
+            self._mark_persisted(data)
+            return data
         except Exception as e:
             console.print(
                 f"❌ Unexpected error loading worklog data: {e}\n"
@@ -236,13 +299,195 @@ class WorkLog:
             logger.error(f"Unexpected error loading data: {e}")
             raise
     
+    @staticmethod
+    def _entry_from_raw(entry: Any) -> TaskEntry:
+        """
+        Build a TaskEntry from its stored JSON form.
+        
+        Args:
+            entry: Stored entry, either a dict or a legacy positional list
+            
+        Returns:
+            TaskEntry: Reconstructed entry
+        """
+        if isinstance(entry, dict):
+            # Filter out any fields that TaskEntry doesn't support
+            # This provides forward/backward compatibility
+            valid_fields = {'task', 'start_time', 'end_time', 'duration', 'project', 'duration_seconds'}
+            return TaskEntry(**{k: v for k, v in entry.items() if k in valid_fields})
+        return TaskEntry(*entry)
+    
+    def _replay_journal(self, data: WorkLogData) -> None:
+        """
+        Apply journal records written since the last snapshot to data.
+        
+        The journal is ignored if it belongs to another snapshot (e.g. the
+        process died between writing a snapshot and removing the old journal),
+        and a torn trailing record forces a fresh snapshot on the next save.
+        
+        Args:
+            data: Snapshot data to update in place
+        """
+        self._journal_size = 0
+        try:
+            raw = self.journal_file.read_bytes()
+        except FileNotFoundError:
+            return
+        
+        lines = raw.splitlines()
+        try:
+            header = json_loads(lines[0]) if lines else {}
+        except json.JSONDecodeError:
+            header = {}
+        if self._journal_id is None or header.get('journal_id') != self._journal_id:
+            logger.warning(f"Ignoring journal not matching snapshot: {self.journal_file}")
+            self._journal_id = None  # Rewrite snapshot and drop stale journal on next save
+            return
+        
+        def apply_entry(record):
+            data.entries.append(self._entry_from_raw(record['entry']))
+        
+        def apply_state(record):
+            data.active_tasks = record['active_tasks']
+            data.paused_tasks = [PausedTask(**task) for task in record['paused_tasks']]
+            data.recent_tasks = record['recent_tasks']
+            data.active_task_projects = record['active_task_projects']
+        
+        handlers = {'entry': apply_entry, 'state': apply_state}
+        replayed_entries = False
+        for line in lines[1:]:
+            try:
+                record = json_loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping unreadable journal record in {self.journal_file}")
+                continue
+            handler = handlers.get(record.get('op'))
+            if handler:
+                handler(record)
+                replayed_entries = replayed_entries or record['op'] == 'entry'
+        
+        if replayed_entries:
+            data.entries.sort(key=lambda entry: entry.start_time)
+        
+        if raw.endswith(b'\n'):
+            self._journal_size = len(raw)
+        else:
+            # Torn write from an interrupted append: compact rather than append after it
+            self._journal_id = None
+    
+    def _state_dict(self, data: WorkLogData) -> dict:
+        """
+        Build the JSON form of the small, frequently rewritten session state.
+        
+        Args:
+            data: Worklog data to serialize
+            
+        Returns:
+            dict: Active, paused and recent task state
+        """
+        return {
+            'active_tasks': dict(data.active_tasks),
+            'paused_tasks': [task.__dict__.copy() for task in data.paused_tasks],
+            'recent_tasks': list(data.recent_tasks),
+            'active_task_projects': dict(data.active_task_projects)
+        }
+    
+    def _mark_persisted(self, data: WorkLogData) -> None:
+        """
+        Record what is on disk so the next save only appends the difference.
+        
+        Args:
+            data: Worklog data that now matches the files on disk
+        """
+        self._persisted_entries = data.entries
+        self._persisted_count = len(data.entries)
+        self._persisted_last = data.entries[-1] if data.entries else None
+        self._persisted_state = self._state_dict(data)
+        self._data_signature = self._disk_signature()
+    
+    def _entries_only_appended(self, entries: List[TaskEntry]) -> bool:
+        """
+        Check that entries have at most grown at the end since the last save.
+        
+        Removing an entry from the same list shifts or replaces the one at
+        the old last position, so checking that single slot catches removals
+        even when new entries bring the length back up. Edits to an entry's
+        fields cannot be seen here; see _mark_entries_rewritten().
+        
+        Args:
+            entries: Current entries list
+            
+        Returns:
+            bool: True if the changes can be journaled as appended entries
+        """
+        count = self._persisted_count
+        return (
+            entries is self._persisted_entries
+            and len(entries) >= count
+            and (count == 0 or entries[count - 1] is self._persisted_last)
+        )
+    
+    def _mark_entries_rewritten(self) -> None:
+        """
+        Force the next save to write a full snapshot.
+        
+        The journal can only record appended entries. Call this after
+        editing or removing entries in place so the change reaches
+        worklog.json instead of being silently dropped.
+        """
+        self._persisted_entries = None
+        self._drop_entry_index()
+    
+    def _has_unsaved_changes(self) -> bool:
+        """
+        Check whether the in-memory data differs from what was last persisted.
+        
+        Entries are compared by list identity, length and the last persisted
+        entry (see _entries_only_appended()); the small session state is
+        compared by value.
+        
+        Returns:
+            bool: True if a save would write anything
+        """
+        if self._data is None:
+            return False
+        data = self._data
+        return (
+            not self._entries_only_appended(data.entries)
+            or len(data.entries) != self._persisted_count
+            or self._state_dict(data) != self._persisted_state
+        )
+    
+    def _disk_signature(self) -> Tuple[Optional[int], Optional[Tuple[int, int]]]:
+        """
+        Get a cheap fingerprint of the snapshot and journal files.
+        
+        Returns:
+            Tuple: Snapshot mtime (ns) and journal (mtime ns, size), None where missing
+        """
+        try:
+            snapshot = self.worklog_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            snapshot = None
+        try:
+            stat = self.journal_file.stat()
+            journal = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            journal = None
+        return snapshot, journal
+    
     def _save_data(self) -> None:
         """
-        Save worklog data to JSON file with atomic writes and error handling.
+        Persist worklog data by appending to the journal or writing a snapshot.
         
-        Performs atomic write operation to prevent data corruption during
-        save operations. Converts dataclass objects to JSON-serializable
-        format while preserving all structure and metadata.
+        Nothing is written when the data has not changed since the last
+        load/save. When the only changes are newly appended entries and
+        session state, they are appended to the journal as a few JSON
+        lines. Otherwise (entries removed or edited, first save, journal
+        over JOURNAL_COMPACT_BYTES) the full state is written to worklog.json
+        atomically and the journal is discarded. Between snapshots
+        worklog.json on its own is behind, so backups and sync must work
+        from the replayed state in self.data rather than the file.
         
         Automatically sorts entries chronologically by start_time to maintain
         proper time sequence in both JSON database and daily files.
@@ -251,32 +496,98 @@ class WorkLog:
             IOError: If unable to write to disk
             TypeError, ValueError: If data cannot be serialized to JSON
         """
+        # No-op commands (ending an inactive task, listing...) write nothing
+        if not self._has_unsaved_changes():
+            logger.debug("No changes to save")
+            return
+        
+        entries = self.data.entries
+        # Entries appended since the last save; None means a full snapshot is needed
+        appended = None
+        if (self._journal_id is not None
+                and self._entries_only_appended(entries)
+                and self._journal_size < self.JOURNAL_COMPACT_BYTES):
+            appended = entries[self._persisted_count:]
+        
         # Sort entries chronologically by start_time before saving (ISO strings sort correctly)
-        self.data.entries.sort(key=lambda entry: entry.start_time if isinstance(entry.start_time, str) else entry.start_time.isoformat())
+        entries.sort(key=lambda entry: entry.start_time if isinstance(entry.start_time, str) else entry.start_time.isoformat())
+        # Sorting may reorder entries within the index buckets
+        self._drop_entry_index()
+        
+        state = self._state_dict(self.data)
+        if appended is None:
+            self._write_snapshot(state)
+        else:
+            self._append_journal(appended, state)
+        self._mark_persisted(self.data)
+    
+    def _append_journal(self, appended: List[TaskEntry], state: dict) -> None:
+        """
+        Append new entries and changed session state to the journal.
+        
+        Args:
+            appended: Entries added since the last save
+            state: Current session state from _state_dict()
+        """
+        records = [{'op': 'entry', 'entry': entry.to_dict()} for entry in appended]
+        if state != self._persisted_state:
+            records.append({'op': 'state', **state})
+        if not records:
+            return
+        if self._journal_size == 0:
+            records.insert(0, {'op': 'header', 'journal_id': self._journal_id})
+        
+        try:
+            payload = b''.join(json_dumps_line(record) for record in records)
+            with self._file_operation(self.journal_file, 'ab') as f:
+                f.write(payload)
+            self._journal_size += len(payload)
+            logger.debug(f"Appended {len(records)} records to {self.journal_file}")
+        except (TypeError, ValueError) as e:
+            console.print(f"❌ Failed to serialize worklog data: {e}", style="red")
+            logger.error(f"JSON encoding error: {e}")
+            raise
+        except (IOError, OSError) as e:
+            console.print(
+                f"❌ Failed to save worklog data: {e}\n"
+                "💡 Check available disk space and file permissions.",
+                style="red"
+            )
+            logger.error(f"IO error saving data: {e}")
+            raise
+    
+    def _write_snapshot(self, state: dict) -> None:
+        """
+        Write the full worklog state to worklog.json and reset the journal.
+        
+        Performs atomic write operation to prevent data corruption during
+        save operations. The snapshot gets a fresh journal id so a leftover
+        journal from before the snapshot is never replayed twice.
+        
+        Args:
+            state: Current session state from _state_dict()
+        """
+        journal_id = uuid.uuid4().hex
         
         # Convert dataclasses to dictionaries for JSON serialization
         data_dict = {
-            'entries': [entry.__dict__ for entry in self.data.entries],
-            'active_tasks': self.data.active_tasks,
-            'paused_tasks': [task.__dict__ for task in self.data.paused_tasks],
-            'recent_tasks': self.data.recent_tasks,
-            'active_task_projects': self.data.active_task_projects
+            'entries': [entry.to_dict() for entry in self.data.entries],
+            **state,
+            'journal_id': journal_id
         }
         
-        # Atomic write: write to temp file then rename
-        temp_file = self.worklog_file.with_suffix('.tmp')
         try:
-            with self._file_operation(temp_file, 'w') as f:
-                json.dump(data_dict, f, indent=2, ensure_ascii=False)
-            temp_file.replace(self.worklog_file)
+            # Atomic write: write to temp file then rename
+            atomic_write_bytes(self.worklog_file, json_dumps(data_dict, pretty=self.config.pretty_json))
+            self.journal_file.unlink(missing_ok=True)
+            self._journal_id = journal_id
+            self._journal_size = 0
             logger.debug(f"Data saved successfully to {self.worklog_file}")
         except (TypeError, ValueError) as e:
             # TypeError: Object not JSON serializable
             # ValueError: Circular reference or other JSON encoding issues
             console.print(f"❌ Failed to serialize worklog data: {e}", style="red")
             logger.error(f"JSON encoding error: {e}")
-            if temp_file.exists():
-                temp_file.unlink()
             raise
         except (IOError, OSError) as e:
             console.print(
@@ -285,16 +596,97 @@ class WorkLog:
                 style="red"
             )
             logger.error(f"IO error saving data: {e}")
-            if temp_file.exists():
-                temp_file.unlink()
             raise
         except Exception as e:
             console.print(f"❌ Unexpected error saving data: {e}", style="red")
             logger.error(f"Unexpected error saving data: {e}")
-            if temp_file.exists():
-                temp_file.unlink()
             raise
     
+    # ============================================================================
+    # Entry Index
+    # ============================================================================
+    
+    def _ensure_entry_index(self) -> None:
+        """
+        Build the task and date indexes over completed entries if stale.
+        
+        The indexes are built on first use and reused for as long as the
+        entries list is the same object with the same length; replacing the
+        list (cleaning, reloading) or growing it outside _index_entry()
+        triggers a rebuild.
+        """
+        entries = self.data.entries
+        if self._index_is_current(entries):
+            return
+        by_task: Dict[str, List[TaskEntry]] = {}
+        by_date: Dict[str, List[TaskEntry]] = {}
+        for entry in entries:
+            by_task.setdefault(entry.task, []).append(entry)
+            by_date.setdefault(entry.date_str, []).append(entry)
+        self._task_index, self._date_index = by_task, by_date
+        self._indexed_entries, self._indexed_count = entries, len(entries)
+    
+    def _index_is_current(self, entries: List[TaskEntry]) -> bool:
+        """
+        Check whether the indexes were built from this exact entries list.
+        
+        The list itself is kept and compared by identity rather than by id(),
+        which a new list can reuse once the indexed one has been freed.
+        
+        Args:
+            entries: Current entries list
+            
+        Returns:
+            bool: True if the indexes can be used as-is
+        """
+        return entries is self._indexed_entries and len(entries) == self._indexed_count
+    
+    def _drop_entry_index(self) -> None:
+        """Discard the task and date indexes so the next lookup rebuilds them."""
+        self._task_index = self._date_index = None
+        self._indexed_entries, self._indexed_count = None, 0
+    
+    def _entries_for_task(self, task_name: str) -> List[TaskEntry]:
+        """
+        Get completed entries for a task without scanning the whole history.
+        
+        Args:
+            task_name: Name of the task to look up
+            
+        Returns:
+            List[TaskEntry]: Entries for the task, in insertion order
+        """
+        self._ensure_entry_index()
+        return self._task_index.get(task_name, [])
+    
+    def _entries_for_date(self, date_str: str) -> List[TaskEntry]:
+        """
+        Get completed entries started on a date without scanning the whole history.
+        
+        Args:
+            date_str: Date in YYYY-MM-DD format
+            
+        Returns:
+            List[TaskEntry]: Entries started on the date, in insertion order
+        """
+        self._ensure_entry_index()
+        return self._date_index.get(date_str, [])
+    
+    def _index_entry(self, entry: TaskEntry) -> None:
+        """
+        Append a completed entry and keep the indexes current.
+        
+        Args:
+            entry: Newly completed task entry
+        """
+        entries = self.data.entries
+        index_valid = self._index_is_current(entries)
+        entries.append(entry)
+        if index_valid:
+            self._task_index.setdefault(entry.task, []).append(entry)
+            self._date_index.setdefault(entry.date_str, []).append(entry)
+            self._indexed_count = len(entries)
+    
     # ============================================================================
     # Time and Utility Methods
     # ============================================================================
@@ -309,12 +701,12 @@ class WorkLog:
         """
         return datetime.now().isoformat()
     
-    @lru_cache(maxsize=128)
     def _format_display_time(self, timestamp: str) -> str:
         """
         Format ISO timestamp for human-readable display.
         
-        Cached method for efficient timestamp formatting throughout the system.
+        Results are cached by format_display_time(), shared with the daily
+        file manager.
         
         Args:
             timestamp: ISO format timestamp string
@@ -322,10 +714,10 @@ class WorkLog:
         Returns:
             str: Formatted timestamp for display
         """
-        dt = datetime.fromisoformat(timestamp)
-        return dt.strftime(self.config.display_time_format)
+        return format_display_time(timestamp, self.config.display_time_format)
     
-    def _format_duration(self, start_time: str, end_time: str) -> str:
+    @staticmethod
+    def _format_duration(start_time: str, end_time: str) -> str:
         """
         Calculate and format duration between two timestamps.
         
@@ -336,19 +728,51 @@ class WorkLog:
         Returns:
             str: Formatted duration in HH:MM:SS format
         """
-        start_dt = datetime.fromisoformat(start_time)
-        end_dt = datetime.fromisoformat(end_time)
+        return WorkLog._format_duration_dt(parse_iso(start_time), parse_iso(end_time))
+    
+    @staticmethod
+    def _format_duration_dt(start_dt: datetime, end_dt: datetime) -> str:
+        """
+        Format duration between two already-parsed datetimes.
         
-        duration = end_dt - start_dt
-        if duration.total_seconds() < 0:
-            return "00:00:00"  # Handle negative durations gracefully
+        Args:
+            start_dt: Start datetime
+            end_dt: End datetime
+            
+        Returns:
+            str: Formatted duration in HH:MM:SS format
+        """
+        return WorkLog._compute_duration(start_dt, end_dt)[1]
+    
+    @staticmethod
+    def _compute_duration(start_dt: datetime, end_dt: datetime) -> Tuple[int, str]:
+        """
+        Get the duration between two datetimes as seconds and as display text.
         
-        total_seconds = int(duration.total_seconds())
-        hours = total_seconds // 3600
-        minutes = (total_seconds % 3600) // 60
-        seconds = total_seconds % 60
+        Args:
+            start_dt: Start datetime
+            end_dt: End datetime
+            
+        Returns:
+            Tuple[int, str]: Whole elapsed seconds (0 for negative durations)
+            and the same duration in HH:MM:SS format
+        """
+        # Handle negative durations gracefully
+        total_seconds = max(0, int((end_dt - start_dt).total_seconds()))
+        return total_seconds, format_duration(total_seconds)
+    
+    @staticmethod
+    def _display_name(task_name: str) -> str:
+        """
+        Get the user-facing name for a task.
         
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        Args:
+            task_name: Internal task name
+            
+        Returns:
+            str: "[ANONYMOUS WORK]" for the anonymous placeholder, otherwise the task name
+        """
+        return WorkLog.ANONYMOUS_DISPLAY_NAME if task_name == WorkLog.ANONYMOUS_TASK_NAME else task_name
     
     def _get_timestamp(self, custom_time: Optional[str]) -> str:
         """
@@ -391,6 +815,9 @@ class WorkLog:
         """
         Get path to daily log file for a specific date.
         
+        Paths are memoized per date, so the daily directory is only
+        checked once per date for the lifetime of the instance.
+        
         Args:
             date_str: Optional date string (YYYY-MM-DD), defaults to today
             
@@ -398,13 +825,36 @@ class WorkLog:
             Path: Path to the daily log file
         """
         if date_str is None:
-            date_str = datetime.now().strftime("%Y-%m-%d")
+            return self._today()[1]
+        
+        daily_file = self._daily_path_cache.get(date_str)
+        if daily_file is None:
+            daily_dir = self.worklog_dir / "daily"
+            daily_dir.mkdir(exist_ok=True)
+            daily_file = self._daily_path_cache[date_str] = daily_dir / f"{date_str}.txt"
+        return daily_file
+    
+    def _today(self) -> Tuple[str, Path]:
+        """
+        Get today's date string and daily file path.
         
-        daily_dir = self.worklog_dir / "daily"
-        daily_dir.mkdir(exist_ok=True)
-        return daily_dir / f"{date_str}.txt"
+        The pair is cached on the instance and only recomputed once the
+        local day rolls over, so repeated writes skip date formatting,
+        path construction and the directory check.
+        
+        Returns:
+            Tuple[str, Path]: Today's date (YYYY-MM-DD) and its daily log file path
+        """
+        if self._today_cache is None or time.time() >= self._today_cache[0]:
+            today = date.today()
+            midnight = datetime.combine(today + timedelta(days=1), datetime.min.time())
+            date_str = today.isoformat()
+            daily_dir = self.worklog_dir / "daily"
+            daily_dir.mkdir(exist_ok=True)
+            self._today_cache = (midnight.timestamp(), date_str, daily_dir / f"{date_str}.txt")
+        return self._today_cache[1], self._today_cache[2]
     
-    def _update_daily_file(self, task_name: str, action: str, timestamp: str, duration: Optional[str] = None) -> None:
+    def _update_daily_file(self, task_name: str, action: str, timestamp: Union[str, datetime], duration: Optional[str] = None) -> None:
         """
         Update daily human-readable log file with task activity.
         
@@ -413,12 +863,47 @@ class WorkLog:
         Args:
             task_name: Name of the task being logged
             action: Type of action ('start', 'end', 'pause', 'resume', 'completed')
-            timestamp: ISO timestamp of the action
+            timestamp: ISO timestamp of the action, or the already-parsed datetime
             duration: Optional duration string for completed tasks
         """
-        daily_file = self._get_daily_file_path()
         entry = self.daily_file_manager.format_entry(task_name, action, timestamp, duration)
-        self.daily_file_manager.add_entry_chronologically(daily_file, entry)
+        if self._daily_buffer is not None:
+            self._daily_buffer.append(entry)
+            return
+        self.daily_file_manager.add_entry_chronologically(self._get_daily_file_path(), entry)
+    
+    @contextmanager
+    def _batched_updates(self):
+        """
+        Collect daily file updates and saves and apply them in a single pass.
+        
+        Inside the block _update_daily_file only buffers entries and
+        auto_save skips saving; on exit the daily file is read, merged and
+        rewritten once. The caller is expected to be an auto_save method so
+        the data is saved once after the block. Nested use is a no-op.
+        
+        Example:
+            >>> with worklog._batched_updates():
+            ...     for task in tasks:
+            ...         worklog.end_task(task)
+        """
+        if self._daily_buffer is not None:
+            yield
+            return
+        
+        self._daily_buffer = []
+        self._save_deferred = True
+        try:
+            yield
+        finally:
+            self._save_deferred = False
+            entries, self._daily_buffer = self._daily_buffer, None
+            if entries:
+                try:
+                    self.daily_file_manager.add_entries_chronologically(self._get_daily_file_path(), entries)
+                except IOError as e:
+                    console.print(f"❌ Failed to update daily file: {e}", style="red")
+                    logger.error(f"Batched daily file update failed: {e}")
     
     # ============================================================================
     # Task Management Methods  
@@ -489,21 +974,22 @@ class WorkLog:
             
             # Auto-end active tasks if force is enabled
             if force and self.data.active_tasks:
-                for active_task in list(self.data.active_tasks.keys()):
-                    console.print(f"🏁 Auto-ending: {active_task}")
-                    self.end_task(active_task, timestamp=timestamp)
+                with self._batched_updates():
+                    for active_task in tuple(self.data.active_tasks):
+                        console.print(f"🏁 Auto-ending: {active_task}")
+                        self.end_task(active_task, timestamp=timestamp)
             
             # Check if task is currently paused (resume it)
-            paused_task = next(
-                (task for task in self.data.paused_tasks if task.task == task_name), 
+            paused_index = next(
+                (i for i, task in enumerate(self.data.paused_tasks) if task.task == task_name),
                 None
             )
             
-            if paused_task:
-                # Resume paused task
-                self.data.paused_tasks.remove(paused_task)
+            if paused_index is not None:
+                # Resume paused task; pop by position instead of a second scan in remove()
+                self.data.paused_tasks.pop(paused_index)
                 self.data.active_tasks[task_name] = timestamp
-                display_name = "[ANONYMOUS WORK]" if task_name == self.ANONYMOUS_TASK_NAME else task_name
+                display_name = self._display_name(task_name)
                 console.print(f"▶️ Resumed '{display_name}' at {display_time}")
                 logger.info(f"Task resumed: {task_name} at {timestamp}")
                 self._update_daily_file(task_name, "resume", timestamp)
@@ -523,7 +1009,7 @@ class WorkLog:
                     self.data.recent_tasks = self.data.recent_tasks[:self.config.max_recent_tasks]
             
             # Display friendly name for output
-            display_name = "[ANONYMOUS WORK]" if task_name == self.ANONYMOUS_TASK_NAME else task_name
+            display_name = self._display_name(task_name)
             project_info = f" [{project}]" if project else ""
             console.print(f"🚀 Started '{display_name}'{project_info} at {display_time}")
             logger.info(f"Task started: {task_name} (project: {project or 'none'}) at {timestamp}")
@@ -579,8 +1065,10 @@ class WorkLog:
                 console.print(f"⚠️ Cannot find start time for '{task_name}'", style="yellow")
                 return False
             
-            # Calculate duration
-            duration = self._format_duration(start_time, end_timestamp)
+            # Parse both timestamps once; the same duration is stored, printed
+            # and written to the daily file
+            end_dt = parse_iso(end_timestamp)
+            duration_seconds, duration = self._compute_duration(parse_iso(start_time), end_dt)
             display_end_time = self._format_display_time(end_timestamp)
             
             # Get project for this task
@@ -592,24 +1080,25 @@ class WorkLog:
                 start_time=start_time,
                 end_time=end_timestamp,
                 duration=duration,
-                project=task_project
+                project=task_project,
+                duration_seconds=duration_seconds
             )
             
             # Update data structures
-            self.data.entries.append(entry)
+            self._index_entry(entry)
             del self.data.active_tasks[task_name]
             
             # Remove project tracking
             if task_name in self.data.active_task_projects:
                 del self.data.active_task_projects[task_name]
             
-            display_name = "[ANONYMOUS WORK]" if task_name == self.ANONYMOUS_TASK_NAME else task_name
+            display_name = self._display_name(task_name)
             project_info = f" [{task_project}]" if task_project else ""
             console.print(f"🏁 Completed '{display_name}'{project_info} at {display_end_time} (Duration: {duration})")
             logger.info(f"Task completed: {task_name}, duration: {duration}")
             
             # Update daily file with completion info
-            self._update_daily_file(task_name, "completed", end_timestamp, duration)
+            self._update_daily_file(task_name, "completed", end_dt, duration)
             return True
             
         except ValueError as e:
@@ -643,7 +1132,7 @@ class WorkLog:
             return False
         
         # Get list of active tasks (copy to avoid modification during iteration)
-        active_task_names = list(self.data.active_tasks.keys())
+        active_task_names = tuple(self.data.active_tasks)
         paused_task_names = [p.task for p in self.data.paused_tasks] if include_paused else []
         
         total_tasks = len(active_task_names) + len(paused_task_names)
@@ -652,19 +1141,21 @@ class WorkLog:
         
         ended_count = 0
         
-        # End active tasks
-        for task_name in active_task_names:
-            if self.end_task(task_name, custom_time=custom_time):
-                ended_count += 1
-        
-        # End paused tasks if requested - need to resume them first then end
-        if include_paused:
-            for task_name in paused_task_names:
-                # Resume the paused task (this will make it active)
-                if self.resume_task(task_name, custom_time=custom_time):
-                    # Now end it
-                    if self.end_task(task_name, custom_time=custom_time):
-                        ended_count += 1
+        # Daily file is rewritten and data saved once for the whole batch
+        with self._batched_updates():
+            # End active tasks
+            for task_name in active_task_names:
+                if self.end_task(task_name, custom_time=custom_time):
+                    ended_count += 1
+            
+            # End paused tasks if requested - need to resume them first then end
+            if include_paused:
+                for task_name in paused_task_names:
+                    # Resume the paused task (this will make it active)
+                    if self.resume_task(task_name, custom_time=custom_time):
+                        # Now end it
+                        if self.end_task(task_name, custom_time=custom_time):
+                            ended_count += 1
         
         if ended_count > 0:
             console.print(f"\n✅ Ended {ended_count} task(s) successfully")
@@ -755,7 +1246,7 @@ class WorkLog:
         logger.warning(f"Start time not found for {task_name}, using current session estimate")
         
         # Look for recent completed entries of the same task to estimate session length
-        recent_entries = [e for e in self.data.entries[-10:] if e.task == task_name]
+        recent_entries = self._entries_for_task(task_name)
         if recent_entries:
             # Use typical task duration as fallback
             latest_entry = recent_entries[-1]
@@ -801,21 +1292,22 @@ class WorkLog:
         # Show active tasks
         if self.data.active_tasks:
             console.print("🚀 Active Tasks:", style="bold green")
-            for task_name, start_time in self.data.active_tasks.items():
-                # Calculate runtime for active tasks
-                current_duration = self._format_duration(start_time, self._get_current_timestamp())
-                console.print(f"  • {task_name} (Running: {current_duration})")
+            current_dt = datetime.fromisoformat(self._get_current_timestamp())
+            # Calculate runtime for active tasks against a single "now"
+            console.print("\n".join(
+                f"  • {task_name} (Running: {self._format_duration_dt(parse_iso(start_time), current_dt)})"
+                for task_name, start_time in self.data.active_tasks.items()
+            ))
         
         # Show paused tasks
         if self.data.paused_tasks:
             console.print("\n⏸️ Paused Tasks:", style="bold yellow")
-            for task in self.data.paused_tasks:
-                console.print(f"  • {task.task}")
+            console.print("\n".join(f"  • {task.task}" for task in self.data.paused_tasks))
         
         # Show recent activity count
         if self.data.entries:
-            today = datetime.now().strftime("%Y-%m-%d")
-            today_entries = [e for e in self.data.entries if e.start_time.startswith(today)]
+            today = self._today()[0]
+            today_entries = self._entries_for_date(today)
             if today_entries:
                 console.print(f"\n📊 Completed today: {len(today_entries)} tasks")
     
@@ -828,27 +1320,28 @@ class WorkLog:
         Args:
             limit: Optional limit on number of tasks to show (default: 10)
         """
-        # Get completed entries only
-        completed_entries = [e for e in self.data.entries if e.end_time is not None]
+        # Use limit or default to 10
+        display_limit = limit or 10
+        
+        # Walk entries newest-first and stop once enough completed ones are collected
+        recent_entries = list(islice(
+            (e for e in reversed(self.data.entries) if e.end_time is not None),
+            display_limit
+        ))
         
-        if not completed_entries:
+        if not recent_entries:
             console.print("📝 No completed tasks found", style="dim")
             return
         
-        # Use limit or default to 10
-        display_limit = limit or 10
-        recent_entries = completed_entries[-display_limit:]
-        
         console.print(f"📝 Recent {len(recent_entries)} Completed Tasks:", style="bold")
         console.print()
         
-        # Display in reverse order (most recent first)
-        for entry in reversed(recent_entries):
-            display_name = "[ANONYMOUS WORK]" if entry.task == self.ANONYMOUS_TASK_NAME else entry.task
-            date_part = entry.start_time[:10]  # YYYY-MM-DD
-            start_time = datetime.fromisoformat(entry.start_time).strftime("%H:%M")
-            
-            console.print(f"  {date_part} {start_time} {display_name} ({entry.duration})")
+        # Already in reverse order (most recent first); render in a single print
+        lines = []
+        for entry in recent_entries:
+            display_name = self._display_name(entry.task)
+            lines.append(f"  {entry.date_str} {entry.time_str} {display_name} ({entry.duration})")
+        console.print("\n".join(lines))
     
     @requires_data
     def list_entries(self, date: str = None, limit: int = None, task_filter: str = None, project_filter: str = None) -> None:
@@ -865,26 +1358,31 @@ class WorkLog:
         # Show active tasks status first
         if self.data.active_tasks:
             console.print("🔥 [bold green]ACTIVE TASKS:[/bold green]")
-            current_time = self._get_current_timestamp()
-            for task_name, start_time in self.data.active_tasks.items():
-                display_name = "[ANONYMOUS WORK]" if task_name == self.ANONYMOUS_TASK_NAME else task_name
-                duration = self._format_duration(start_time, current_time)
-                formatted_start = self._format_display_time(start_time)
-                project = self.data.active_task_projects.get(task_name)
-                project_info = f" [dim]({project})[/dim]" if project else ""
-                console.print(f"  • {display_name}{project_info} - Started: {formatted_start} (Running: {duration})")
+            current_dt = datetime.fromisoformat(self._get_current_timestamp())
+            # Split into columns once, then format each column in a single pass
+            names, starts = zip(*self.data.active_tasks.items())
+            projects = self.data.active_task_projects
+            display_names = [self._display_name(name) for name in names]
+            project_infos = [f" [dim]({projects[name]})[/dim]" if projects.get(name) else "" for name in names]
+            display_format = self.config.display_time_format
+            formatted_starts = [format_display_time(start, display_format) for start in starts]
+            durations = [self._format_duration_dt(parse_iso(start), current_dt) for start in starts]
+            console.print("\n".join(
+                f"  • {display_name}{project_info} - Started: {formatted_start} (Running: {duration})"
+                for display_name, project_info, formatted_start, duration in zip(
+                    display_names, project_infos, formatted_starts, durations
+                )
+            ))
         
         # Show paused tasks
         if self.data.paused_tasks:
             console.print("\n⏸️  [bold yellow]PAUSED TASKS:[/bold yellow]")
-            for task in self.data.paused_tasks:
-                display_name = "[ANONYMOUS WORK]" if task.task == self.ANONYMOUS_TASK_NAME else task.task
-                console.print(f"  • {display_name}")
+            console.print("\n".join(f"  • {self._display_name(task.task)}" for task in self.data.paused_tasks))
         
         # Show today's completed tasks count
         if self.data.entries:
-            today = datetime.now().strftime("%Y-%m-%d")
-            today_entries = [e for e in self.data.entries if e.start_time.startswith(today)]
+            today = self._today()[0]
+            today_entries = self._entries_for_date(today)
             if today_entries:
                 console.print(f"\n📊 [bold]COMPLETED TODAY:[/bold] {len(today_entries)} tasks")
         
@@ -903,14 +1401,18 @@ class WorkLog:
         if date:
             try:
                 WorkLogValidator.validate_date_format(date, self.config)
-                entries = [e for e in entries if e.start_time.startswith(date)]
+                entries = list(self._entries_for_date(date))
             except ValueError as e:
                 console.print(f"❌ Invalid date format: {e}", style="red")
                 return
         
         # Apply task name filter
         if task_filter:
-            entries = [e for e in entries if task_filter.lower() in e.task.lower()]
+            # Match each distinct task name once, then filter entries by set lookup
+            needle = task_filter.lower()
+            self._ensure_entry_index()
+            matching_tasks = {name for name in self._task_index if needle in name.lower()}
+            entries = [e for e in entries if e.task in matching_tasks]
         
         # Apply project filter
         if project_filter:
@@ -934,15 +1436,17 @@ class WorkLog:
         # Display entries
         console.print(f"📋 Last {len(entries)} Completed Tasks:", style="bold")
         
+        # Build all lines first and render them in a single print
+        display_format = self.config.display_time_format
+        lines = []
         for entry in entries:
-            display_name = "[ANONYMOUS WORK]" if entry.task == self.ANONYMOUS_TASK_NAME else entry.task
-            start_display = self._format_display_time(entry.start_time)
-            end_display = self._format_display_time(entry.end_time)
+            display_name = self._display_name(entry.task)
+            start_display = format_display_time(entry.start_time, display_format)
+            end_display = format_display_time(entry.end_time, display_format)
             project_info = f" [dim]({entry.project})[/dim]" if entry.project else ""
-            console.print(
-                f"  • {display_name}{project_info}\n"
-                f"    {start_display} → {end_display} ({entry.duration})"
-            )
+            lines.append(f"  • {display_name}{project_info}")
+            lines.append(f"    {start_display} → {end_display} ({entry.duration})")
+        console.print("\n".join(lines))
     
     @requires_data
     def show_daily_summary(self, date: str = None) -> None:
@@ -952,7 +1456,7 @@ class WorkLog:
         Args:
             date: Optional date (YYYY-MM-DD), defaults to today
         """
-        target_date = date or datetime.now().strftime("%Y-%m-%d")
+        target_date = date or self._today()[0]
         
         # Validate date format
         try:
@@ -962,18 +1466,21 @@ class WorkLog:
             return
         
         # Filter entries for the date
-        day_entries = [e for e in self.data.entries if e.start_time.startswith(target_date)]
+        day_entries = self._entries_for_date(target_date)
         
         if not day_entries:
             console.print(f"📅 No tasks completed on {target_date}", style="dim")
             return
         
-        # Calculate total time
+        # Calculate total time and per-task totals from the stored seconds
         total_seconds = 0
+        task_durations = {}
         for entry in day_entries:
-            start_dt = datetime.fromisoformat(entry.start_time)
-            end_dt = datetime.fromisoformat(entry.end_time)
-            total_seconds += (end_dt - start_dt).total_seconds()
+            seconds = entry.duration_seconds
+            if seconds is None:
+                seconds = (entry.end_dt - entry.start_dt).total_seconds()
+            total_seconds += seconds
+            task_durations[entry.task] = task_durations.get(entry.task, 0) + seconds
         
         total_hours = total_seconds // 3600
         total_minutes = (total_seconds % 3600) // 60
@@ -982,22 +1489,14 @@ class WorkLog:
         console.print(f"📅 Daily Summary for {target_date}", style="bold")
         console.print(f"📊 Total: {len(day_entries)} tasks, {total_hours:.0f}h {total_minutes:.0f}m")
         
-        # Group by task name
-        task_durations = {}
-        for entry in day_entries:
-            if entry.task not in task_durations:
-                task_durations[entry.task] = 0
-            
-            start_dt = datetime.fromisoformat(entry.start_time)
-            end_dt = datetime.fromisoformat(entry.end_time)
-            task_durations[entry.task] += (end_dt - start_dt).total_seconds()
-        
         # Display task breakdown
         console.print("\n📋 Tasks:")
+        lines = []
         for task_name, seconds in sorted(task_durations.items(), key=lambda x: x[1], reverse=True):
             hours = seconds // 3600
             minutes = (seconds % 3600) // 60
-            console.print(f"  • {task_name}: {hours:.0f}h {minutes:.0f}m")
+            lines.append(f"  • {task_name}: {hours:.0f}h {minutes:.0f}m")
+        console.print("\n".join(lines))
     
     @requires_data
     @auto_save
@@ -1019,7 +1518,7 @@ class WorkLog:
             return False
         
         # Find entries for the date
-        entries_to_remove = [e for e in self.data.entries if e.start_time.startswith(date)]
+        entries_to_remove = self._entries_for_date(date)
         
         if not entries_to_remove:
             console.print(f"ℹ️  No entries found for {date}", style="dim")
@@ -1027,21 +1526,21 @@ class WorkLog:
         
         # Create backup before cleaning
         from ..managers.backup import BackupManager
-        daily_file = self.worklog_dir / f"{date}.txt"
+        daily_file = self._get_daily_file_path(date)
         BackupManager.create_backup(
             self.worklog_dir,
             f"clean_{date}",
             entries_to_remove,
-            daily_file if daily_file.exists() else None,
+            daily_file,
             self.config
         )
         
         # Remove entries from data
-        self.data.entries = [e for e in self.data.entries if not e.start_time.startswith(date)]
+        removed_ids = {id(e) for e in entries_to_remove}
+        self.data.entries = [e for e in self.data.entries if id(e) not in removed_ids]
         
         # Remove daily file if exists
-        if daily_file.exists():
-            daily_file.unlink()
+        daily_file.unlink(missing_ok=True)
         
         console.print(f"✅ Cleaned {len(entries_to_remove)} entries for {date}", style="green")
         console.print("💾 Backup created for safety", style="dim")
@@ -1069,11 +1568,9 @@ class WorkLog:
                 return False
         
         # Find entries to remove
+        entries_to_remove = self._entries_for_task(task_name)
         if date:
-            entries_to_remove = [e for e in self.data.entries 
-                               if e.task == task_name and e.start_time.startswith(date)]
-        else:
-            entries_to_remove = [e for e in self.data.entries if e.task == task_name]
+            entries_to_remove = [e for e in entries_to_remove if e.date_str == date]
         
         if not entries_to_remove:
             filter_msg = f" on {date}" if date else ""
@@ -1092,22 +1589,19 @@ class WorkLog:
         )
         
         # Remove entries from data
-        if date:
-            self.data.entries = [e for e in self.data.entries 
-                               if not (e.task == task_name and e.start_time.startswith(date))]
-        else:
-            self.data.entries = [e for e in self.data.entries if e.task != task_name]
+        removed_ids = {id(e) for e in entries_to_remove}
+        self.data.entries = [e for e in self.data.entries if id(e) not in removed_ids]
         
         # Rebuild affected daily files
-        affected_dates = set(e.start_time[:10] for e in entries_to_remove)
+        affected_dates = set(e.date_str for e in entries_to_remove)
         for affected_date in affected_dates:
-            daily_file = self.worklog_dir / f"{affected_date}.txt"
+            daily_file = self._get_daily_file_path(affected_date)
             # Get remaining entries for this date
-            remaining_entries = [e for e in self.data.entries if e.start_time.startswith(affected_date)]
+            remaining_entries = self._entries_for_date(affected_date)
             
             if remaining_entries:
-                # Rebuild daily file with remaining entries
-                daily_file.write_text("")  # Clear file
+                # Rebuild daily file with remaining entries in a single write
+                formatted_entries = []
                 for entry in remaining_entries:
                     # Determine action based on entry state
                     if entry.end_time and entry.duration:
@@ -1125,10 +1619,13 @@ class WorkLog:
                             'start',
                             entry.start_time
                         )
-                    self.daily_file_manager.add_entry_chronologically(daily_file, formatted_entry)
-            elif daily_file.exists():
+                    formatted_entries.append(formatted_entry)
+                self.daily_file_manager.add_entries_chronologically(
+                    daily_file, formatted_entries, replace_existing=True
+                )
+            else:
                 # No entries left for this date, remove daily file
-                daily_file.unlink()
+                daily_file.unlink(missing_ok=True)
         
         filter_msg = f" on {date}" if date else ""
         console.print(f"✅ Cleaned {len(entries_to_remove)} entries for task '{task_name}'{filter_msg}", style="green")
@@ -1166,13 +1663,11 @@ class WorkLog:
         self.data.active_tasks = {}
         self.data.paused_tasks = []
         
-        # Remove all daily files
-        daily_files = list(self.worklog_dir.glob("*.txt"))
+        # Remove all daily files (worklog.log lives outside daily/ and is kept)
         removed_files = 0
-        for daily_file in daily_files:
-            if daily_file.name != "worklog.log":  # Don't remove log file
-                daily_file.unlink()
-                removed_files += 1
+        for daily_file in (self.worklog_dir / "daily").glob("*.txt"):
+            daily_file.unlink()
+            removed_files += 1
         
         console.print(f"✅ Cleaned {entry_count} entries and {removed_files} daily files", style="green")
         console.print("💾 Backup created for safety", style="dim")
@@ -9,7 +9,11 @@ This module contains all dataclass definitions used throughout the worklog syste
 
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from datetime import datetime
+from functools import cached_property
+from typing import List, Dict, Optional, Union
+
+from .utils.timestamps import parse_duration, parse_iso
 
 
 @dataclass
@@ -28,12 +32,60 @@ class TaskEntry:
         end_time: ISO timestamp when task ended (None for active tasks)
         duration: Formatted duration string (HH:MM:SS format)
         project: Optional project/category name for task organization
+        duration_seconds: Duration in whole seconds, for arithmetic on totals
     """
     task: str
     start_time: str  # ISO timestamp string for JSON compatibility
     end_time: Optional[str] = None
     duration: Optional[str] = None
     project: Optional[str] = None
+    duration_seconds: Optional[int] = None
+    
+    def __post_init__(self) -> None:
+        # Entries saved before duration_seconds existed only carry the string
+        if self.duration_seconds is None and self.duration:
+            try:
+                self.duration_seconds = parse_duration(self.duration)
+            except ValueError:
+                pass
+    
+    @cached_property
+    def date_str(self) -> str:
+        """Start date as YYYY-MM-DD, derived once from start_time."""
+        return self.start_time[:10]
+    
+    @cached_property
+    def time_str(self) -> str:
+        """Start time as HH:MM, derived once from start_time."""
+        return self.start_time[11:16]
+    
+    @cached_property
+    def start_dt(self) -> datetime:
+        """Start time as a datetime, parsed once from start_time."""
+        return parse_iso(self.start_time)
+    
+    @cached_property
+    def end_dt(self) -> Optional[datetime]:
+        """End time as a datetime (None while active), parsed once from end_time."""
+        return parse_iso(self.end_time) if self.end_time else None
+    
+    def to_dict(self) -> Dict[str, Union[str, int, None]]:
+        """
+        Convert the entry to a JSON-serializable dictionary.
+        
+        Only persisted fields are included; cached derived values stay in memory.
+        
+        Returns:
+            Dict[str, Union[str, int, None]]: Field name to value mapping
+        """
+        return {
+            'task': self.task,
+            'start_time': self.start_time,
+            'end_time': self.end_time,
+            'duration': self.duration,
+            'project': self.project,
+            'duration_seconds': self.duration_seconds,
+        }
 
 
 @dataclass 
@@ -1,16 +1,29 @@
 """Google Sheets sync functionality for haunts-compatible format."""
 
 import math
+from collections import defaultdict
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
-
-import gspread
-from google.auth.exceptions import DefaultCredentialsError
-from google.oauth2.service_account import Credentials
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from ..config import WorkLogConfig
 from ..models import TaskEntry
+from ..utils.jsonio import json_loads
+
+if TYPE_CHECKING:
+    import gspread
+    from ..managers.worklog import WorkLog
+
+# Header rows of the monthly worksheets created by each backend
+HEADERS = (
+    "Date", "Start time", "Project", "Activity",
+    "Details", "Spent", "Event id", "Link", "Action",
+)
+HAUNTS_HEADERS = (
+    "Date", "Start time", "Spent", "Project", "Activity",
+    "Details", "Custom", "Event id", "Link", "Action",
+)
 
 # Optional haunts import
 try:
@@ -39,9 +52,31 @@ def round_hours(hours: float, increment: float) -> float:
         >>> round_hours(2.4, 1.0)   # 2h 24m → 2.0 (2h 0m)
         2.0
     """
+    # round() already yields an integer step count (ties to even), and
+    # multiplying it by 0.25/0.5/1.0 is exact in binary floating point
     return round(hours / increment) * increment
 
 
+@lru_cache(maxsize=None)
+def _hours_format(round_increment: float) -> Optional[str]:
+    """
+    Get the format string for hours rounded to an increment.
+    
+    Args:
+        round_increment: Rounding increment (0.25, 0.5, or 1.0)
+    
+    Returns:
+        Format string for the value, or None when it is a whole number
+    """
+    # Determine decimal places based on increment
+    if round_increment >= 1.0:
+        return None
+    elif round_increment >= 0.5:
+        return "{:.1f}"
+    else:  # 0.25 or smaller
+        return "{:.2f}"
+
+
 def format_hours(hours: float, round_increment: float) -> str:
     """
     Format hours with rounding, using comma as decimal separator.
@@ -67,24 +102,12 @@ def format_hours(hours: float, round_increment: float) -> str:
         '2'
     """
     rounded = round_hours(hours, round_increment)
-    
-    # Determine decimal places based on increment
-    if round_increment >= 1.0:
-        decimal_places = 0
-    elif round_increment >= 0.5:
-        decimal_places = 1
-    else:  # 0.25 or smaller
-        decimal_places = 2
-    
-    if decimal_places == 0:
+    fmt = _hours_format(round_increment)
+    if fmt is None:
         return str(int(rounded))
     
-    # Format with calculated decimal places
-    format_str = f"{{:.{decimal_places}f}}"
-    formatted = format_str.format(rounded)
-    
     # Replace dot with comma for European format
-    return formatted.replace(".", ",")
+    return fmt.format(rounded).replace(".", ",")
 
 
 class HauntsAdapter:
@@ -121,6 +144,11 @@ class HauntsAdapter:
         self.config = config
         self.credentials_path = credentials_path
         self._use_haunts_oauth = False
+        # First empty line per worksheet, see _get_first_empty_line()
+        self._next_lines: Dict[str, int] = {}
+        # Authorized credentials; the API client is built from them on first use
+        self._credentials: Any = None
+        self._sheet_resource: Any = None
         
         # CASE 1: credentials_path provided → Use it (OAuth token or Service Account)
         if credentials_path:
@@ -158,7 +186,6 @@ class HauntsAdapter:
         from pathlib import Path as PathlibPath
         from haunts.credentials import get_credentials
         from haunts.ini import init as haunts_init, get as haunts_get
-        from googleapiclient.discovery import build
         
         # Check if haunts config exists
         haunts_config_dir = PathlibPath.home() / ".config" / "haunts"
@@ -178,14 +205,11 @@ class HauntsAdapter:
             self.config.sheet_document_id = haunts_sheet_id
         
         # Get OAuth credentials using haunts
-        creds = get_credentials(
+        self._credentials = get_credentials(
             haunts_config_dir,
             ["https://www.googleapis.com/auth/spreadsheets"],
             "sheets-token.json"
         )
-        
-        service = build("sheets", "v4", credentials=creds)
-        self._sheet = service.spreadsheets()
     
     def _init_with_service_account(self, credentials_path: Path):
         """
@@ -195,14 +219,11 @@ class HauntsAdapter:
         1. Service account JSON (has "client_email" field)
         2. OAuth token JSON from haunts (has "token", "refresh_token" fields)
         """
-        import json
         from google.oauth2.service_account import Credentials as ServiceAccountCredentials
         from google.oauth2.credentials import Credentials as OAuthCredentials
-        from googleapiclient.discovery import build
         
         # Load and check credential type
-        with open(credentials_path, 'r') as f:
-            cred_data = json.load(f)
+        cred_data = json_loads(Path(credentials_path).read_bytes())
         
         scopes = ["https://www.googleapis.com/auth/spreadsheets"]
         
@@ -229,8 +250,25 @@ class HauntsAdapter:
                 f"- OAuth token JSON (with 'refresh_token')"
             )
         
-        service = build("sheets", "v4", credentials=creds)
-        self._sheet = service.spreadsheets()
+        self._credentials = creds
+    
+    @property
+    def _sheet(self) -> Any:
+        """
+        Sheets API spreadsheets() resource, built on first use.
+        
+        Building the discovery-based client costs ~250ms, which dry runs
+        and adapters that never write should not pay.
+        """
+        if self._sheet_resource is None:
+            from googleapiclient.discovery import build
+            service = build("sheets", "v4", credentials=self._credentials)
+            self._sheet_resource = service.spreadsheets()
+        return self._sheet_resource
+    
+    @_sheet.setter
+    def _sheet(self, resource: Any) -> None:
+        self._sheet_resource = resource
     
     def _convert_task_to_haunts_format(self, task: TaskEntry) -> dict:
         """
@@ -251,9 +289,9 @@ class HauntsAdapter:
         if not task.start_time:
             raise ValueError("Task must have start_time")
         
-        # Parse timestamps to datetime objects
-        start_dt = datetime.fromisoformat(task.start_time)
-        end_dt = datetime.fromisoformat(task.end_time)
+        # Parsed timestamps (cached on the entry)
+        start_dt = task.start_dt
+        end_dt = task.end_dt
         
         # Calculate duration as timedelta
         duration = end_dt - start_dt
@@ -270,57 +308,47 @@ class HauntsAdapter:
             'duration': duration
         }
     
-    def _ensure_worksheet_exists(self, month_name: str) -> None:
+    def _create_worksheet(self, month_name: str) -> None:
         """
-        Ensure the monthly worksheet exists with proper headers.
+        Create the monthly worksheet with proper headers.
         
         Args:
             month_name: Name of the worksheet (e.g., "October")
         """
-        try:
-            # Try to get the worksheet
-            self._sheet.values().get(
-                spreadsheetId=self.config.sheet_document_id,
-                range=f"{month_name}!A1:A1"
-            ).execute()
-        except Exception:
-            # Worksheet doesn't exist, create it
-            requests = [{
-                'addSheet': {
-                    'properties': {
-                        'title': month_name,
-                        'gridProperties': {
-                            'rowCount': 100,
-                            'columnCount': 10  # Updated from 9 to 10 columns
-                        }
+        requests = [{
+            'addSheet': {
+                'properties': {
+                    'title': month_name,
+                    'gridProperties': {
+                        'rowCount': 100,
+                        'columnCount': 10  # Updated from 9 to 10 columns
                     }
                 }
-            }]
-            
-            self._sheet.batchUpdate(
-                spreadsheetId=self.config.sheet_document_id,
-                body={'requests': requests}
-            ).execute()
-            
-            # Add header row - Order: Date, Start time, Spent, Project, Activity, Details, Custom, Event id, Link, Action
-            headers = [
-                ["Date", "Start time", "Spent", "Project", "Activity", 
-                 "Details", "Custom", "Event id", "Link", "Action"]
-            ]
-            
-            self._sheet.values().update(
-                spreadsheetId=self.config.sheet_document_id,
-                range=f'{month_name}!A1:J1',  # Updated from I1 to J1
-                valueInputOption='USER_ENTERED',
-                body={'values': headers}
-            ).execute()
+            }
+        }]
+        
+        self._sheet.batchUpdate(
+            spreadsheetId=self.config.sheet_document_id,
+            body={'requests': requests}
+        ).execute()
+        
+        # Add header row - Order: Date, Start time, Spent, Project, Activity, Details, Custom, Event id, Link, Action
+        self._sheet.values().update(
+            spreadsheetId=self.config.sheet_document_id,
+            range=f'{month_name}!A1:J1',  # Updated from I1 to J1
+            valueInputOption='USER_ENTERED',
+            body={'values': [list(HAUNTS_HEADERS)]}
+        ).execute()
     
-    def sync_task(self, task: TaskEntry) -> None:
+    def _build_row(self, task: TaskEntry) -> Tuple[str, List[str]]:
         """
-        Sync a single task to Google Sheets using haunts-style formatting.
+        Build the haunts-style row for a task.
         
         Args:
-            task: The task entry to sync
+            task: The task entry to format
+        
+        Returns:
+            Tuple of the target worksheet name and the row values
         
         Raises:
             ValueError: If task is not completed or missing required fields
@@ -328,17 +356,8 @@ class HauntsAdapter:
         # Convert task to haunts format
         haunts_data = self._convert_task_to_haunts_format(task)
         
-        # Get month name for the sheet
-        end_dt = datetime.fromisoformat(task.end_time)
-        sheet_date_str = end_dt.strftime("%Y-%m-%d")
-        month_name = self.config.get_sheet_name_for_date(sheet_date_str)
-        
-        # Ensure worksheet exists
-        self._ensure_worksheet_exists(month_name)
-        
-        # Use haunts-style append logic (adapted from haunts.spreadsheet.append_line)
-        # Get the first empty line
-        next_line = self._get_first_empty_line(month_name)
+        # Get month name for the sheet from the end date (YYYY-MM-DD prefix)
+        month_name = self.config.get_sheet_name_for_date(task.end_time[:10])
         
         # Format data in haunts style
         formatted_time = haunts_data['start_time'].strftime("%H:%M")
@@ -359,19 +378,75 @@ class HauntsAdapter:
             "",                  # I: Link (filled by haunts sync)
             ""                   # J: Action (used by haunts sync)
         ]
+        return month_name, row_data
+    
+    def _write_rows(self, rows: List[Tuple[str, List[str]]]) -> int:
+        """
+        Append rows to their worksheets with a single batchUpdate request.
         
-        # Write to sheet (A:J = 10 columns)
-        range_name = f"{month_name}!A{next_line}:J{next_line}"
-        self._sheet.values().update(
+        Each row goes to the next empty line of its worksheet (haunts-style
+        append logic, adapted from haunts.spreadsheet.append_line). Sending
+        all ranges in one request costs one round-trip instead of one per row.
+        
+        Args:
+            rows: (worksheet name, row values) pairs from _build_row()
+        
+        Returns:
+            Number of rows written
+        """
+        if not rows:
+            return 0
+        
+        next_lines: Dict[str, int] = {}
+        data = []
+        for month_name, row_data in rows:
+            # Get the first empty line (creates the worksheet if it doesn't exist)
+            next_line = next_lines.get(month_name) or self._get_first_empty_line(month_name)
+            # Write to sheet (A:J = 10 columns)
+            data.append({'range': f"{month_name}!A{next_line}:J{next_line}", 'values': [row_data]})
+            next_lines[month_name] = next_line + 1
+        
+        self._sheet.values().batchUpdate(
             spreadsheetId=self.config.sheet_document_id,
-            range=range_name,
-            valueInputOption='USER_ENTERED',
-            body={'values': [row_data]}
+            body={'valueInputOption': 'USER_ENTERED', 'data': data}
         ).execute()
+        self._next_lines.update(next_lines)
+        return len(data)
+    
+    def append_tasks(self, tasks: List[TaskEntry]) -> int:
+        """
+        Append completed tasks to their monthly worksheets in one write.
+        
+        Args:
+            tasks: Completed task entries to append
+        
+        Returns:
+            Number of tasks written
+        
+        Raises:
+            ValueError: If any task is not completed or missing required fields
+        """
+        return self._write_rows([self._build_row(task) for task in tasks])
+    
+    def sync_task(self, task: TaskEntry) -> None:
+        """
+        Sync a single task to Google Sheets using haunts-style formatting.
+        
+        Args:
+            task: The task entry to sync
+        
+        Raises:
+            ValueError: If task is not completed or missing required fields
+        """
+        self.append_tasks([task])
     
     def _get_first_empty_line(self, month_name: str) -> int:
         """
-        Find the first empty line in the worksheet.
+        Find the first empty line in the worksheet, creating it if missing.
+        
+        The column read doubles as the existence check, and the result is
+        remembered per worksheet so that syncing several tasks into the
+        same month costs one read rather than two per task.
         
         Args:
             month_name: Name of the worksheet
@@ -379,17 +454,21 @@ class HauntsAdapter:
         Returns:
             Line number (1-indexed) of first empty row
         """
-        try:
-            result = self._sheet.values().get(
-                spreadsheetId=self.config.sheet_document_id,
-                range=f"{month_name}!A:A"
-            ).execute()
-            values = result.get('values', [])
-            # First empty line is after all existing rows (skip header)
-            return len(values) + 1
-        except Exception:
-            # If error, assume starting at line 2 (after header)
-            return 2
+        next_line = self._next_lines.get(month_name)
+        if next_line is None:
+            try:
+                result = self._sheet.values().get(
+                    spreadsheetId=self.config.sheet_document_id,
+                    range=f"{month_name}!A:A"
+                ).execute()
+                # First empty line is after all existing rows (including header)
+                next_line = len(result.get('values', [])) + 1
+            except Exception:
+                # Worksheet doesn't exist, create it and start after the header
+                self._create_worksheet(month_name)
+                next_line = 2
+            self._next_lines[month_name] = next_line
+        return next_line
     
     def _format_duration_haunts(self, duration: timedelta) -> str:
         """
@@ -411,6 +490,10 @@ class HauntsAdapter:
         """
         Sync multiple tasks to Google Sheets using haunts.
         
+        All rows are sent in one batch. If that request fails, nothing was
+        written, so the rows are retried one at a time and only the ones
+        that fail again are reported and left out of the count.
+        
         Args:
             tasks: List of task entries to sync
             filter_date: If provided, only sync tasks from this date
@@ -418,26 +501,39 @@ class HauntsAdapter:
         Returns:
             Number of tasks synced
         """
-        synced_count = 0
+        rows = []
         
         for task in tasks:
             if not task.end_time:
                 continue  # Skip incomplete tasks
             
             # Filter by date if specified
-            if filter_date:
-                end_dt = datetime.fromisoformat(task.end_time)
-                if end_dt.date() != filter_date:
-                    continue
+            if filter_date and task.end_dt.date() != filter_date:
+                continue
             
             try:
-                self.sync_task(task)
-                synced_count += 1
+                rows.append(self._build_row(task))
             except Exception as e:
                 # Log error but continue with other tasks
                 print(f"Error syncing task: {e}")
                 continue
         
+        try:
+            return self._write_rows(rows)
+        except Exception as e:
+            if len(rows) == 1:
+                print(f"Error syncing task: {e}")
+                return 0
+            print(f"Error syncing {len(rows)} tasks in one batch, retrying one by one: {e}")
+        
+        synced_count = 0
+        for month_name, row_data in rows:
+            try:
+                synced_count += self._write_rows([(month_name, row_data)])
+            except Exception as e:
+                # Date, start time and details identify the row in the sheet
+                print(f"Error syncing task {row_data[0]} {row_data[1]} "
+                      f"'{row_data[5]}' to {month_name}: {e}")
         return synced_count
     
     def test_connection(self) -> bool:
@@ -471,7 +567,8 @@ class GoogleSheetsSync:
     Uses HauntsAdapter backend if available, falls back to gspread.
     """
     
-    def __init__(self, config: WorkLogConfig, credentials_path: Optional[Path] = None):
+    def __init__(self, config: WorkLogConfig, credentials_path: Optional[Path] = None,
+                 worklog: Optional["WorkLog"] = None):
         """
         Initialize the Google Sheets sync.
         
@@ -479,6 +576,8 @@ class GoogleSheetsSync:
             config: WorkLog configuration (reads google_sheets.use_haunts_format)
             credentials_path: Path to credentials file (OAuth token or Service Account JSON).
                             If None and haunts library available, tries ~/.config/haunts/
+            worklog: Already loaded WorkLog to sync from. If None, one is loaded
+                     from config on first use and reused by later sync_* calls
         
         Raises:
             ValueError: If Google Sheets is not enabled in config
@@ -489,9 +588,17 @@ class GoogleSheetsSync:
         
         self.config = config
         self.credentials_path = credentials_path
+        self._worklog = worklog
+        # Completed tasks (flat and by YYYY-MM), built from _partitioned_entries
+        self._completed: List[TaskEntry] = []
+        self._completed_by_month: Dict[str, List[TaskEntry]] = {}
+        self._partitioned_entries: Optional[List[TaskEntry]] = None
+        self._partitioned_count = 0
         self._adapter: Optional[HauntsAdapter] = None
-        self._client: Optional[gspread.Client] = None
-        self._spreadsheet: Optional[gspread.Spreadsheet] = None
+        self._client: Optional["gspread.Client"] = None
+        self._spreadsheet: Optional["gspread.Spreadsheet"] = None
+        # Worksheet handles by title, loaded on first lookup
+        self._worksheets: Optional[Dict[str, "gspread.Worksheet"]] = None
         
         # Use HauntsAdapter if use_haunts_format is enabled
         if config.google_sheets.use_haunts_format:
@@ -509,9 +616,44 @@ class GoogleSheetsSync:
                 ) from e
         # Otherwise use legacy gspread backend (will be initialized lazily)
     
-    def _get_client(self) -> gspread.Client:
+    def _get_worklog(self) -> "WorkLog":
+        """Get the WorkLog to sync from, loading it on first use."""
+        if self._worklog is None:
+            from ..managers.worklog import WorkLog
+            self._worklog = WorkLog(config=self.config)
+        return self._worklog
+    
+    def _get_completed(self) -> Tuple[List[TaskEntry], Dict[str, List[TaskEntry]]]:
+        """
+        Get the worklog's completed tasks, flat and grouped by end month.
+        
+        Partitioned once and reused by every sync_* call; rebuilt only if
+        the entries list is replaced or changes length.
+        
+        Returns:
+            Completed tasks in worklog order, and the same tasks keyed by
+            the YYYY-MM prefix of their end time
+        """
+        entries = self._get_worklog().data.entries
+        if entries is not self._partitioned_entries or len(entries) != self._partitioned_count:
+            completed = [task for task in entries if task.end_time]
+            by_month: Dict[str, List[TaskEntry]] = defaultdict(list)
+            for task in completed:
+                by_month[task.end_time[:7]].append(task)
+            self._completed = completed
+            self._completed_by_month = dict(by_month)
+            self._partitioned_entries = entries
+            self._partitioned_count = len(entries)
+        return self._completed, self._completed_by_month
+    
+    def _get_client(self) -> "gspread.Client":
         """Get or create the gspread client."""
         if self._client is None:
+            # Deferred: gspread and google-auth take ~200ms to import and
+            # are not needed by the haunts backend
+            import gspread
+            from google.oauth2.service_account import Credentials
+            
             scopes = [
                 'https://www.googleapis.com/auth/spreadsheets',
                 'https://www.googleapis.com/auth/drive.file'
@@ -532,6 +674,7 @@ class GoogleSheetsSync:
                 try:
                     self._client = gspread.oauth()
                 except Exception as e:
+                    from google.auth.exceptions import DefaultCredentialsError
                     raise DefaultCredentialsError(
                         "Failed to authenticate with Google Sheets. "
                         "Please provide credentials_path or set up OAuth. "
@@ -540,9 +683,11 @@ class GoogleSheetsSync:
         
         return self._client
     
-    def _get_spreadsheet(self) -> gspread.Spreadsheet:
+    def _get_spreadsheet(self) -> "gspread.Spreadsheet":
         """Get or open the configured spreadsheet."""
         if self._spreadsheet is None:
+            import gspread
+            
             client = self._get_client()
             try:
                 self._spreadsheet = client.open_by_key(self.config.sheet_document_id)
@@ -554,52 +699,87 @@ class GoogleSheetsSync:
         
         return self._spreadsheet
     
-    def _get_or_create_sheet(self, sheet_name: str) -> gspread.Worksheet:
+    def _get_or_create_sheet(self, sheet_name: str) -> "gspread.Worksheet":
         """
         Get or create a worksheet by name.
         
+        All worksheet handles are fetched with a single metadata request on
+        first use and kept for the lifetime of this instance, so later
+        lookups need no API call.
+        
         Args:
             sheet_name: Name of the worksheet (e.g., "October")
         
         Returns:
             The worksheet object
         """
-        spreadsheet = self._get_spreadsheet()
+        if self._worksheets is None:
+            self._worksheets = {ws.title: ws for ws in self._get_spreadsheet().worksheets()}
         
-        try:
-            worksheet = spreadsheet.worksheet(sheet_name)
-        except gspread.exceptions.WorksheetNotFound:
-            # Create new worksheet with headers
-            worksheet = spreadsheet.add_worksheet(
-                title=sheet_name,
-                rows=100,
-                cols=9
-            )
-            # Add header row
-            headers = [
-                "Date", "Start time", "Project", "Activity", 
-                "Details", "Spent", "Event id", "Link", "Action"
-            ]
-            worksheet.update('A1:I1', [headers])
+        worksheet = self._worksheets.get(sheet_name)
+        if worksheet is not None:
+            return worksheet
         
+        worksheet = self._add_sheet_with_headers(sheet_name)
+        self._worksheets[sheet_name] = worksheet
         return worksheet
     
+    def _add_sheet_with_headers(self, sheet_name: str) -> "gspread.Worksheet":
+        """
+        Create a worksheet and write its header row.
+        
+        On gspread 6+ both happen in one batch_update: the new sheet is
+        given an explicit sheetId so the header cells can reference it in
+        the same request. Older gspread uses add_worksheet plus update.
+        
+        Args:
+            sheet_name: Name of the worksheet (e.g., "October")
+        
+        Returns:
+            The new worksheet object
+        """
+        import gspread
+        
+        spreadsheet = self._get_spreadsheet()
+        if int(gspread.__version__.split('.')[0]) < 6:
+            # gspread 5 has no public way to wrap the raw addSheet reply
+            worksheet = spreadsheet.add_worksheet(title=sheet_name, rows=100, cols=len(HEADERS))
+            worksheet.update('A1:I1', [list(HEADERS)])
+            return worksheet
+        
+        # Any id not used by an existing tab will do
+        sheet_id = max((ws.id for ws in self._worksheets.values()), default=0) + 1
+        response = spreadsheet.batch_update({'requests': [
+            {'addSheet': {'properties': {
+                'sheetId': sheet_id,
+                'title': sheet_name,
+                'gridProperties': {'rowCount': 100, 'columnCount': len(HEADERS)}
+            }}},
+            {'updateCells': {
+                'start': {'sheetId': sheet_id, 'rowIndex': 0, 'columnIndex': 0},
+                'rows': [{'values': [{'userEnteredValue': {'stringValue': h}} for h in HEADERS]}],
+                'fields': 'userEnteredValue'
+            }}
+        ]})
+        properties = response['replies'][0]['addSheet']['properties']
+        return gspread.Worksheet(spreadsheet, properties, spreadsheet.id, spreadsheet.client)
+    
     def _format_date(self, timestamp_str: str) -> str:
-        """Format ISO timestamp string to DD/MM/YYYY."""
-        dt = datetime.fromisoformat(timestamp_str)
-        return dt.strftime("%d/%m/%Y")
+        """Format ISO timestamp string (YYYY-MM-DDTHH:MM...) to DD/MM/YYYY."""
+        assert len(timestamp_str) >= 16, f"Malformed ISO timestamp: {timestamp_str!r}"
+        return f"{timestamp_str[8:10]}/{timestamp_str[5:7]}/{timestamp_str[:4]}"
     
     def _format_time(self, timestamp_str: str) -> str:
-        """Format ISO timestamp string to HH:MM."""
-        dt = datetime.fromisoformat(timestamp_str)
-        return dt.strftime("%H:%M")
+        """Format ISO timestamp string (YYYY-MM-DDTHH:MM...) to HH:MM."""
+        assert len(timestamp_str) >= 16, f"Malformed ISO timestamp: {timestamp_str!r}"
+        return timestamp_str[11:16]
     
     def _calculate_hours(self, task: TaskEntry) -> float:
         """Calculate task duration in hours from ISO timestamp strings."""
         if task.end_time and task.start_time:
-            start_dt = datetime.fromisoformat(task.start_time)
-            end_dt = datetime.fromisoformat(task.end_time)
-            duration_seconds = (end_dt - start_dt).total_seconds()
+            if task.duration_seconds is not None:
+                return task.duration_seconds / 3600
+            duration_seconds = (task.end_dt - task.start_dt).total_seconds()
             return duration_seconds / 3600
         return 0.0
     
@@ -622,14 +802,23 @@ class GoogleSheetsSync:
             return
         
         # Fall back to gspread backend
-        # Parse end_time to get the date for sheet selection
-        end_dt = datetime.fromisoformat(task.end_time)
-        sheet_date = end_dt.strftime("%Y-%m-%d")
-        
-        # Get the appropriate monthly sheet
-        sheet_name = self.config.get_sheet_name_for_date(sheet_date)
+        # Get the appropriate monthly sheet from the end date (YYYY-MM-DD prefix)
+        sheet_name = self.config.get_sheet_name_for_date(task.end_time[:10])
         worksheet = self._get_or_create_sheet(sheet_name)
         
+        # Append to worksheet
+        worksheet.append_row(self._build_row(task), value_input_option='USER_ENTERED')
+    
+    def _build_row(self, task: TaskEntry) -> List[str]:
+        """
+        Build the worksheet row for a completed task.
+        
+        Args:
+            task: The completed task entry
+        
+        Returns:
+            Row values in sheet column order
+        """
         # Calculate and format hours
         hours = self._calculate_hours(task)
         formatted_hours = format_hours(
@@ -637,21 +826,17 @@ class GoogleSheetsSync:
             self.config.google_sheets.round_hours
         )
         
-        # Prepare row data
-        row_data = [
+        return [
             self._format_date(task.end_time),
             self._format_time(task.start_time),
             task.project or "",
             task.task,  # Use task.task for the task name
-            task.description or "",
+            "",  # Details (TaskEntry doesn't have description field)
             formatted_hours,
             "",  # Event id (filled by haunts)
             "",  # Link (filled by haunts)
             ""   # Action (used by haunts)
         ]
-        
-        # Append to worksheet
-        worksheet.append_row(row_data, value_input_option='USER_ENTERED')
     
     def sync_tasks(self, tasks: List[TaskEntry], filter_date: Optional[date] = None) -> int:
         """
@@ -667,22 +852,44 @@ class GoogleSheetsSync:
         Raises:
             ValueError: If any task is not completed
         """
-        synced_count = 0
+        selected = []
         
         for task in tasks:
             if not task.end_time:
                 continue  # Skip incomplete tasks
             
             # Filter by date if specified
-            if filter_date:
-                end_dt = datetime.fromisoformat(task.end_time)
-                if end_dt.date() != filter_date:
-                    continue
+            if filter_date and task.end_dt.date() != filter_date:
+                continue
             
-            self.sync_task(task)
-            synced_count += 1
+            selected.append((task, self.config.get_sheet_name_for_date(task.end_time[:10])))
         
-        return synced_count
+        return self._sync_prepared(selected)
+    
+    def _sync_prepared(self, prepared: List[Tuple[TaskEntry, str]]) -> int:
+        """
+        Write completed tasks whose monthly sheet names are already known.
+        
+        Args:
+            prepared: (task, sheet_name) pairs for completed tasks
+        
+        Returns:
+            Number of tasks synced
+        """
+        # HauntsAdapter writes all rows in a single request
+        if self._adapter:
+            return self._adapter.append_tasks([task for task, _ in prepared])
+        
+        # gspread backend: one append_rows call per monthly sheet
+        rows_by_sheet: Dict[str, List[List[str]]] = defaultdict(list)
+        for task, sheet_name in prepared:
+            rows_by_sheet[sheet_name].append(self._build_row(task))
+        
+        for sheet_name, rows in rows_by_sheet.items():
+            worksheet = self._get_or_create_sheet(sheet_name)
+            worksheet.append_rows(rows, value_input_option='USER_ENTERED')
+        
+        return len(prepared)
     
     def test_connection(self) -> bool:
         """
@@ -714,27 +921,26 @@ class GoogleSheetsSync:
         Returns:
             Dictionary with sync results (count, sheets_updated)
         """
-        from ..managers.worklog import WorkLog
-        
-        worklog = WorkLog(config=self.config)
+        _, by_month = self._get_completed()
         today = datetime.now().date()
         
-        # Filter completed tasks from today
+        # Filter this month's completed tasks by ISO date prefix (no parsing)
+        prefix = today.isoformat() + "T"
         completed_tasks = [
-            task for task in worklog.data.entries
-            if task.end_time and datetime.fromisoformat(task.end_time).date() == today
+            task for task in by_month.get(prefix[:7], [])
+            if task.end_time.startswith(prefix)
         ]
         
         if dry_run:
             return {
                 'count': len(completed_tasks),
-                'sheets_updated': [self.config.get_sheet_name_for_date(today.strftime("%Y-%m-%d"))]
+                'sheets_updated': [self.config.get_sheet_name_for_date(today.isoformat())]
             }
         
-        synced = self.sync_tasks(completed_tasks, filter_date=today)
+        synced = self.sync_tasks(completed_tasks)
         return {
             'count': synced,
-            'sheets_updated': [self.config.get_sheet_name_for_date(today.strftime("%Y-%m-%d"))]
+            'sheets_updated': [self.config.get_sheet_name_for_date(today.isoformat())]
         }
     
     def sync_monthly(self, dry_run: bool = False) -> dict:
@@ -747,30 +953,21 @@ class GoogleSheetsSync:
         Returns:
             Dictionary with sync results (count, sheets_updated)
         """
-        from ..managers.worklog import WorkLog
-        
-        worklog = WorkLog(config=self.config)
+        _, by_month = self._get_completed()
         now = datetime.now()
-        current_month = now.month
-        current_year = now.year
         
-        # Filter completed tasks from current month
-        completed_tasks = [
-            task for task in worklog.data.entries
-            if task.end_time and 
-            datetime.fromisoformat(task.end_time).month == current_month and
-            datetime.fromisoformat(task.end_time).year == current_year
-        ]
+        # Completed tasks from current month, already grouped by YYYY-MM
+        completed_tasks = list(by_month.get(f"{now.year:04d}-{now.month:02d}", []))
         
         if dry_run:
-            sheet_name = self.config.get_sheet_name_for_date(now.strftime("%Y-%m-%d"))
+            sheet_name = self.config.get_sheet_name_for_date(now.date().isoformat())
             return {
                 'count': len(completed_tasks),
                 'sheets_updated': [sheet_name]
             }
         
         synced = self.sync_tasks(completed_tasks)
-        sheet_name = self.config.get_sheet_name_for_date(now.strftime("%Y-%m-%d"))
+        sheet_name = self.config.get_sheet_name_for_date(now.date().isoformat())
         return {
             'count': synced,
             'sheets_updated': [sheet_name]
@@ -790,19 +987,21 @@ class GoogleSheetsSync:
         Raises:
             ValueError: If date format is invalid
         """
-        from ..managers.worklog import WorkLog
-        
         try:
             target_date = datetime.strptime(date_str, "%Y-%m-%d").date()
         except ValueError as e:
             raise ValueError(f"Invalid date format. Use YYYY-MM-DD: {e}")
         
-        worklog = WorkLog(config=self.config)
+        _, by_month = self._get_completed()
+        
+        # Normalized form: strptime also accepts unpadded input like 2025-1-5
+        date_str = target_date.isoformat()
         
-        # Filter completed tasks from target date
+        # Filter completed tasks from target date by ISO date prefix
+        prefix = date_str + "T"
         completed_tasks = [
-            task for task in worklog.data.entries
-            if task.end_time and datetime.fromisoformat(task.end_time).date() == target_date
+            task for task in by_month.get(prefix[:7], [])
+            if task.end_time.startswith(prefix)
         ]
         
         if dry_run:
@@ -811,7 +1010,7 @@ class GoogleSheetsSync:
                 'sheets_updated': [self.config.get_sheet_name_for_date(date_str)]
             }
         
-        synced = self.sync_tasks(completed_tasks, filter_date=target_date)
+        synced = self.sync_tasks(completed_tasks)
         return {
             'count': synced,
             'sheets_updated': [self.config.get_sheet_name_for_date(date_str)]
@@ -827,38 +1026,22 @@ class GoogleSheetsSync:
         Returns:
             Dictionary with sync results (count, sheets_updated)
         """
-        from ..managers.worklog import WorkLog
+        completed, by_month = self._get_completed()
         
-        worklog = WorkLog(config=self.config)
-        
-        # Get all completed tasks
-        completed_tasks = [
-            task for task in worklog.data.entries
-            if task.end_time
-        ]
+        # One name lookup per distinct month rather than per task
+        sheet_by_month = {month: self.config.get_sheet_name_for_date(f"{month}-01") for month in by_month}
+        sheets_updated = set(sheet_by_month.values())
         
         if dry_run:
-            # Get unique months from completed tasks
-            sheets_updated = list(set(
-                self.config.get_sheet_name_for_date(
-                    datetime.fromisoformat(task.end_time).strftime("%Y-%m-%d")
-                )
-                for task in completed_tasks
-            ))
             return {
-                'count': len(completed_tasks),
+                'count': len(completed),
                 'sheets_updated': sorted(sheets_updated)
             }
         
-        synced = self.sync_tasks(completed_tasks)
+        # Pair each completed task with its monthly sheet, in worklog order
+        prepared = [(task, sheet_by_month[task.end_time[:7]]) for task in completed]
         
-        # Get unique months from synced tasks
-        sheets_updated = list(set(
-            self.config.get_sheet_name_for_date(
-                datetime.fromisoformat(task.end_time).strftime("%Y-%m-%d")
-            )
-            for task in completed_tasks
-        ))
+        synced = self._sync_prepared(prepared)
         
         return {
             'count': synced,
@@ -5,6 +5,32 @@ Provides common utility functions and decorators used throughout
 the worklog system.
 """
 
-from .decorators import requires_data, auto_save
+from .._lazy import lazy_exports
 
-__all__ = ['requires_data', 'auto_save']
\ No newline at end of file
+# Resolved on first access so that importing one submodule (e.g. the
+# console for --help) does not load JSON backends and the rest.
+_LAZY_EXPORTS = {
+    'requires_data': '.decorators',
+    'auto_save': '.decorators',
+    'get_console': '.console',
+    'atomic_write_bytes': '.files',
+    'atomic_write_text': '.files',
+    'json_dumps': '.jsonio',
+    'json_dumps_line': '.jsonio',
+    'json_loads': '.jsonio',
+    'parse_iso': '.timestamps',
+    'format_datetime': '.timestamps',
+    'format_display_time': '.timestamps',
+    'format_duration': '.timestamps',
+    'parse_duration': '.timestamps',
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS, globals())
+
+
+__all__ = [
+    'requires_data', 'auto_save', 'get_console',
+    'atomic_write_bytes', 'atomic_write_text',
+    'json_dumps', 'json_dumps_line', 'json_loads',
+    'parse_iso', 'format_datetime', 'format_display_time', 'format_duration', 'parse_duration'
+]
\ No newline at end of file
@@ -0,0 +1,97 @@
+"""
+Shared Rich console for WorkLog CLI Tool.
+
+This module provides a lazily constructed Rich console so that importing
+the worklog package does not pay for loading Rich until something is
+actually printed. When stdout is not a terminal, plain strings are written
+directly with their markup stripped, so piped and scripted use never loads
+Rich at all.
+"""
+
+import re
+import sys
+from typing import Any, Optional, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+_console: Optional["Console"] = None
+
+
+def get_console() -> "Console":
+    """
+    Get the shared Rich console, creating it on first use.
+
+    Returns:
+        Console: Process-wide Rich console instance
+    """
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
+# Rich markup tags such as [cyan] or [/bold yellow]; same shape Rich parses
+_MARKUP_TAG_RE = re.compile(r'(?<!\\)\[[a-z#/@][^\[]*?\]')
+
+
+class _PlainConsole:
+    """
+    Minimal Console.print replacement for non-terminal output.
+
+    Without a terminal Rich emits no colors anyway, so plain strings only
+    need their markup tags removed. Anything else (e.g. a Syntax
+    renderable) is still handed to the Rich console.
+    """
+
+    __slots__ = ()
+
+    def print(self, *objects: Any, sep: str = " ", end: str = "\n", markup: bool = True, **kwargs: Any) -> None:
+        if not all(isinstance(obj, str) for obj in objects):
+            get_console().print(*objects, sep=sep, end=end, markup=markup, **kwargs)
+            return
+        text = sep.join(objects)
+        if markup:
+            text = _MARKUP_TAG_RE.sub('', text)
+        sys.stdout.write(text + end)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_console(), name)
+
+
+_output: Optional[Union["Console", _PlainConsole]] = None
+
+
+def _get_output() -> Union["Console", _PlainConsole]:
+    """
+    Get the console that console.print() should go to.
+
+    Decided once per process: the Rich console for an interactive terminal,
+    the plain writer otherwise.
+    """
+    global _output
+    if _output is None:
+        if sys.stdout is not None and sys.stdout.isatty():
+            _output = get_console()
+        else:
+            _output = _PlainConsole()
+    return _output
+
+
+class _LazyConsole:
+    """
+    Stand-in for a module-level console that defers Rich import.
+
+    Attribute access is forwarded to the terminal's Rich console or the
+    plain writer, so existing ``console.print(...)`` call sites keep
+    working unchanged.
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(_get_output(), name)
+
+
+console = _LazyConsole()
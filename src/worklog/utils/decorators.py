@@ -41,6 +41,8 @@ def auto_save(func):
     Calls _save_data() after successful execution of the decorated method
     if the WorkLogConfig.auto_save setting is enabled. Provides automatic
     persistence without explicit save calls throughout the codebase.
+    Saving is skipped while the instance has _save_deferred set, so that a
+    batch of nested calls is saved once by the outermost method.
     
     Args:
         func: Method to decorate
@@ -51,7 +53,9 @@ def auto_save(func):
     @wraps(func)
     def wrapper(self, *args, **kwargs):
         result = func(self, *args, **kwargs)
-        if hasattr(self, 'config') and self.config.auto_save:
+        if getattr(self, '_save_deferred', False):
+            logger.debug(f"Deferring save after {func.__name__}")
+        elif hasattr(self, 'config') and self.config.auto_save:
             logger.debug(f"Auto-saving after {func.__name__}")
             self._save_data()
         return result
@@ -0,0 +1,45 @@
+"""
+File helpers for WorkLog CLI Tool.
+
+Whole-file rewrites go through a temporary file that is renamed over the
+target, so readers and crashes only ever see the old or the new contents.
+"""
+
+import os
+from pathlib import Path
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """
+    Replace a file's contents atomically.
+    
+    Writes to a sibling temporary file with a single write() and renames it
+    over the target with os.replace(). No fsync is issued; the rename alone
+    guarantees the file is never seen half-written.
+    
+    Args:
+        path: File to write
+        data: Complete new file contents
+        
+    Raises:
+        OSError: If the file cannot be written; the temporary file is removed
+    """
+    temp_file = path.with_name(path.name + '.tmp')
+    try:
+        with open(temp_file, 'wb') as f:
+            f.write(data)
+        os.replace(temp_file, path)
+    except BaseException:
+        temp_file.unlink(missing_ok=True)
+        raise
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    """
+    Replace a file's contents atomically with UTF-8 text.
+    
+    Args:
+        path: File to write
+        text: Complete new file contents
+    """
+    atomic_write_bytes(path, text.encode('utf-8'))
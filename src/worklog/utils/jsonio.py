@@ -0,0 +1,72 @@
+"""
+JSON encoding helpers for WorkLog CLI Tool.
+
+Uses orjson when it is installed (the ``fast`` extra) and the standard
+library otherwise. Both paths produce byte-identical output for the data
+the worklog stores.
+"""
+
+import json
+from typing import Any, Callable, Optional
+
+# orjson is optional - use it for faster load/save when installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def json_loads(raw: bytes) -> Any:
+    """
+    Decode JSON bytes, using orjson when available.
+    
+    Args:
+        raw: UTF-8 encoded JSON document
+        
+    Returns:
+        Any: Decoded Python object
+        
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def json_dumps(obj: Any, pretty: bool = False, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """
+    Encode an object as UTF-8 JSON bytes, using orjson when available.
+    
+    Both code paths produce the same layout (compact or 2-space indent,
+    non-ASCII kept as-is).
+    
+    Args:
+        obj: JSON-serializable object
+        pretty: Indent the output for human readers
+        default: Optional fallback for objects JSON cannot encode natively
+        
+    Returns:
+        bytes: Encoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=default).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'), default=default).encode('utf-8')
+
+
+def json_dumps_line(obj: Any) -> bytes:
+    """
+    Encode an object as a single compact JSON line (newline-terminated).
+    
+    Args:
+        obj: JSON-serializable object
+        
+    Returns:
+        bytes: Encoded JSON record followed by a newline
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
@@ -0,0 +1,96 @@
+"""
+Timestamp helpers for WorkLog CLI Tool.
+
+The worklog stores every time as an ISO 8601 string, and the same few
+strings (active task starts, "now", entry boundaries) are parsed over and
+over while listing and formatting. These helpers memoize that parsing and
+format the default display layout without going through strftime.
+"""
+
+from datetime import datetime
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
+def parse_iso(timestamp: str) -> datetime:
+    """
+    Parse an ISO timestamp string, memoizing the result.
+
+    Safe to cache because the input strings are immutable and datetime
+    objects are never mutated in place.
+
+    Args:
+        timestamp: ISO format timestamp string
+
+    Returns:
+        datetime: Parsed datetime
+
+    Raises:
+        ValueError: If the string is not a valid ISO timestamp
+    """
+    return datetime.fromisoformat(timestamp)
+
+
+def format_datetime(dt: datetime, fmt: str) -> str:
+    """
+    Format a datetime, skipping strftime for the default display formats.
+    
+    Args:
+        dt: Datetime to format
+        fmt: strftime-style format string
+        
+    Returns:
+        str: Formatted datetime
+    """
+    if fmt == "%Y-%m-%d %H:%M:%S":
+        return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+    if fmt == "%Y-%m-%d":
+        return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+    return dt.strftime(fmt)
+
+
+@lru_cache(maxsize=1024)
+def format_display_time(timestamp: str, fmt: str) -> str:
+    """
+    Format an ISO timestamp string for display, memoizing the result.
+    
+    Args:
+        timestamp: ISO format timestamp string
+        fmt: strftime-style display format
+        
+    Returns:
+        str: Formatted timestamp for display
+    """
+    return format_datetime(parse_iso(timestamp), fmt)
+
+
+def format_duration(total_seconds: int) -> str:
+    """
+    Format a number of seconds as an HH:MM:SS duration string.
+    
+    Args:
+        total_seconds: Non-negative duration in whole seconds
+        
+    Returns:
+        str: Duration in HH:MM:SS format (hours may exceed two digits)
+    """
+    hours, remainder = divmod(total_seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+
+def parse_duration(duration: str) -> int:
+    """
+    Parse an HH:MM:SS duration string into whole seconds.
+    
+    Args:
+        duration: Duration in HH:MM:SS format
+        
+    Returns:
+        int: Duration in seconds
+        
+    Raises:
+        ValueError: If the string is not in HH:MM:SS format
+    """
+    hours, minutes, seconds = duration.split(':')
+    return int(hours) * 3600 + int(minutes) * 60 + int(seconds)
@@ -5,10 +5,36 @@ This module provides centralized validation for all user inputs including
 dates, times, task names, and other data with consistent error messages.
 """
 
-from datetime import datetime
-from typing import Tuple
+import re
+from datetime import date, datetime
+from typing import Optional, Tuple
 from .config import WorkLogConfig
 
+# Structural check for zero-padded ISO dates (YYYY-MM-DD)
+_ISO_DATE_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+
+
+def _parse_hhmm(time_str: str) -> Optional[Tuple[int, int]]:
+    """
+    Parse a well-formed, in-range zero-padded HH:MM time by direct indexing.
+    
+    Args:
+        time_str: Candidate time string
+        
+    Returns:
+        Optional[Tuple[int, int]]: (hours, minutes), or None if the string needs
+        the full validate_time_format() treatment (other layouts or errors)
+    """
+    if len(time_str) != 5 or time_str[2] != ':' or not time_str.isascii():
+        return None
+    hh, mm = time_str[:2], time_str[3:]
+    if not (hh.isdigit() and mm.isdigit()):
+        return None
+    hours, minutes = int(hh), int(mm)
+    if hours > 23 or minutes > 59:
+        return None
+    return hours, minutes
+
 
 class WorkLogValidator:
     """
@@ -31,7 +57,11 @@ class WorkLogValidator:
             ValueError: If date format is invalid
         """
         try:
-            datetime.strptime(date_str, config.date_format)
+            if config.date_format == "%Y-%m-%d" and _ISO_DATE_RE.fullmatch(date_str):
+                # Fast path: C-level ISO parsing instead of strptime
+                date.fromisoformat(date_str)
+            else:
+                datetime.strptime(date_str, config.date_format)
         except ValueError:
             raise ValueError(f"Invalid date format: '{date_str}'. Expected format: {config.date_format}")
     
@@ -92,6 +122,11 @@ class WorkLogValidator:
         """
         datetime_str = datetime_str.strip()
         
+        # Fast path for the common "HH:MM" case
+        hhmm = _parse_hhmm(datetime_str)
+        if hhmm:
+            return datetime.now().replace(hour=hhmm[0], minute=hhmm[1], second=0, microsecond=0)
+        
         # Check if it contains a date (has space separator)
         if ' ' in datetime_str:
             # Format: YYYY-MM-DD HH:MM
@@ -103,26 +138,22 @@ class WorkLogValidator:
             
             # Validate date
             try:
-                date_obj = datetime.strptime(date_str, "%Y-%m-%d").date()
+                if _ISO_DATE_RE.fullmatch(date_str):
+                    date_obj = date.fromisoformat(date_str)
+                else:
+                    date_obj = datetime.strptime(date_str, "%Y-%m-%d").date()
             except ValueError:
                 raise ValueError(f"Invalid date format '{date_str}': Expected YYYY-MM-DD")
             
             # Validate time
-            hours, minutes = WorkLogValidator.validate_time_format(time_str)
+            hours, minutes = _parse_hhmm(time_str) or WorkLogValidator.validate_time_format(time_str)
             
-            return datetime.combine(
-                date_obj,
-                datetime.min.time().replace(hour=hours, minute=minutes)
-            )
+            return datetime(date_obj.year, date_obj.month, date_obj.day, hours, minutes)
         else:
             # Format: HH:MM (use today's date)
             hours, minutes = WorkLogValidator.validate_time_format(datetime_str)
             
-            today = datetime.now().date()
-            return datetime.combine(
-                today,
-                datetime.min.time().replace(hour=hours, minute=minutes)
-            )
+            return datetime.now().replace(hour=hours, minute=minutes, second=0, microsecond=0)
     
     @staticmethod
     def validate_time_sequence(start_time: str, stop_time: str) -> None:
@@ -0,0 +1,12 @@
+"""
+Shared pytest fixtures for the WorkLog test suite.
+"""
+
+import pytest
+
+
+@pytest.fixture
+def isolated_home(tmp_path, monkeypatch):
+    """Point HOME at a fresh temporary directory for the duration of a test."""
+    monkeypatch.setenv('HOME', str(tmp_path))
+    return tmp_path
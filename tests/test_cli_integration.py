@@ -7,10 +7,9 @@ Tests are run using Typer's CliRunner for isolated testing.
 
 import re
 import unittest
-import tempfile
-import shutil
-from pathlib import Path
 from unittest.mock import patch
+
+import pytest
 from typer.testing import CliRunner
 
 from src.worklog.cli.commands import app
@@ -25,6 +24,16 @@ def strip_ansi(text: str) -> str:
 class TestCLICommands(unittest.TestCase):
     """Test all CLI commands with their options."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Share one CliRunner; it holds no per-invocation state."""
+        cls.runner = CliRunner()
+    
+    @pytest.fixture(autouse=True)
+    def _home(self, isolated_home):
+        """Run each test with HOME in its own tmp_path, restored even on failure."""
+        self.test_dir = isolated_home
+    
     def setUp(self):
         """Set up test environment with isolated home directory."""
         # Reset worklog singleton first
@@ -35,10 +44,8 @@ class TestCLICommands(unittest.TestCase):
         if hasattr(self, 'config_patcher'):
             self.config_patcher.stop()
         
-        self.test_dir = tempfile.mkdtemp()
-        
-        # Ensure .worklog directory structure exists
-        worklog_dir = Path(self.test_dir) / '.worklog'
+        # Ensure .worklog directory structure exists (HOME is isolated by _home)
+        worklog_dir = self.test_dir / '.worklog'
         worklog_dir.mkdir(parents=True, exist_ok=True)
         (worklog_dir / 'daily').mkdir(parents=True, exist_ok=True)
         (worklog_dir / 'backups').mkdir(parents=True, exist_ok=True)
@@ -47,9 +54,6 @@ class TestCLICommands(unittest.TestCase):
         from src.worklog.config import WorkLogConfig
         self.config_patcher = patch.object(WorkLogConfig, 'worklog_dir', str(worklog_dir))
         self.config_patcher.start()
-        
-        # Create CliRunner
-        self.runner = CliRunner()
     
     def tearDown(self):
         """Clean up test environment."""
@@ -58,9 +62,6 @@ class TestCLICommands(unittest.TestCase):
         cmd_module._worklog_instance = None
         # Stop patch
         self.config_patcher.stop()
-        # Clean up test directory
-        if hasattr(self, 'test_dir') and Path(self.test_dir).exists():
-            shutil.rmtree(self.test_dir, ignore_errors=True)
     
     # ========================================================================
     # START Command Tests
@@ -407,30 +408,57 @@ class TestCLICommands(unittest.TestCase):
         result = self.runner.invoke(app, ["resume", "Nonexistent"])
         # Note: CLI currently returns success for resuming nonexistent task
         self.assertEqual(result.exit_code, 0)
+    
+    # ========================================================================
+    # Shared Instance Tests
+    # ========================================================================
+    
+    def test_worklog_instance_reloads_after_external_change(self):
+        """Test the cached WorkLog picks up changes saved by another process."""
+        import src.worklog.cli.commands as cmd_module
+        from src.worklog.managers.worklog import WorkLog
+        
+        self.runner.invoke(app, ["start", "Task A"])
+        worklog = cmd_module.get_worklog()
+        self.assertIn("Task A", worklog.data.active_tasks)
+        completed_before = sum(e.task == "Task A" for e in worklog.data.entries)
+        
+        # Simulate another drudge process ending the task
+        other = WorkLog(config=worklog.config)
+        self.assertTrue(other.end_task("Task A"))
+        
+        self.assertIs(cmd_module.get_worklog(), worklog)
+        self.assertNotIn("Task A", worklog.data.active_tasks)
+        self.assertEqual(sum(e.task == "Task A" for e in worklog.data.entries), completed_before + 1)
 
 
 class TestDataMigration(unittest.TestCase):
     """Test backward compatibility and data migration."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Share one CliRunner; it holds no per-invocation state."""
+        cls.runner = CliRunner()
+    
+    @pytest.fixture(autouse=True)
+    def _home(self, isolated_home):
+        """Run each test with HOME in its own tmp_path, restored even on failure."""
+        self.test_dir = isolated_home
+    
     def setUp(self):
         """Set up test environment."""
-        self.test_dir = tempfile.mkdtemp()
-        
         # Create .worklog directory
-        self.worklog_dir = Path(self.test_dir) / '.worklog'
+        self.worklog_dir = self.test_dir / '.worklog'
         self.worklog_dir.mkdir(parents=True, exist_ok=True)
         
         # Patch config to use test directory
         from src.worklog.config import WorkLogConfig
         self.config_patcher = patch.object(WorkLogConfig, 'worklog_dir', str(self.worklog_dir))
         self.config_patcher.start()
-        
-        self.runner = CliRunner()
     
     def tearDown(self):
         """Clean up."""
         self.config_patcher.stop()
-        shutil.rmtree(self.test_dir, ignore_errors=True)
     
     def test_load_old_format_without_project(self):
         """Test loading worklog.json from old version (without project field)."""
@@ -519,5 +547,61 @@ class TestDataMigration(unittest.TestCase):
         self.assertEqual(result.exit_code, 0)
 
 
+class TestFastDispatch(unittest.TestCase):
+    """Test the argparse fast path used by the console entry point."""
+    
+    def _run(self, argv, worklog=None):
+        """Run fast.main() with argv, returning (exit code, mocked WorkLog, mocked Typer main)."""
+        from unittest.mock import MagicMock
+        from src.worklog.cli import fast
+        
+        worklog = worklog or MagicMock()
+        worklog.config.google_sheets.auto_sync = False
+        with patch.object(fast, '_load_worklog', return_value=worklog), \
+             patch.object(fast, 'setup_logging'), \
+             patch('src.worklog.cli.commands.main') as typer_main, \
+             patch('sys.argv', ['drudge', *argv]):
+            try:
+                fast.main()
+                exit_code = None
+            except SystemExit as e:
+                exit_code = e.code
+        return exit_code, worklog, typer_main
+    
+    def test_start_options_are_parsed(self):
+        """Test start options map onto the same WorkLog call as the Typer command."""
+        exit_code, worklog, typer_main = self._run(["start", "Task A", "-t", "09:30", "--project", "Web", "-p"])
+        
+        self.assertEqual(exit_code, 0)
+        typer_main.assert_not_called()
+        worklog.start_task.assert_called_once_with("Task A", custom_time="09:30", force=False,
+                                                   parallel=True, project="Web")
+    
+    def test_end_all_includes_paused(self):
+        """Test end --all ends active and paused tasks."""
+        exit_code, worklog, _ = self._run(["end", "--all"])
+        
+        self.assertEqual(exit_code, 0)
+        worklog.end_all_tasks.assert_called_once_with(custom_time=None, include_paused=True)
+    
+    def test_failed_command_exits_nonzero(self):
+        """Test a failing manager call gives exit code 1."""
+        from unittest.mock import MagicMock
+        worklog = MagicMock()
+        worklog.pause_task.return_value = False
+        exit_code, _, _ = self._run(["pause", "Task A", "--time", "12:00"], worklog=worklog)
+        
+        worklog.pause_task.assert_called_once_with("Task A", custom_time="12:00")
+        self.assertEqual(exit_code, 1)
+    
+    def test_falls_back_to_typer(self):
+        """Test help, unknown commands and invalid options go to the Typer app."""
+        for argv in (["--help"], ["start", "--help"], ["daily"], ["recent", "--limit", "x"], ["pause"]):
+            with self.subTest(argv=argv):
+                exit_code, worklog, typer_main = self._run(argv)
+                typer_main.assert_called_once()
+                self.assertIsNone(exit_code)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -15,7 +15,9 @@ from pathlib import Path
 from src.worklog.sync.sheets import (
     round_hours,
     format_hours,
-    GoogleSheetsSync
+    GoogleSheetsSync,
+    HauntsAdapter,
+    HEADERS
 )
 from src.worklog.config import WorkLogConfig, GoogleSheetsConfig
 from src.worklog.models import TaskEntry
@@ -46,6 +48,22 @@ class TestHoursFormatting:
         assert round_hours(2.5, 1.0) == 2.0   # 2h 30m → 2h 0m (banker's rounding)
         assert round_hours(2.6, 1.0) == 3.0   # 2h 36m → 3h 0m
     
+    def test_round_hours_is_exact_multiple(self):
+        """Test rounded hours are exact multiples of the increment, ties to even."""
+        for increment in (0.25, 0.5, 1.0):
+            for minutes in range(0, 24 * 60, 7):
+                rounded = round_hours(minutes / 60, increment)
+                assert (rounded / increment).is_integer()
+                assert abs(rounded - minutes / 60) <= increment / 2
+        assert round_hours(0.375, 0.25) == 0.5   # 1.5 steps → 2 (even)
+        assert round_hours(0.625, 0.25) == 0.5   # 2.5 steps → 2 (even)
+    
+    def test_round_hours_rounds_once(self):
+        """Test hours are rounded once to the increment, not via quarter hours first."""
+        # Rounding to quarters first would give 9.8 → 10 quarters (2.5h) → 3h
+        assert round_hours(2.45, 1.0) == 2.0   # 2h 27m → 2h 0m
+        assert round_hours(2.45, 0.5) == 2.5   # 2h 27m → 2h 30m
+    
     def test_format_hours_quarter_increment(self):
         """Test formatting with 0.25 increment (2 decimal places)."""
         assert format_hours(2.2, 0.25) == "2,25"
@@ -100,7 +118,7 @@ class TestGoogleSheetsSyncMethods:
     
     def test_calculate_hours(self, mock_config, sample_task):
         """Test hours calculation from ISO timestamps."""
-        with patch('src.worklog.sync.sheets.Credentials'):
+        with patch('google.oauth2.service_account.Credentials'):
             sync = GoogleSheetsSync(mock_config)
             hours = sync._calculate_hours(sample_task)
             assert hours == 2.5  # 2 hours 30 minutes
@@ -112,25 +130,32 @@ class TestGoogleSheetsSyncMethods:
             start_time="2025-10-05T09:00:00",
             end_time=None
         )
-        with patch('src.worklog.sync.sheets.Credentials'):
+        with patch('google.oauth2.service_account.Credentials'):
             sync = GoogleSheetsSync(mock_config)
             hours = sync._calculate_hours(task)
             assert hours == 0.0
     
     def test_format_date(self, mock_config, sample_task):
         """Test date formatting to DD/MM/YYYY."""
-        with patch('src.worklog.sync.sheets.Credentials'):
+        with patch('google.oauth2.service_account.Credentials'):
             sync = GoogleSheetsSync(mock_config)
             formatted = sync._format_date(sample_task.end_time)
             assert formatted == "05/10/2025"
     
     def test_format_time(self, mock_config, sample_task):
         """Test time formatting to HH:MM."""
-        with patch('src.worklog.sync.sheets.Credentials'):
+        with patch('google.oauth2.service_account.Credentials'):
             sync = GoogleSheetsSync(mock_config)
             formatted = sync._format_time(sample_task.start_time)
             assert formatted == "09:00"
     
+    def test_format_date_time_with_microseconds(self, mock_config):
+        """Test formatting slices ISO timestamps that carry microseconds."""
+        with patch('google.oauth2.service_account.Credentials'):
+            sync = GoogleSheetsSync(mock_config)
+            assert sync._format_date("2025-01-31T23:59:58.123456") == "31/01/2025"
+            assert sync._format_time("2025-01-31T23:59:58.123456") == "23:59"
+    
     def test_sync_task_raises_without_end_time(self, mock_config):
         """Test that sync_task raises ValueError for incomplete tasks."""
         task = TaskEntry(
@@ -138,7 +163,7 @@ class TestGoogleSheetsSyncMethods:
             start_time="2025-10-05T09:00:00",
             end_time=None
         )
-        with patch('src.worklog.sync.sheets.Credentials'):
+        with patch('google.oauth2.service_account.Credentials'):
             sync = GoogleSheetsSync(mock_config)
             with pytest.raises(ValueError, match="Cannot sync task without end_time"):
                 sync.sync_task(task)
@@ -151,12 +176,93 @@ class TestGoogleSheetsSyncMethods:
             TaskEntry("Task 3", "2025-10-05T13:00:00", "2025-10-05T14:00:00", "01:00:00"),
         ]
         
-        with patch('src.worklog.sync.sheets.Credentials'):
+        with patch('google.oauth2.service_account.Credentials'):
             sync = GoogleSheetsSync(mock_config)
-            with patch.object(sync, 'sync_task'):
+            with patch.object(sync, '_get_or_create_sheet') as get_sheet:
                 count = sync.sync_tasks(tasks)
                 # Should sync only the 2 completed tasks
                 assert count == 2
+                rows = get_sheet.return_value.append_rows.call_args.args[0]
+                assert [row[3] for row in rows] == ["Task 1", "Task 3"]
+    
+    def test_sync_tasks_appends_once_per_sheet(self, mock_config):
+        """Test rows are grouped into one append_rows call per monthly sheet."""
+        tasks = [
+            TaskEntry("Task 1", "2025-10-05T09:00:00", "2025-10-05T10:00:00", "01:00:00"),
+            TaskEntry("Task 2", "2025-11-03T09:00:00", "2025-11-03T10:30:00", "01:30:00"),
+            TaskEntry("Task 3", "2025-10-06T09:00:00", "2025-10-06T11:00:00", "02:00:00"),
+        ]
+        
+        with patch('google.oauth2.service_account.Credentials'):
+            sync = GoogleSheetsSync(mock_config)
+            with patch.object(sync, '_get_or_create_sheet') as get_sheet:
+                assert sync.sync_tasks(tasks) == 3
+        
+        assert [c.args[0] for c in get_sheet.call_args_list] == ["October", "November"]
+        appended = [c.args[0] for c in get_sheet.return_value.append_rows.call_args_list]
+        assert [[row[3] for row in rows] for rows in appended] == [["Task 1", "Task 3"], ["Task 2"]]
+        get_sheet.return_value.append_row.assert_not_called()
+    
+    def test_worksheet_handles_are_cached(self, mock_config):
+        """Test worksheets are listed once and created sheets are remembered."""
+        from gspread.http_client import HTTPClient
+        october = MagicMock()
+        october.title = "October"
+        october.id = 0
+        spreadsheet = MagicMock()
+        spreadsheet.client = MagicMock(spec=HTTPClient)
+        spreadsheet.worksheets.return_value = [october]
+        spreadsheet.batch_update.return_value = {'replies': [
+            {'addSheet': {'properties': {'sheetId': 1, 'title': "November", 'index': 1}}}, {}
+        ]}
+        
+        with patch('google.oauth2.service_account.Credentials'):
+            sync = GoogleSheetsSync(mock_config)
+            with patch.object(sync, '_get_spreadsheet', return_value=spreadsheet):
+                assert sync._get_or_create_sheet("October") is october
+                november = sync._get_or_create_sheet("November")
+                assert sync._get_or_create_sheet("November") is november
+                assert sync._get_or_create_sheet("October") is october
+        
+        spreadsheet.worksheets.assert_called_once()
+        spreadsheet.worksheet.assert_not_called()
+        assert (november.title, november.id) == ("November", 1)
+    
+    def test_new_sheet_and_headers_use_one_request(self, mock_config):
+        """Test a missing sheet is added together with its header row."""
+        from gspread.http_client import HTTPClient
+        spreadsheet = MagicMock()
+        spreadsheet.client = MagicMock(spec=HTTPClient)
+        spreadsheet.worksheets.return_value = []
+        spreadsheet.batch_update.return_value = {'replies': [
+            {'addSheet': {'properties': {'sheetId': 1, 'title': "November", 'index': 0}}}, {}
+        ]}
+        
+        with patch('google.oauth2.service_account.Credentials'):
+            sync = GoogleSheetsSync(mock_config)
+            with patch.object(sync, '_get_spreadsheet', return_value=spreadsheet):
+                sync._get_or_create_sheet("November")
+        
+        spreadsheet.batch_update.assert_called_once()
+        spreadsheet.add_worksheet.assert_not_called()
+        add_sheet, update_cells = spreadsheet.batch_update.call_args.args[0]['requests']
+        assert add_sheet['addSheet']['properties']['title'] == "November"
+        sheet_id = add_sheet['addSheet']['properties']['sheetId']
+        assert update_cells['updateCells']['start'] == {'sheetId': sheet_id, 'rowIndex': 0, 'columnIndex': 0}
+        cells = update_cells['updateCells']['rows'][0]['values']
+        assert [c['userEnteredValue']['stringValue'] for c in cells] == list(HEADERS)
+    
+    def test_import_defers_gspread(self):
+        """Test importing the sync module does not load gspread."""
+        import subprocess
+        import sys
+        code = (
+            "import sys, src.worklog.sync.sheets; "
+            "print('gspread' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                                cwd=Path(__file__).resolve().parent.parent)
+        assert result.stdout.strip() == "False", result.stderr
 
 
 class TestSyncConvenienceMethods:
@@ -191,7 +297,7 @@ class TestSyncConvenienceMethods:
         return data
     
     @patch('src.worklog.sync.sheets.datetime')
-    @patch('src.worklog.sync.sheets.Credentials')
+    @patch('google.oauth2.service_account.Credentials')
     @patch('src.worklog.managers.worklog.WorkLog')
     def test_sync_daily_dry_run(self, mock_worklog_class, mock_creds, mock_datetime, mock_config, mock_worklog_data):
         """Test sync_daily in dry-run mode."""
@@ -213,7 +319,7 @@ class TestSyncConvenienceMethods:
         assert 'October' in result['sheets_updated'][0]
     
     @patch('src.worklog.sync.sheets.datetime')
-    @patch('src.worklog.sync.sheets.Credentials')
+    @patch('google.oauth2.service_account.Credentials')
     @patch('src.worklog.managers.worklog.WorkLog')
     def test_sync_monthly_dry_run(self, mock_worklog_class, mock_creds, mock_datetime, mock_config, mock_worklog_data):
         """Test sync_monthly in dry-run mode."""
@@ -234,7 +340,7 @@ class TestSyncConvenienceMethods:
         assert result['count'] == 3
         assert result['sheets_updated'] == ['October']
     
-    @patch('src.worklog.sync.sheets.Credentials')
+    @patch('google.oauth2.service_account.Credentials')
     @patch('src.worklog.managers.worklog.WorkLog')
     def test_sync_date_dry_run(self, mock_worklog_class, mock_creds, mock_config, mock_worklog_data):
         """Test sync_date in dry-run mode."""
@@ -249,8 +355,11 @@ class TestSyncConvenienceMethods:
         # Should count only tasks from 2025-10-04 (1)
         assert result['count'] == 1
         assert 'October' in result['sheets_updated'][0]
+        
+        # Unpadded dates accepted by strptime select the same tasks
+        assert sync.sync_date("2025-10-4", dry_run=True) == result
     
-    @patch('src.worklog.sync.sheets.Credentials')
+    @patch('google.oauth2.service_account.Credentials')
     @patch('src.worklog.managers.worklog.WorkLog')
     def test_sync_all_dry_run(self, mock_worklog_class, mock_creds, mock_config, mock_worklog_data):
         """Test sync_all in dry-run mode."""
@@ -267,7 +376,59 @@ class TestSyncConvenienceMethods:
         # Should have sheets for both months (alphabetically sorted)
         assert result['sheets_updated'] == ['October', 'September']
     
-    @patch('src.worklog.sync.sheets.Credentials')
+    @patch('google.oauth2.service_account.Credentials')
+    @patch('src.worklog.managers.worklog.WorkLog')
+    def test_sync_all_writes_each_sheet_once(self, mock_worklog_class, mock_creds, mock_config, mock_worklog_data):
+        """Test sync_all appends every completed task grouped by monthly sheet."""
+        mock_worklog = Mock()
+        mock_worklog.data = mock_worklog_data
+        mock_worklog_class.return_value = mock_worklog
+        
+        sync = GoogleSheetsSync(mock_config)
+        with patch.object(sync, '_get_or_create_sheet') as get_sheet:
+            result = sync.sync_all()
+        
+        assert result == {'count': 4, 'sheets_updated': ['October', 'September']}
+        assert [c.args[0] for c in get_sheet.call_args_list] == ['October', 'September']
+        appended = [c.args[0] for c in get_sheet.return_value.append_rows.call_args_list]
+        assert [len(rows) for rows in appended] == [3, 1]
+    
+    @patch('google.oauth2.service_account.Credentials')
+    @patch('src.worklog.managers.worklog.WorkLog')
+    def test_worklog_is_loaded_once(self, mock_worklog_class, mock_creds, mock_config, mock_worklog_data):
+        """Test sync_* calls share one loaded WorkLog, or use the injected one."""
+        mock_worklog_class.return_value.data = mock_worklog_data
+        
+        sync = GoogleSheetsSync(mock_config)
+        sync.sync_all(dry_run=True)
+        sync.sync_date("2025-10-04", dry_run=True)
+        mock_worklog_class.assert_called_once_with(config=mock_config)
+        
+        injected = Mock()
+        injected.data = mock_worklog_data
+        sync = GoogleSheetsSync(mock_config, worklog=injected)
+        assert sync.sync_all(dry_run=True)['count'] == 4
+        mock_worklog_class.assert_called_once()
+    
+    @patch('google.oauth2.service_account.Credentials')
+    def test_completed_partition_is_reused(self, mock_creds, mock_config, mock_worklog_data):
+        """Test completed tasks are partitioned once and rebuilt when entries change."""
+        worklog = Mock()
+        worklog.data = mock_worklog_data
+        sync = GoogleSheetsSync(mock_config, worklog=worklog)
+        
+        completed, by_month = sync._get_completed()
+        assert len(completed) == 4
+        assert {month: len(tasks) for month, tasks in by_month.items()} == {'2025-10': 3, '2025-09': 1}
+        assert sync._get_completed()[0] is completed
+        
+        mock_worklog_data.entries.append(
+            TaskEntry("New Task", "2025-10-06T09:00:00", "2025-10-06T10:00:00", "01:00:00")
+        )
+        assert sync.sync_date("2025-10-06", dry_run=True)['count'] == 1
+        assert len(sync._get_completed()[1]['2025-10']) == 4
+    
+    @patch('google.oauth2.service_account.Credentials')
     def test_sync_date_invalid_format(self, mock_creds, mock_config):
         """Test that sync_date raises ValueError for invalid date format."""
         sync = GoogleSheetsSync(mock_config)
@@ -288,7 +449,7 @@ class TestConfigurationValidation:
         config.google_sheets.enabled = False
         
         # Should raise ValueError when trying to create instance with disabled sync
-        with patch('src.worklog.sync.sheets.Credentials'):
+        with patch('google.oauth2.service_account.Credentials'):
             with pytest.raises(ValueError, match="Google Sheets sync is not enabled"):
                 sync = GoogleSheetsSync(config)
     
@@ -299,10 +460,112 @@ class TestConfigurationValidation:
         config.google_sheets.use_haunts_format = False  # Disable haunts for unit test
         config.sheet_document_id = ""
         
-        with patch('src.worklog.sync.sheets.Credentials'):
+        with patch('google.oauth2.service_account.Credentials'):
             sync = GoogleSheetsSync(config)
             assert sync.config.sheet_document_id == ""
 
 
+class TestHauntsAdapterAppend:
+    """Test how HauntsAdapter finds the row to append to."""
+    
+    @pytest.fixture
+    def adapter(self, tmp_path):
+        """Create an adapter whose Sheets service is a mock."""
+        config = WorkLogConfig()
+        config.google_sheets.enabled = True
+        config.sheet_document_id = "test-sheet-id-123"
+        credentials = tmp_path / "credentials.json"
+        credentials.write_text("{}")
+        with patch.object(HauntsAdapter, '_init_with_service_account'):
+            adapter = HauntsAdapter(config, credentials_path=credentials)
+        adapter._sheet = MagicMock()
+        return adapter
+    
+    def _task(self, day, hour):
+        return TaskEntry(
+            task="Task",
+            start_time=f"2025-10-{day:02d}T{hour:02d}:00:00",
+            end_time=f"2025-10-{day:02d}T{hour + 1:02d}:00:00",
+            project="Project"
+        )
+    
+    def _written_ranges(self, adapter):
+        """Ranges sent through values().batchUpdate, one list per request."""
+        batch_update = adapter._sheet.values.return_value.batchUpdate
+        return [[d['range'] for d in c.kwargs['body']['data']] for c in batch_update.call_args_list]
+    
+    def test_sheets_client_is_built_on_first_use(self, tmp_path):
+        """Test the Sheets API client is not built until the adapter writes."""
+        config = WorkLogConfig()
+        config.google_sheets.enabled = True
+        credentials = tmp_path / "token.json"
+        credentials.write_text(
+            '{"token": "t", "refresh_token": "r", "token_uri": "https://oauth2.googleapis.com/token",'
+            ' "client_id": "id", "client_secret": "secret"}'
+        )
+        with patch('googleapiclient.discovery.build') as build:
+            adapter = HauntsAdapter(config, credentials_path=credentials)
+            build.assert_not_called()
+            
+            assert adapter._sheet is adapter._sheet
+            build.assert_called_once()
+            assert build.call_args.kwargs['credentials'].refresh_token == "r"
+    
+    def test_sync_tasks_sends_one_batch(self, adapter):
+        """Test several tasks are written in one request after one column read."""
+        values = adapter._sheet.values.return_value
+        values.get.return_value.execute.return_value = {'values': [["Date"], ["01/10/2025"]]}
+        
+        assert adapter.sync_tasks([self._task(3, 9), self._task(3, 11), self._task(4, 9)]) == 3
+        
+        assert values.get.call_count == 1
+        assert self._written_ranges(adapter) == [["October!A3:J3", "October!A4:J4", "October!A5:J5"]]
+        adapter._sheet.batchUpdate.assert_not_called()
+    
+    def test_failed_batch_is_retried_row_by_row(self, adapter, capsys):
+        """Test a failed batch falls back to per-row writes and counts only successes."""
+        values = adapter._sheet.values.return_value
+        values.get.return_value.execute.return_value = {'values': [["Date"]]}
+        # The batch fails, then the first and third rows succeed and the second fails again
+        values.batchUpdate.return_value.execute.side_effect = [
+            Exception("batch rejected"), {}, Exception("row rejected"), {}
+        ]
+        
+        assert adapter.sync_tasks([self._task(3, 9), self._task(3, 11), self._task(4, 9)]) == 2
+        
+        assert self._written_ranges(adapter) == [
+            ["October!A2:J2", "October!A3:J3", "October!A4:J4"],
+            ["October!A2:J2"],
+            ["October!A3:J3"],
+            ["October!A3:J3"],
+        ]
+        output = capsys.readouterr().out
+        assert "retrying one by one: batch rejected" in output
+        assert "Error syncing task 03/10/2025 11:00" in output
+        assert "row rejected" in output
+    
+    def test_next_line_is_remembered_between_syncs(self, adapter):
+        """Test later syncs into the same month continue below the previous row."""
+        values = adapter._sheet.values.return_value
+        values.get.return_value.execute.return_value = {'values': [["Date"]]}
+        
+        adapter.sync_task(self._task(3, 9))
+        adapter.sync_task(self._task(3, 11))
+        
+        assert values.get.call_count == 1
+        assert self._written_ranges(adapter) == [["October!A2:J2"], ["October!A3:J3"]]
+    
+    def test_missing_worksheet_is_created(self, adapter):
+        """Test a failed read creates the worksheet and appends after the header."""
+        values = adapter._sheet.values.return_value
+        values.get.return_value.execute.side_effect = Exception("Unable to parse range")
+        
+        adapter.sync_task(self._task(3, 9))
+        
+        adapter._sheet.batchUpdate.assert_called_once()
+        assert values.update.call_args.kwargs['range'] == "October!A1:J1"
+        assert self._written_ranges(adapter) == [["October!A2:J2"]]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -9,92 +9,136 @@ Test suite for the improved worklog tool with new architecture:
 - Enhanced error handling and logging
 """
 
-import unittest
-from unittest.mock import patch, mock_open, MagicMock, PropertyMock
+import pytest
+from unittest.mock import patch
 import json
-import tempfile
 import shutil
 from pathlib import Path
-from datetime import datetime, timedelta
-import os
-from typer.testing import CliRunner
+from datetime import datetime
 
 # Import the refactored worklog components
 from src.worklog import (
     TaskEntry, PausedTask, WorkLogData, WorkLog, WorkLogConfig, WorkLogValidator,
     BackupManager, DailyFileManager
 )
-from src.worklog.cli import app
-from rich.console import Console
 
-console = Console()
 
+class _FrozenDatetime(datetime):
+    """datetime stand-in built once per module; now() returns a fixed instant."""
 
-class TestWorkLogValidator(unittest.TestCase):
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2025, 10, 3, 15, 30, 45, tzinfo=tz)
+
+
+# Fixed validator inputs, shared by the parametrized tests below
+_VALID_TIMES = ("09:30", "14:45", "00:00", "23:59")
+_INVALID_TIMES = (
+    pytest.param("25:00", id="hour-25"),
+    pytest.param("12:60", id="minute-60"),
+    pytest.param("abc:def", id="letters"),
+    pytest.param("12:", id="no-minutes"),
+    pytest.param(":30", id="no-hours"),
+    pytest.param("", id="empty"),
+)
+_INVALID_DATES = (
+    pytest.param("31-12-2023", id="day-first"),
+    pytest.param("invalid-date", id="garbage"),
+    pytest.param("2023-02-30", id="impossible-day"),
+)
+_INVALID_TASK_NAMES = (
+    pytest.param("", id="empty"),
+    pytest.param("   ", id="whitespace"),
+    pytest.param("a" * 101, id="too-long"),
+)
+
+
+@pytest.fixture(scope="session")
+def validator():
+    """Shared WorkLogValidator; validation is stateless."""
+    return WorkLogValidator()
+
+
+@pytest.fixture(scope="session")
+def config():
+    """Shared default WorkLogConfig for tests that only read it."""
+    return WorkLogConfig()
+
+
+@pytest.fixture(scope="session")
+def shared_home(tmp_path_factory):
+    """HOME reused by tests that only need an empty worklog, not a new directory tree."""
+    return tmp_path_factory.mktemp("worklog_home")
+
+
+@pytest.fixture
+def worklog(shared_home, monkeypatch):
+    """Empty WorkLog in the shared HOME; earlier tests' files are removed, directories kept."""
+    monkeypatch.setenv('HOME', str(shared_home))
+    for path in (shared_home / '.worklog').rglob('*'):
+        if path.is_file():
+            path.unlink()
+    return WorkLog()
+
+
+class TestWorkLogValidator:
     """Test the centralized validation logic."""
     
-    def setUp(self):
-        self.validator = WorkLogValidator()
-        self.config = WorkLogConfig()
-    
-    def test_validate_date_format_valid(self):
+    @pytest.mark.parametrize("date_str", ["2023-12-31", "2023-01-01"])
+    def test_validate_date_format_valid(self, validator, config, date_str):
         """Test valid date formats pass validation."""
         # Should not raise exception
-        self.validator.validate_date_format("2023-12-31", self.config)
-        self.validator.validate_date_format("2023-01-01", self.config)
+        validator.validate_date_format(date_str, config)
         
-    def test_validate_date_format_invalid(self):
+    @pytest.mark.parametrize("date_str", _INVALID_DATES)
+    def test_validate_date_format_invalid(self, validator, config, date_str):
         """Test invalid date formats raise ValueError."""
-        with self.assertRaises(ValueError):
-            self.validator.validate_date_format("31-12-2023", self.config)
-        with self.assertRaises(ValueError):
-            self.validator.validate_date_format("invalid-date", self.config)
-    
-    def test_validate_time_format_valid(self):
+        with pytest.raises(ValueError):
+            validator.validate_date_format(date_str, config)
+
+    def test_validate_date_format_custom_format(self, validator):
+        """Test non-ISO date formats still validate against the configured format."""
+        custom_config = WorkLogConfig(date_format="%d/%m/%Y")
+        validator.validate_date_format("31/12/2023", custom_config)
+        with pytest.raises(ValueError):
+            validator.validate_date_format("2023-12-31", custom_config)
+
+    @pytest.mark.parametrize("time_str, expected", [("14:30", (14, 30)), ("09:00", (9, 0))])
+    def test_validate_time_format_valid(self, validator, time_str, expected):
         """Test valid time formats pass validation."""
         # Should return (hours, minutes) tuple
-        hours, minutes = self.validator.validate_time_format("14:30")
-        self.assertEqual(hours, 14)
-        self.assertEqual(minutes, 30)
-        
-        hours, minutes = self.validator.validate_time_format("09:00")
-        self.assertEqual(hours, 9)
-        self.assertEqual(minutes, 0)
+        assert validator.validate_time_format(time_str) == expected
     
-    def test_validate_time_format_invalid(self):
+    @pytest.mark.parametrize("time_str", _INVALID_TIMES)
+    def test_validate_time_format_invalid(self, validator, time_str):
         """Test invalid time formats raise ValueError."""
-        invalid_times = ["25:00", "12:60", "abc:def", "12:", ":30", ""]
-        for invalid_time in invalid_times:
-            with self.assertRaises(ValueError):
-                self.validator.validate_time_format(invalid_time)
+        with pytest.raises(ValueError):
+            validator.validate_time_format(time_str)
     
-    def test_validate_task_name_valid(self):
+    @pytest.mark.parametrize("task_name", ["Valid Task Name", "Task-With-Dashes"])
+    def test_validate_task_name_valid(self, validator, task_name):
         """Test valid task names pass validation."""
         # Should not raise exception
-        self.validator.validate_task_name("Valid Task Name")
-        self.validator.validate_task_name("Task-With-Dashes")
+        validator.validate_task_name(task_name)
     
-    def test_validate_task_name_invalid(self):
+    @pytest.mark.parametrize("task_name", _INVALID_TASK_NAMES)
+    def test_validate_task_name_invalid(self, validator, task_name):
         """Test invalid task names raise ValueError."""
-        with self.assertRaises(ValueError):
-            self.validator.validate_task_name("")  # Empty
-        with self.assertRaises(ValueError):
-            self.validator.validate_task_name("   ")  # Only whitespace
-        with self.assertRaises(ValueError):
-            self.validator.validate_task_name("a" * 101)  # Too long
+        with pytest.raises(ValueError):
+            validator.validate_task_name(task_name)
 
 
-class TestWorkLogConfig(unittest.TestCase):
+class TestWorkLogConfig:
     """Test configuration management."""
     
     def test_default_config_values(self):
         """Test default configuration values are sensible."""
         config = WorkLogConfig()
-        self.assertEqual(config.worklog_dir_name, '.worklog')
-        self.assertEqual(config.date_format, "%Y-%m-%d")
-        self.assertEqual(config.time_format, "%H:%M")
-        self.assertTrue(config.backup_enabled)
-        self.assertTrue(config.auto_save)
+        assert config.worklog_dir_name == '.worklog'
+        assert config.date_format == "%Y-%m-%d"
+        assert config.time_format == "%H:%M"
+        assert config.backup_enabled
+        assert config.auto_save
     
     def test_custom_config_values(self):
         """Test custom configuration values work correctly."""
@@ -103,12 +147,80 @@ class TestWorkLogConfig(unittest.TestCase):
             max_recent_tasks=5,
             backup_enabled=False
         )
-        self.assertEqual(config.worklog_dir_name, 'custom_worklog')
-        self.assertEqual(config.max_recent_tasks, 5)
-        self.assertFalse(config.backup_enabled)
+        assert config.worklog_dir_name == 'custom_worklog'
+        assert config.max_recent_tasks == 5
+        assert not config.backup_enabled
+    
+    def test_sheet_name_for_date_matches_strftime(self):
+        """Test sheet tab names match the full month name for every month."""
+        config = WorkLogConfig()
+        for month in range(1, 13):
+            date = datetime(2025, month, 15)
+            assert config.get_sheet_name_for_date(date.strftime("%Y-%m-%d")) == date.strftime("%B")
+        for invalid in ("2025-13-01", "2025-02-30", "2025-10-xx"):
+            with pytest.raises(ValueError):
+                config.get_sheet_name_for_date(invalid)
+    
+    def test_load_from_yaml_uses_json_cache(self, tmp_path):
+        """Test parsed config is cached in a JSON sidecar keyed by mtime and size."""
+        from src.worklog.config import get_config_cache_path
+        from src.worklog.utils.jsonio import json_dumps, json_loads
+        config_path = tmp_path / 'config.yaml'
+        config_path.write_text("max_recent_tasks: 7\n")
+        assert WorkLogConfig.load_from_yaml(config_path).max_recent_tasks == 7
+        
+        cache_path = get_config_cache_path(config_path)
+        cached = json_loads(cache_path.read_bytes())
+        assert cached['data'] == {'max_recent_tasks': 7}
+        
+        # An unchanged file is served from the sidecar
+        cached['data']['max_recent_tasks'] = 8
+        cache_path.write_bytes(json_dumps(cached))
+        assert WorkLogConfig.load_from_yaml(config_path).max_recent_tasks == 8
+        
+        # Editing the file invalidates the sidecar
+        config_path.write_text("max_recent_tasks: 12\n")
+        assert WorkLogConfig.load_from_yaml(config_path).max_recent_tasks == 12
+    
+    def test_json_cache_skipped_for_non_json_values(self, tmp_path):
+        """Test YAML values JSON cannot round-trip are never served from the sidecar."""
+        from datetime import date
+        from src.worklog.config import _parse_yaml_config, get_config_cache_path
+        config_path = tmp_path / 'config.yaml'
+        config_path.write_text("start_date: 2025-10-03\n")
+        
+        assert _parse_yaml_config(config_path) == {'start_date': date(2025, 10, 3)}
+        assert not get_config_cache_path(config_path).exists()
+        assert _parse_yaml_config(config_path) == {'start_date': date(2025, 10, 3)}
+    
+    def test_save_to_yaml_round_trips(self, tmp_path):
+        """Test saved config reloads with nested settings and projects intact."""
+        config_path = tmp_path / 'config.yaml'
+        config = WorkLogConfig(projects=['Alpha', 'Beta'], max_recent_tasks=4)
+        config.google_sheets.enabled = True
+        config.google_sheets.round_hours = 0.25
+        config.save_to_yaml(config_path)
+        
+        assert 'worklog_dir:' not in config_path.read_text()
+        loaded = WorkLogConfig.load_from_yaml(config_path)
+        assert loaded == config
+        assert loaded.projects is not config.projects
+    
+    def test_save_to_yaml_drops_json_cache(self, tmp_path):
+        """Test saving the config removes the JSON sidecar."""
+        from src.worklog.config import get_config_cache_path
+        config_path = tmp_path / 'config.yaml'
+        config_path.write_text("max_recent_tasks: 7\n")
+        config = WorkLogConfig.load_from_yaml(config_path)
+        assert get_config_cache_path(config_path).exists()
+        
+        config.max_recent_tasks = 3
+        config.save_to_yaml(config_path)
+        assert not get_config_cache_path(config_path).exists()
+        assert WorkLogConfig.load_from_yaml(config_path).max_recent_tasks == 3
 
 
-class TestDataClasses(unittest.TestCase):
+class TestDataClasses:
     """Test the dataclass structures used in the worklog system."""
     
     def test_task_entry_creation(self):
@@ -120,10 +232,10 @@ class TestDataClasses(unittest.TestCase):
             duration="01:00:00"
         )
         
-        self.assertEqual(entry.task, "Test Task")
-        self.assertEqual(entry.start_time, "2023-12-31T14:30:00")
-        self.assertEqual(entry.end_time, "2023-12-31T15:30:00")
-        self.assertEqual(entry.duration, "01:00:00")
+        assert entry == TaskEntry(
+            task="Test Task", start_time="2023-12-31T14:30:00", end_time="2023-12-31T15:30:00",
+            duration="01:00:00", project=None, duration_seconds=3600,
+        )
     
     def test_task_entry_active(self):
         """Test TaskEntry with no end_time (active task)."""
@@ -132,10 +244,39 @@ class TestDataClasses(unittest.TestCase):
             start_time="2023-12-31T14:30:00"
         )
         
-        self.assertEqual(entry.task, "Active Task")
-        self.assertEqual(entry.start_time, "2023-12-31T14:30:00")
-        self.assertIsNone(entry.end_time)
-        self.assertIsNone(entry.duration)
+        assert entry == TaskEntry(
+            task="Active Task", start_time="2023-12-31T14:30:00", end_time=None,
+            duration=None, project=None, duration_seconds=None,
+        )
+    
+    def test_task_entry_derived_fields_not_serialized(self):
+        """Test cached date/time accessors stay out of the serialized entry."""
+        entry = TaskEntry(task="Task", start_time="2023-12-31T14:30:15")
+        
+        assert entry.date_str == "2023-12-31"
+        assert entry.time_str == "14:30"
+        assert entry.to_dict() == {
+            'task': "Task", 'start_time': "2023-12-31T14:30:15",
+            'end_time': None, 'duration': None, 'project': None, 'duration_seconds': None,
+        }
+    
+    def test_task_entry_parsed_times(self):
+        """Test start_dt/end_dt parse the ISO strings once and stay out of to_dict."""
+        entry = TaskEntry(task="Task", start_time="2023-12-31T14:30:15",
+                          end_time="2023-12-31T16:00:00", duration="01:29:45")
+        
+        assert entry.start_dt == datetime(2023, 12, 31, 14, 30, 15)
+        assert entry.end_dt == datetime(2023, 12, 31, 16, 0, 0)
+        assert entry.end_dt is entry.end_dt
+        assert 'end_dt' not in entry.to_dict()
+        assert TaskEntry(task="Active", start_time="2023-12-31T14:30:15").end_dt is None
+    
+    def test_task_entry_duration_seconds(self):
+        """Test duration_seconds is derived from legacy HH:MM:SS durations."""
+        legacy = TaskEntry(task="Task", start_time="2023-12-31T14:30:15",
+                           end_time="2023-12-31T16:00:45", duration="101:30:30")
+        assert legacy.duration_seconds == 101 * 3600 + 30 * 60 + 30
+        assert TaskEntry(task="Task", start_time="2023-12-31T14:30:15", duration="bad").duration_seconds is None
     
     def test_paused_task_creation(self):
         """Test PausedTask dataclass creation."""
@@ -144,17 +285,15 @@ class TestDataClasses(unittest.TestCase):
             start_time="2023-12-31T14:30:00"
         )
         
-        self.assertEqual(paused_task.task, "Paused Task")
-        self.assertEqual(paused_task.start_time, "2023-12-31T14:30:00")
+        assert paused_task == PausedTask(task="Paused Task", start_time="2023-12-31T14:30:00")
     
     def test_worklog_data_creation(self):
         """Test WorkLogData dataclass with default values."""
         data = WorkLogData()
         
-        self.assertEqual(data.entries, [])
-        self.assertEqual(data.active_tasks, {})
-        self.assertEqual(data.paused_tasks, [])
-        self.assertEqual(data.recent_tasks, [])
+        assert data == WorkLogData(
+            entries=[], active_tasks={}, paused_tasks=[], recent_tasks=[], active_task_projects={},
+        )
     
     def test_worklog_data_with_data(self):
         """Test WorkLogData with actual data."""
@@ -168,111 +307,379 @@ class TestDataClasses(unittest.TestCase):
             recent_tasks=["Recent Task"]
         )
         
-        self.assertEqual(len(data.entries), 1)
-        self.assertEqual(len(data.active_tasks), 1)
-        self.assertEqual(len(data.paused_tasks), 1)
-        self.assertEqual(len(data.recent_tasks), 1)
+        assert data == WorkLogData(
+            entries=[TaskEntry(task="Test", start_time="2023-12-31T14:30:00")],
+            active_tasks={"Active Task": "2023-12-31T14:00:00"},
+            paused_tasks=[PausedTask(task="Paused", start_time="2023-12-31T13:00:00")],
+            recent_tasks=["Recent Task"],
+            active_task_projects={},
+        )
 
 
-class TestWorkLogInitialization(unittest.TestCase):
-    """Test WorkLog initialization and directory creation."""
+class TestDailyFileManager:
+    """Test daily file updates."""
+    
+    @pytest.fixture(autouse=True)
+    def _manager(self, tmp_path):
+        self.test_dir = tmp_path
+        self.manager = DailyFileManager(WorkLogConfig())
     
-    def setUp(self):
-        self.test_dir = tempfile.mkdtemp()
-        self.original_home = os.environ.get('HOME')
-        os.environ['HOME'] = self.test_dir
+    def _both_paths(self, lines, new_entry):
+        """Apply new_entry via add_entry_chronologically and the full rewrite, return both results."""
+        fast_file = self.test_dir / "fast.txt"
+        slow_file = self.test_dir / "slow.txt"
+        for daily_file in (fast_file, slow_file):
+            daily_file.write_text(''.join(f"{line}\n" for line in lines))
+        self.manager.add_entry_chronologically(fast_file, new_entry)
+        self.manager.add_entries_chronologically(slow_file, [new_entry])
+        return fast_file.read_text(), slow_file.read_text()
     
-    def tearDown(self):
-        if self.original_home:
-            os.environ['HOME'] = self.original_home
-        shutil.rmtree(self.test_dir, ignore_errors=True)
+    def test_format_entry_accepts_parsed_datetime(self):
+        """Test format_entry gives the same line for an ISO string and a datetime."""
+        end = datetime(2025, 10, 3, 10, 30, 0)
+        for action, duration in (('start', None), ('completed', '00:30:00'), ('pause', None)):
+            assert (self.manager.format_entry("Task B", action, end, duration)
+                    == self.manager.format_entry("Task B", action, end.isoformat(), duration))
+    
+    def test_completion_replaces_task_lines(self):
+        """Test ending a task swaps all its status lines for the completion line."""
+        lines = [
+            "2025-10-03 09:00:00 Task B [ACTIVE]",
+            "2025-10-03 09:15:00 Task A (01:00:00)",
+            "2025-10-03 09:30:00 Task B [PAUSED]",
+        ]
+        new_entry = "2025-10-03 09:00:00 Task B (00:30:00)"
+        
+        daily_file = self.test_dir / "day.txt"
+        daily_file.write_text(''.join(f"{line}\n" for line in lines))
+        self.manager.add_entry_chronologically(daily_file, new_entry)
+        
+        assert daily_file.read_text() == f"{new_entry}\n{lines[1]}\n"
+        assert list(self.test_dir.iterdir()) == [daily_file]
+    
+    def test_completion_write_failure_keeps_original_file(self):
+        """Test a failed rewrite leaves the previous daily file intact."""
+        contents = "2025-10-03 09:00:00 Task A [ACTIVE]\n"
+        daily_file = self.test_dir / "day.txt"
+        daily_file.write_text(contents)
+        
+        with patch('src.worklog.utils.files.os.replace', side_effect=OSError("disk full")):
+            with pytest.raises(IOError):
+                self.manager.add_entry_chronologically(
+                    daily_file, "2025-10-03 09:00:00 Task A (00:30:00)")
+        
+        assert daily_file.read_text() == contents
+        assert list(self.test_dir.iterdir()) == [daily_file]
+    
+    def test_append_fast_path_matches_full_rewrite(self):
+        """Test appending status lines agrees with the sorted rewrite."""
+        cases = [
+            # New start after the last line is appended
+            (["2025-10-03 09:00:00 Task A (01:00:00)"], "2025-10-03 10:00:00 Task B [ACTIVE]"),
+            # Retroactive start before the last line needs sorting
+            (["2025-10-03 09:00:00 Task A (01:00:00)"], "2025-10-03 08:00:00 Task B [ACTIVE]"),
+            # Same timestamp keeps the new line last
+            (["2025-10-03 09:00:00 Task A [ACTIVE]"], "2025-10-03 09:00:00 Task A [PAUSED]"),
+            # Empty file
+            ([], "2025-10-03 09:00:00 Task A [ACTIVE]"),
+        ]
+        for lines, new_entry in cases:
+            fast, slow = self._both_paths(lines, new_entry)
+            assert fast == slow
+    
+    def test_start_line_is_appended_without_rewrite(self):
+        """Test a start line for a new daily file is written without a rewrite."""
+        daily_file = self.test_dir / "day.txt"
+        with patch.object(self.manager, 'add_entries_chronologically') as rewrite:
+            self.manager.add_entry_chronologically(daily_file, "2025-10-03 09:00:00 Task A [ACTIVE]")
+            self.manager.add_entry_chronologically(daily_file, "2025-10-03 09:30:00 Task A [PAUSED]")
+        
+        rewrite.assert_not_called()
+        assert daily_file.read_text().splitlines() == [
+            "2025-10-03 09:00:00 Task A [ACTIVE]", "2025-10-03 09:30:00 Task A [PAUSED]",
+        ]
+    
+    def test_replace_existing_rewrites_atomically(self):
+        """Test a rebuild drops old lines and leaves no temporary file behind."""
+        daily_file = self.test_dir / "day.txt"
+        daily_file.write_text("2025-10-03 08:00:00 Old (00:10:00)\n")
+        
+        self.manager.add_entries_chronologically(
+            daily_file,
+            ["2025-10-03 10:00:00 B (00:10:00)", "2025-10-03 09:00:00 A (00:10:00)"],
+            replace_existing=True
+        )
+        
+        assert daily_file.read_text() == "2025-10-03 09:00:00 A (00:10:00)\n2025-10-03 10:00:00 B (00:10:00)\n"
+        assert [p.name for p in self.test_dir.iterdir()] == ["day.txt"]
+
+
+@pytest.mark.usefixtures("isolated_home")
+class TestWorkLogInitialization:
+    """Test WorkLog initialization and directory creation."""
     
     def test_worklog_initialization(self):
         """Test WorkLog initialization creates proper directory structure."""
         worklog = WorkLog()
         
-        self.assertTrue(worklog.worklog_dir.exists())
-        self.assertEqual(worklog.worklog_dir.name, '.worklog')
-        self.assertTrue(worklog.worklog_file.name.endswith('.json'))
+        assert worklog.worklog_dir.exists()
+        assert worklog.worklog_dir.name == '.worklog'
+        assert worklog.worklog_file.name.endswith('.json')
     
-    def test_ensure_directory_creation(self):
+    def test_ensure_directory_creation(self, isolated_home):
         """Test that worklog directory is created if it doesn't exist."""
-        worklog_dir = Path(self.test_dir) / '.worklog'
-        self.assertFalse(worklog_dir.exists())
+        worklog_dir = isolated_home / '.worklog'
+        assert not worklog_dir.exists()
+        
+        worklog = WorkLog()
+        assert worklog.worklog_dir.exists()
+    
+    def test_legacy_file_migration(self, isolated_home):
+        """Test ~/.worklog.json is moved once and never overwrites current data."""
+        legacy = isolated_home / '.worklog.json'
+        legacy.write_text('{"entries": []}')
+        
+        worklog = WorkLog()
+        assert worklog.worklog_file.read_text() == '{"entries": []}'
+        assert not legacy.exists()
+        assert (isolated_home / '.worklog.json.backup').exists()
         
+        legacy.write_text('{"stale": true}')
         worklog = WorkLog()
-        self.assertTrue(worklog.worklog_dir.exists())
+        assert worklog.worklog_file.read_text() == '{"entries": []}'
+        assert legacy.exists()
 
 
-class TestTimeHandling(unittest.TestCase):
+class TestTimeHandling:
     """Test time parsing and formatting functionality."""
     
-    def setUp(self):
-        self.test_dir = tempfile.mkdtemp()
-        self.original_home = os.environ.get('HOME')
-        os.environ['HOME'] = self.test_dir
-        self.worklog = WorkLog()
-    
-    def tearDown(self):
-        if self.original_home:
-            os.environ['HOME'] = self.original_home
-        shutil.rmtree(self.test_dir, ignore_errors=True)
+    @pytest.fixture(scope="class")
+    @classmethod
+    def worklog(cls):
+        """Bare WorkLog with only a config; skips directory and data loading."""
+        worklog = WorkLog.__new__(WorkLog)
+        worklog.config = WorkLogConfig()
+        return worklog
     
-    def test_get_current_timestamp(self):
+    def test_get_current_timestamp(self, monkeypatch):
         """Test getting current timestamp returns ISO format."""
-        with patch('src.worklog.managers.worklog.datetime') as mock_datetime:
-            mock_datetime.now.return_value = datetime(2025, 10, 3, 15, 30, 45)
-            mock_datetime.fromisoformat = datetime.fromisoformat
-            
-            result = WorkLog._get_current_timestamp()
-            self.assertEqual(result, '2025-10-03T15:30:45')
-    
-    def test_format_display_time(self):
+        monkeypatch.setattr('src.worklog.managers.worklog.datetime', _FrozenDatetime)
+        
+        result = WorkLog._get_current_timestamp()
+        assert result == '2025-10-03T15:30:45'
+    
+    def test_format_display_time(self, worklog):
         """Test formatting datetime for display."""
         timestamp = "2023-12-31T14:30:00"
-        result = self.worklog._format_display_time(timestamp)
-        self.assertEqual(result, "2023-12-31 14:30:00")
+        result = worklog._format_display_time(timestamp)
+        assert result == "2023-12-31 14:30:00"
+    
+    def test_format_datetime_matches_strftime(self):
+        """Test the strftime-free formatting agrees with strftime."""
+        from src.worklog.utils.timestamps import format_datetime
+        dt = datetime(2025, 1, 2, 3, 4, 5, 678)
+        for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d", "%d/%m/%Y %H:%M"):
+            assert format_datetime(dt, fmt) == dt.strftime(fmt)
     
     def test_format_duration_calculation(self):
         """Test duration calculation between two times."""
         start = "2023-12-31T14:30:00"
         end = "2023-12-31T15:45:30"
-        result = self.worklog._format_duration(start, end)
-        self.assertEqual(result, "01:15:30")
+        result = WorkLog._format_duration(start, end)
+        assert result == "01:15:30"
     
-    def test_parse_custom_time_valid_formats(self):
+    def test_format_duration_dt(self):
+        """Test duration formatting from parsed datetimes, clamping negatives."""
+        start = datetime(2023, 12, 31, 14, 30, 0)
+        end = datetime(2024, 1, 1, 16, 0, 5)
+        assert WorkLog._format_duration_dt(start, end) == "25:30:05"
+        assert WorkLog._format_duration_dt(end, start) == "00:00:00"
+    
+    @pytest.mark.parametrize("time_str", _VALID_TIMES)
+    def test_parse_custom_time_valid_formats(self, time_str):
         """Test parsing various valid time formats."""
-        valid_times = ["09:30", "14:45", "00:00", "23:59"]
-        for time_str in valid_times:
-            result = WorkLog._parse_custom_time(time_str)
-            self.assertIsInstance(result, str)
-            # Should be valid ISO timestamp
-            datetime.fromisoformat(result)
+        result = WorkLog._parse_custom_time(time_str)
+        assert isinstance(result, str)
+        # Should be valid ISO timestamp
+        datetime.fromisoformat(result)
 
 
-class TestTaskOperations(unittest.TestCase):
-    """Test core task management operations."""
+@pytest.mark.usefixtures("isolated_home")
+class TestJsonPersistence:
+    """Test worklog.json round-trips with and without orjson."""
     
-    def setUp(self):
-        self.test_dir = tempfile.mkdtemp()
-        self.original_home = os.environ.get('HOME')
-        os.environ['HOME'] = self.test_dir
+    def _round_trip(self, config=None):
+        worklog = WorkLog(config=config)
+        worklog.data.entries.append(
+            TaskEntry("Café ☕", "2025-10-03T09:00:00", "2025-10-03T10:00:00", "01:00:00", "Pròject")
+        )
+        worklog.data.active_tasks["Running"] = "2025-10-03T11:00:00"
+        worklog._save_data()
+        raw = worklog.worklog_file.read_bytes()
+        
+        reloaded = WorkLog()
+        assert reloaded.data.entries == worklog.data.entries
+        assert reloaded.data.active_tasks == {"Running": "2025-10-03T11:00:00"}
+        return raw
+    
+    def test_stdlib_json_fallback(self):
+        """Test persistence works without orjson and writes compact JSON."""
+        with patch('src.worklog.utils.jsonio.ORJSON_AVAILABLE', False):
+            raw = self._round_trip()
+        assert "Café ☕".encode('utf-8') in raw
+        assert raw.startswith(b'{"entries":[{')
+        assert b'\n' not in raw
+    
+    def test_pretty_json_option(self):
+        """Test pretty_json keeps the indented, hand-readable layout."""
+        with patch('src.worklog.utils.jsonio.ORJSON_AVAILABLE', False):
+            raw = self._round_trip(WorkLogConfig(pretty_json=True))
+        assert b'\n  "entries": [' in raw
+    
+    def test_orjson_matches_stdlib_layout(self, isolated_home):
+        """Test orjson output is byte-identical to the stdlib encoder."""
+        from src.worklog.utils import jsonio
+        if not jsonio.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        for pretty in (False, True):
+            # Start from an empty directory so the save writes a full snapshot
+            shutil.rmtree(isolated_home / '.worklog', ignore_errors=True)
+            raw = self._round_trip(WorkLogConfig(pretty_json=pretty))
+            with patch('src.worklog.utils.jsonio.ORJSON_AVAILABLE', False):
+                assert jsonio.json_dumps(json.loads(raw), pretty=pretty) == raw
+
+
+class TestJournal:
+    """Test append-only journal persistence and snapshot compaction."""
+    
+    @pytest.fixture(autouse=True)
+    def _worklog(self, isolated_home):
         self.worklog = WorkLog()
+        # First save writes the snapshot that later saves append against
+        self.worklog.start_task("Setup")
+        self.worklog.end_task("Setup")
+    
+    def test_end_task_appends_instead_of_rewriting(self):
+        """Test a new entry is appended to the journal and survives a reload."""
+        snapshot = self.worklog.worklog_file.read_bytes()
+        self.worklog.start_task("Task A")
+        self.worklog.end_task("Task A")
+        
+        assert self.worklog.worklog_file.read_bytes() == snapshot
+        records = [json.loads(line) for line in self.worklog.journal_file.read_text().splitlines()]
+        assert {'op': 'entry', 'entry': self.worklog.data.entries[-1].to_dict()} in records
+        
+        reloaded = WorkLog()
+        assert reloaded.data.entries == self.worklog.data.entries
+        assert reloaded.data.active_tasks == {}
+    
+    def test_removing_entries_writes_snapshot(self):
+        """Test non-append changes compact the journal into worklog.json."""
+        self.worklog.start_task("Task A")
+        self.worklog.end_task("Task A")
+        assert self.worklog.journal_file.exists()
+        
+        self.worklog.clean_by_task("Task A")
+        assert not self.worklog.journal_file.exists()
+        assert [e.task for e in WorkLog().data.entries] == ["Setup"]
+    
+    def test_entry_edited_in_place_writes_snapshot(self):
+        """Test an in-place edit flagged with _mark_entries_rewritten() is not lost."""
+        self.worklog.start_task("Task A")
+        self.worklog.end_task("Task A")
+        assert self.worklog.journal_file.exists()
+        
+        self.worklog.data.entries[-1].task = "Task B"
+        self.worklog._mark_entries_rewritten()
+        self.worklog._save_data()
+        
+        assert not self.worklog.journal_file.exists()
+        assert [e.task for e in WorkLog().data.entries] == ["Setup", "Task B"]
+    
+    def test_in_place_removal_then_append_writes_snapshot(self):
+        """Test removing from the same list is caught even when appends restore its length."""
+        self.worklog.start_task("Task A")
+        self.worklog.end_task("Task A")
+        entries = self.worklog.data.entries
+        entries.pop(0)
+        entries.append(TaskEntry(
+            task="Task B",
+            start_time="2099-01-01T09:00:00",
+            end_time="2099-01-01T10:00:00",
+            duration="01:00:00"
+        ))
+        self.worklog._save_data()
+        
+        assert not self.worklog.journal_file.exists()
+        assert [e.task for e in WorkLog().data.entries] == ["Task A", "Task B"]
+    
+    def test_clean_backup_includes_journaled_entries(self):
+        """Test backups are taken from the replayed state, not the lagging snapshot."""
+        self.worklog.start_task("Task A")
+        self.worklog.end_task("Task A")
+        assert b"Task A" not in self.worklog.worklog_file.read_bytes()
+        
+        self.worklog.clean_by_task("Task A")
+        backup_file, = self.worklog.worklog_dir.glob("clean_all_dates_Task_A_backup_*.txt")
+        assert "Task A" in backup_file.read_text()
+    
+    def test_corrupted_snapshot_moves_journal_aside(self):
+        """Test the journal is kept next to a corrupted snapshot instead of being dropped."""
+        self.worklog.start_task("Task A")
+        journal = self.worklog.journal_file.read_bytes()
+        self.worklog.worklog_file.write_text("{broken")
+        
+        reloaded = WorkLog()
+        assert reloaded.data.active_tasks == {}
+        assert not reloaded.journal_file.exists()
+        assert reloaded.journal_file.with_suffix('.jsonl.corrupted').read_bytes() == journal
+    
+    def test_compacts_when_journal_grows(self):
+        """Test the journal is folded into the snapshot once over the size limit."""
+        self.worklog.JOURNAL_COMPACT_BYTES = 1
+        assert self.worklog.journal_file.exists()
+        self.worklog.start_task("Task A")
+        assert not self.worklog.journal_file.exists()
+        assert list(WorkLog().data.active_tasks) == ["Task A"]
     
-    def tearDown(self):
-        if self.original_home:
-            os.environ['HOME'] = self.original_home
-        shutil.rmtree(self.test_dir, ignore_errors=True)
+    def test_stale_journal_is_ignored(self):
+        """Test a journal left over from an older snapshot is not replayed."""
+        self.worklog.start_task("Task A")
+        stale = self.worklog.journal_file.read_bytes().replace(
+            self.worklog._journal_id.encode(), b"0" * 32
+        )
+        self.worklog.journal_file.write_bytes(stale)
+        
+        assert "Task A" not in WorkLog().data.active_tasks
+    
+    def test_torn_journal_record_is_skipped(self):
+        """Test a partially written trailing record is dropped and compacted away."""
+        self.worklog.start_task("Task A")
+        with open(self.worklog.journal_file, 'ab') as f:
+            f.write(b'{"op":"entry","entry":{"task":"Bro')
+        
+        reloaded = WorkLog()
+        assert list(reloaded.data.active_tasks) == ["Task A"]
+        reloaded.end_task("Task A")
+        assert not reloaded.journal_file.exists()
+        assert [e.task for e in WorkLog().data.entries] == ["Setup", "Task A"]
+
+
+class TestTaskOperations:
+    """Test core task management operations."""
     
-    @patch('src.worklog.managers.worklog.WorkLog._get_current_timestamp')
-    def test_start_new_task(self, mock_timestamp):
+    @pytest.fixture(autouse=True)
+    def _worklog(self, worklog):
+        self.worklog = worklog
+    
+    def test_start_new_task(self, monkeypatch):
         """Test starting a new task."""
-        mock_timestamp.return_value = '2025-10-03T09:00:00'
+        monkeypatch.setattr(WorkLog, '_get_current_timestamp', staticmethod(lambda: '2025-10-03T09:00:00'))
         
         self.worklog.start_task("Test Task")
         
-        self.assertIn("Test Task", self.worklog.data.active_tasks)
-        self.assertEqual(self.worklog.data.active_tasks["Test Task"], '2025-10-03T09:00:00')
+        assert "Test Task" in self.worklog.data.active_tasks
+        assert self.worklog.data.active_tasks["Test Task"] == '2025-10-03T09:00:00'
     
     def test_start_existing_active_task(self):
         """Test starting a task that's already active."""
@@ -280,12 +687,11 @@ class TestTaskOperations(unittest.TestCase):
         
         # Should show warning message and not change anything
         result = self.worklog.start_task("Existing Task")
-        self.assertFalse(result)  # Should return False for already active task
+        assert not result  # Should return False for already active task
     
-    @patch('src.worklog.managers.worklog.WorkLog._get_current_timestamp')
-    def test_end_active_task(self, mock_timestamp):
+    def test_end_active_task(self, monkeypatch):
         """Test ending an active task."""
-        mock_timestamp.return_value = '2025-10-03T10:00:00'
+        monkeypatch.setattr(WorkLog, '_get_current_timestamp', staticmethod(lambda: '2025-10-03T10:00:00'))
         
         # Set up an active task (end_task will create the entry)
         self.worklog.data.active_tasks["Active Task"] = '2025-10-03T09:00:00'
@@ -293,41 +699,134 @@ class TestTaskOperations(unittest.TestCase):
         result = self.worklog.end_task("Active Task")
         
         # Task should be removed from active tasks
-        self.assertNotIn("Active Task", self.worklog.data.active_tasks)
-        self.assertTrue(result)  # Should return True for successful end
+        assert "Active Task" not in self.worklog.data.active_tasks
+        assert result  # Should return True for successful end
         
         # Task entry should be created
-        self.assertEqual(len(self.worklog.data.entries), 1)
+        assert len(self.worklog.data.entries) == 1
         updated_entry = self.worklog.data.entries[0]
-        self.assertEqual(updated_entry.task, "Active Task")
-        self.assertEqual(updated_entry.start_time, '2025-10-03T09:00:00')
-        self.assertEqual(updated_entry.end_time, '2025-10-03T10:00:00')
-        self.assertEqual(updated_entry.duration, "01:00:00")
+        assert updated_entry.task == "Active Task"
+        assert updated_entry.start_time == '2025-10-03T09:00:00'
+        assert updated_entry.end_time == '2025-10-03T10:00:00'
+        assert updated_entry.duration == "01:00:00"
+        assert updated_entry.duration_seconds == 3600
     
     def test_end_inactive_task(self):
         """Test trying to end a task that's not active."""
         result = self.worklog.end_task("Nonexistent Task")
-        self.assertFalse(result)  # Should return False for inactive task
+        assert not result  # Should return False for inactive task
+    
+    def test_no_op_commands_do_not_write(self):
+        """Test commands that change nothing skip saving entirely."""
+        self.worklog.end_task("Nonexistent Task")
+        assert not self.worklog.worklog_file.exists()
+        
+        self.worklog.start_task("Task A")
+        self.worklog.start_task("Task A")  # Already active
+        self.worklog.pause_task("Task B")  # Not active
+        assert not self.worklog.journal_file.exists()
+    
+    def test_task_index_tracks_new_and_replaced_entries(self):
+        """Test per-task lookups follow appended entries and list replacement."""
+        self.worklog.data.entries = [
+            TaskEntry(task="A", start_time='2025-10-03T09:00:00', end_time='2025-10-03T10:00:00', duration='01:00:00'),
+            TaskEntry(task="B", start_time='2025-10-03T10:00:00', end_time='2025-10-03T11:00:00', duration='01:00:00'),
+        ]
+        assert [e.task for e in self.worklog._entries_for_task("A")] == ["A"]
+        
+        self.worklog.data.active_tasks["A"] = '2025-10-03T12:00:00'
+        self.worklog.end_task("A", "13:00")
+        assert len(self.worklog._entries_for_task("A")) == 2
+        
+        self.worklog.clean_by_task("A")
+        assert self.worklog._entries_for_task("A") == []
+        assert [e.task for e in self.worklog._entries_for_task("B")] == ["B"]
+    
+    def test_index_rebuilt_for_same_length_replacement_list(self):
+        """Test a new entries list of the same length is never served the old index."""
+        def entries(task):
+            return [TaskEntry(task=task, start_time='2025-10-03T09:00:00',
+                              end_time='2025-10-03T10:00:00', duration='01:00:00')]
+        
+        for i in range(20):
+            self.worklog.data.entries = entries(f"Indexed {i}")
+            assert self.worklog._entries_for_task(f"Indexed {i}")
+            # Freeing the indexed list lets the next same-length list reuse its id()
+            self.worklog.data.entries = entries("Unindexed")
+            self.worklog.data.entries = entries(f"Fresh {i}")
+            assert [e.task for e in self.worklog._entries_for_task(f"Fresh {i}")] == [f"Fresh {i}"]
+            assert [e.task for e in self.worklog._entries_for_date('2025-10-03')] == [f"Fresh {i}"]
+    
+    def test_date_index_follows_saves_and_cleaning(self):
+        """Test per-date lookups stay chronological and drop cleaned dates."""
+        self.worklog.data.entries = [
+            TaskEntry(task="A", start_time='2025-10-03T09:00:00', end_time='2025-10-03T10:00:00', duration='01:00:00'),
+            TaskEntry(task="B", start_time='2025-10-04T09:00:00', end_time='2025-10-04T10:00:00', duration='01:00:00'),
+        ]
+        assert [e.task for e in self.worklog._entries_for_date('2025-10-03')] == ["A"]
+        
+        # An entry appended out of order is placed correctly once saved
+        self.worklog._index_entry(
+            TaskEntry(task="C", start_time='2025-10-03T08:00:00', end_time='2025-10-03T08:30:00', duration='00:30:00')
+        )
+        self.worklog._save_data()
+        assert [e.task for e in self.worklog._entries_for_date('2025-10-03')] == ["C", "A"]
+        
+        self.worklog.clean_by_date('2025-10-03')
+        assert self.worklog._entries_for_date('2025-10-03') == []
+        assert [e.task for e in self.worklog._entries_for_date('2025-10-04')] == ["B"]
+    
+    def test_clean_rewrites_daily_files_in_daily_dir(self):
+        """Test cleaning updates the daily/ files that task commands write."""
+        self.worklog.data.entries = [
+            TaskEntry(task="A", start_time='2025-10-03T09:00:00', end_time='2025-10-03T10:00:00', duration='01:00:00'),
+            TaskEntry(task="B", start_time='2025-10-03T10:00:00', end_time='2025-10-03T11:00:00', duration='01:00:00'),
+        ]
+        daily_file = self.worklog._get_daily_file_path('2025-10-03')
+        assert daily_file == self.worklog.worklog_dir / "daily" / "2025-10-03.txt"
+        assert self.worklog._get_daily_file_path('2025-10-03') is daily_file
+        daily_file.write_text("2025-10-03 09:00:00 A (01:00:00)\n2025-10-03 10:00:00 B (01:00:00)\n")
+        
+        self.worklog.clean_by_task("A")
+        assert daily_file.read_text().splitlines() == ["2025-10-03 10:00:00 B (01:00:00)"]
+        
+        self.worklog.clean_by_date('2025-10-03')
+        assert not daily_file.exists()
+
+    def test_clean_all_removes_daily_files(self):
+        """Test clean_all deletes the daily/ files along with the entries."""
+        self.worklog.data.entries = [
+            TaskEntry(task="A", start_time='2025-10-03T09:00:00', end_time='2025-10-03T10:00:00', duration='01:00:00'),
+        ]
+        daily_file = self.worklog._get_daily_file_path('2025-10-03')
+        daily_file.write_text("2025-10-03 09:00:00 A (01:00:00)\n")
+        
+        assert self.worklog.clean_all()
+        assert not daily_file.exists()
+        assert self.worklog.data.entries == []
+    
+    def test_daily_file_path_cached_until_midnight(self):
+        """Test today's daily file path is cached and refreshed after expiry."""
+        today = datetime.now().strftime("%Y-%m-%d")
+        path = self.worklog._get_daily_file_path()
+        assert path == self.worklog.worklog_dir / "daily" / f"{today}.txt"
+        assert self.worklog._get_daily_file_path() is path
 
+        # Expired cache entries are recomputed
+        self.worklog._today_cache = (0.0, "1999-01-01", Path("stale.txt"))
+        assert self.worklog._get_daily_file_path() == path
 
-class TestSessionManagement(unittest.TestCase):
+
+class TestSessionManagement:
     """Test pause/resume and session management functionality."""
     
-    def setUp(self):
-        self.test_dir = tempfile.mkdtemp()
-        self.original_home = os.environ.get('HOME')
-        os.environ['HOME'] = self.test_dir
-        self.worklog = WorkLog()
-    
-    def tearDown(self):
-        if self.original_home:
-            os.environ['HOME'] = self.original_home
-        shutil.rmtree(self.test_dir, ignore_errors=True)
+    @pytest.fixture(autouse=True)
+    def _worklog(self, worklog):
+        self.worklog = worklog
     
-    @patch('worklog.WorkLog._get_current_timestamp')
-    def test_pause_all_tasks(self, mock_timestamp):
+    def test_pause_all_tasks(self, monkeypatch):
         """Test pausing active tasks."""
-        mock_timestamp.return_value = '2025-10-03T10:00:00'
+        monkeypatch.setattr(WorkLog, '_get_current_timestamp', staticmethod(lambda: '2025-10-03T10:00:00'))
         
         # Set up an active task
         task_start = '2025-10-03T09:00:00'
@@ -338,29 +837,29 @@ class TestSessionManagement(unittest.TestCase):
         # Pause the task
         result = self.worklog.pause_task("Task 1")
         
-        self.assertTrue(result)
+        assert result
         # Active tasks should be cleared
-        self.assertNotIn("Task 1", self.worklog.data.active_tasks)
+        assert "Task 1" not in self.worklog.data.active_tasks
         
         # Should have paused task
-        self.assertEqual(len(self.worklog.data.paused_tasks), 1)
+        assert len(self.worklog.data.paused_tasks) == 1
         
         # Check paused task structure
         paused_task = self.worklog.data.paused_tasks[0]
-        self.assertEqual(paused_task.task, "Task 1")
-        self.assertEqual(paused_task.start_time, task_start)
+        assert paused_task.task == "Task 1"
+        assert paused_task.start_time == task_start
+        assert "2025-10-03 10:00:00 Task 1 [PAUSED]" in self.worklog._get_daily_file_path().read_text()
     
     def test_resume_no_paused_tasks(self):
         """Test resume when task is not paused - should start it as new."""
         result = self.worklog.resume_task("Nonexistent Task")
         # resume_task calls start_task, so it will succeed and start a new task
-        self.assertTrue(result)
-        self.assertIn("Nonexistent Task", self.worklog.data.active_tasks)
+        assert result
+        assert "Nonexistent Task" in self.worklog.data.active_tasks
     
-    @patch('worklog.WorkLog._get_current_timestamp')
-    def test_resume_last_task(self, mock_timestamp):
+    def test_resume_last_task(self, monkeypatch):
         """Test resuming a paused task."""
-        mock_timestamp.return_value = '2025-10-03T11:00:00'
+        monkeypatch.setattr(WorkLog, '_get_current_timestamp', staticmethod(lambda: '2025-10-03T11:00:00'))
         
         # Set up a paused task
         paused_task = PausedTask(
@@ -371,82 +870,112 @@ class TestSessionManagement(unittest.TestCase):
         
         result = self.worklog.resume_task("Paused Task")
         
-        self.assertTrue(result)
-        self.assertEqual(len(self.worklog.data.paused_tasks), 0)
-        self.assertIn("Paused Task", self.worklog.data.active_tasks)
+        assert result
+        assert len(self.worklog.data.paused_tasks) == 0
+        assert self.worklog.data.active_tasks["Paused Task"] == '2025-10-03T11:00:00'
 
 
-class TestCLIIntegration(unittest.TestCase):
+@pytest.mark.usefixtures("isolated_home")
+class TestCLIIntegration:
     """Test CLI command integration."""
     
-    def setUp(self):
-        self.runner = CliRunner()
-        self.test_dir = tempfile.mkdtemp()
-        self.original_home = os.environ.get('HOME')
-        os.environ['HOME'] = self.test_dir
+    @staticmethod
+    def _help(capsys, *path):
+        """Render help for app or a subcommand without invoking it."""
+        from typer.main import get_command
+        from src.worklog.cli import app
+        command = get_command(app)
+        ctx = command.make_context("drudge", [], resilient_parsing=True)
+        for name in path:
+            command = command.get_command(ctx, name)
+            ctx = command.make_context(name, [], parent=ctx, resilient_parsing=True)
+        # Rich help is printed rather than returned
+        return command.get_help(ctx) + capsys.readouterr().out
     
-    def tearDown(self):
-        if self.original_home:
-            os.environ['HOME'] = self.original_home
-        shutil.rmtree(self.test_dir, ignore_errors=True)
-    
-    def test_help_command(self):
+    def test_help_command(self, capsys):
         """Test that help command works correctly."""
-        result = self.runner.invoke(app, ["--help"])
-        self.assertEqual(result.exit_code, 0)
-        self.assertIn("Drudge CLI", result.stdout)
-        self.assertIn("work time tracking", result.stdout)
+        help_text = self._help(capsys)
+        assert "Drudge CLI" in help_text
+        assert "work time tracking" in help_text
     
-    def test_task_command_help(self):
+    def test_task_command_help(self, capsys):
         """Test start command help shows options."""
-        result = self.runner.invoke(app, ["start", "--help"])
-        self.assertEqual(result.exit_code, 0)
-        self.assertIn("Start a new task", result.stdout)
+        assert "Start a new task" in self._help(capsys, "start")
+    
+    def test_cli_import_defers_managers(self):
+        """Test importing the CLI does not load the managers or YAML."""
+        import subprocess
+        import sys
+        code = (
+            "import sys, src.worklog.cli; "
+            "print(any(m in sys.modules for m in ('yaml', 'src.worklog.managers', 'src.worklog.config')))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                                cwd=Path(__file__).resolve().parent.parent)
+        assert result.stdout.strip() == "False", result.stderr
+    
+    def test_plain_console_matches_rich_text(self):
+        """Test the non-terminal console writes what Rich would, without loading it."""
+        import io
+        from contextlib import redirect_stdout
+        from rich.console import Console
+        from src.worklog.utils.console import _PlainConsole
+        
+        samples = [
+            ("⚠️  [yellow]Sync is not enabled[/yellow]", {}),
+            ("📄 Config file: [cyan]/tmp/config.yaml[/cyan]\n", {'style': 'bold'}),
+            ("  [ANONYMOUS WORK] [bold green]done[/bold green]", {'style': 'dim'}),
+        ]
+        for text, kwargs in samples:
+            expected = io.StringIO()
+            Console(file=expected, width=200).print(text, **kwargs)
+            plain = io.StringIO()
+            with redirect_stdout(plain):
+                _PlainConsole().print(text, **kwargs)
+            assert plain.getvalue() == expected.getvalue()
 
 
-class TestNewFeatures(unittest.TestCase):
+class TestNewFeatures:
     """Test new features added in v2.0.2."""
     
-    def setUp(self):
-        self.test_dir = tempfile.mkdtemp()
+    @pytest.fixture(autouse=True)
+    def _worklog(self, tmp_path):
+        self.test_dir = tmp_path
         self.config = WorkLogConfig()
-        self.config.worklog_dir = self.test_dir
+        self.config.worklog_dir = str(tmp_path)
         self.worklog = WorkLog(config=self.config)
-        
-    def tearDown(self):
-        shutil.rmtree(self.test_dir, ignore_errors=True)
     
     def test_anonymous_task_creation(self):
         """Test starting anonymous task with None task name."""
         result = self.worklog.start_task(None)
         
-        self.assertTrue(result)
-        self.assertIn(self.worklog.ANONYMOUS_TASK_NAME, self.worklog.data.active_tasks)
+        assert result
+        assert self.worklog.ANONYMOUS_TASK_NAME in self.worklog.data.active_tasks
         # Anonymous tasks should not be in recent_tasks
-        self.assertNotIn(self.worklog.ANONYMOUS_TASK_NAME, self.worklog.data.recent_tasks)
+        assert self.worklog.ANONYMOUS_TASK_NAME not in self.worklog.data.recent_tasks
     
     def test_anonymous_task_with_empty_string(self):
         """Test starting anonymous task with empty string."""
         result = self.worklog.start_task("")
         
-        self.assertTrue(result)
-        self.assertIn(self.worklog.ANONYMOUS_TASK_NAME, self.worklog.data.active_tasks)
+        assert result
+        assert self.worklog.ANONYMOUS_TASK_NAME in self.worklog.data.active_tasks
     
     def test_auto_end_active_tasks(self):
         """Test default single-task mode auto-ends active tasks."""
         # Start first task
         self.worklog.start_task("Task A")
-        self.assertIn("Task A", self.worklog.data.active_tasks)
+        assert "Task A" in self.worklog.data.active_tasks
         
         # Start second task without parallel flag (should auto-end Task A)
         result = self.worklog.start_task("Task B", force=True)
         
-        self.assertTrue(result)
-        self.assertNotIn("Task A", self.worklog.data.active_tasks)
-        self.assertIn("Task B", self.worklog.data.active_tasks)
+        assert result
+        assert "Task A" not in self.worklog.data.active_tasks
+        assert "Task B" in self.worklog.data.active_tasks
         # Task A should be in completed entries
         completed_tasks = [e.task for e in self.worklog.data.entries if e.end_time]
-        self.assertIn("Task A", completed_tasks)
+        assert "Task A" in completed_tasks
     
     def test_parallel_mode_allows_multiple_tasks(self):
         """Test parallel mode allows multiple concurrent tasks."""
@@ -456,10 +985,10 @@ class TestNewFeatures(unittest.TestCase):
         # Start second task with parallel=True
         result = self.worklog.start_task("Task B", parallel=True)
         
-        self.assertTrue(result)
-        self.assertIn("Task A", self.worklog.data.active_tasks)
-        self.assertIn("Task B", self.worklog.data.active_tasks)
-        self.assertEqual(len(self.worklog.data.active_tasks), 2)
+        assert result
+        assert "Task A" in self.worklog.data.active_tasks
+        assert "Task B" in self.worklog.data.active_tasks
+        assert len(self.worklog.data.active_tasks) == 2
     
     def test_end_all_tasks(self):
         """Test ending all active tasks at once."""
@@ -468,34 +997,52 @@ class TestNewFeatures(unittest.TestCase):
         self.worklog.start_task("Task B", parallel=True)
         self.worklog.start_task("Task C", parallel=True)
         
-        self.assertEqual(len(self.worklog.data.active_tasks), 3)
+        assert len(self.worklog.data.active_tasks) == 3
         
         # End all tasks
         result = self.worklog.end_all_tasks()
         
-        self.assertTrue(result)
-        self.assertEqual(len(self.worklog.data.active_tasks), 0)
-        self.assertEqual(len(self.worklog.data.entries), 3)
+        assert result
+        assert len(self.worklog.data.active_tasks) == 0
+        assert len(self.worklog.data.entries) == 3
+    
+    def test_end_all_tasks_writes_daily_file_once(self):
+        """Test ending several tasks rewrites the daily file and saves in a single pass."""
+        for name in ("Task A", "Task B", "Task C"):
+            self.worklog.start_task(name, parallel=True)
+        
+        manager = self.worklog.daily_file_manager
+        with patch.object(manager, 'add_entries_chronologically',
+                          wraps=manager.add_entries_chronologically) as batched, \
+             patch.object(self.worklog, '_save_data', wraps=self.worklog._save_data) as save:
+            assert self.worklog.end_all_tasks()
+        
+        batched.assert_called_once()
+        save.assert_called_once()
+        assert len(WorkLog(config=self.worklog.config).data.entries) == 3
+        lines = self.worklog._get_daily_file_path().read_text().splitlines()
+        assert len(lines) == 3
+        assert all("[ACTIVE]" not in line for line in lines)
     
     def test_end_all_tasks_with_no_active(self):
         """Test end_all_tasks returns False when no active tasks."""
         result = self.worklog.end_all_tasks()
         
-        self.assertFalse(result)
+        assert not result
     
     def test_convert_anonymous_to_named(self):
         """Test converting anonymous task to named task."""
         # Start anonymous task
         self.worklog.start_task(None)
-        self.assertIn(self.worklog.ANONYMOUS_TASK_NAME, self.worklog.data.active_tasks)
+        assert self.worklog.ANONYMOUS_TASK_NAME in self.worklog.data.active_tasks
         
         # Start named task (should convert anonymous)
         result = self.worklog.start_task("Named Task")
         
-        self.assertTrue(result)
-        self.assertNotIn(self.worklog.ANONYMOUS_TASK_NAME, self.worklog.data.active_tasks)
-        self.assertIn("Named Task", self.worklog.data.active_tasks)
-        self.assertIn("Named Task", self.worklog.data.recent_tasks)
+        assert result
+        assert self.worklog.ANONYMOUS_TASK_NAME not in self.worklog.data.active_tasks
+        assert "Named Task" in self.worklog.data.active_tasks
+        assert "Named Task" in self.worklog.data.recent_tasks
     
     def test_convert_anonymous_not_in_parallel_mode(self):
         """Test anonymous task is NOT converted in parallel mode."""
@@ -505,21 +1052,21 @@ class TestNewFeatures(unittest.TestCase):
         # Start named task in parallel mode (should NOT convert)
         result = self.worklog.start_task("Named Task", parallel=True)
         
-        self.assertTrue(result)
-        self.assertIn(self.worklog.ANONYMOUS_TASK_NAME, self.worklog.data.active_tasks)
-        self.assertIn("Named Task", self.worklog.data.active_tasks)
-        self.assertEqual(len(self.worklog.data.active_tasks), 2)
+        assert result
+        assert self.worklog.ANONYMOUS_TASK_NAME in self.worklog.data.active_tasks
+        assert "Named Task" in self.worklog.data.active_tasks
+        assert len(self.worklog.data.active_tasks) == 2
     
     def test_custom_time_option(self):
         """Test --time option sets custom start time."""
         result = self.worklog.start_task("Task", custom_time="14:30")
         
-        self.assertTrue(result)
+        assert result
         start_time = self.worklog.data.active_tasks["Task"]
         # Check that time is 14:30
         dt = datetime.fromisoformat(start_time)
-        self.assertEqual(dt.hour, 14)
-        self.assertEqual(dt.minute, 30)
+        assert dt.hour == 14
+        assert dt.minute == 30
     
     def test_list_shows_only_active_when_tasks_active(self):
         """Test list command shows only active tasks when tasks are running."""
@@ -529,7 +1076,7 @@ class TestNewFeatures(unittest.TestCase):
         
         # When we have active tasks, list_entries should return early
         # We can verify by checking if it would skip completed entries display
-        self.assertIn("Active Task", self.worklog.data.active_tasks)
+        assert "Active Task" in self.worklog.data.active_tasks
     
     def test_recent_shows_completed_entries(self):
         """Test recent command shows completed task details."""
@@ -541,46 +1088,46 @@ class TestNewFeatures(unittest.TestCase):
         self.worklog.end_task("Task 2")
         
         # Verify entries exist with all details
-        self.assertEqual(len(self.worklog.data.entries), 2)
+        assert len(self.worklog.data.entries) == 2
         for entry in self.worklog.data.entries:
-            self.assertIsNotNone(entry.start_time)
-            self.assertIsNotNone(entry.end_time)
-            self.assertIsNotNone(entry.duration)
+            assert entry.start_time is not None
+            assert entry.end_time is not None
+            assert entry.duration is not None
 
     def test_custom_time_with_date(self):
         """Test --time option with full date format YYYY-MM-DD HH:MM."""
         result = self.worklog.start_task("Task", custom_time="2025-12-10 09:30")
         
-        self.assertTrue(result)
+        assert result
         start_time = self.worklog.data.active_tasks["Task"]
         dt = datetime.fromisoformat(start_time)
-        self.assertEqual(dt.year, 2025)
-        self.assertEqual(dt.month, 12)
-        self.assertEqual(dt.day, 10)
-        self.assertEqual(dt.hour, 9)
-        self.assertEqual(dt.minute, 30)
+        assert dt.year == 2025
+        assert dt.month == 12
+        assert dt.day == 10
+        assert dt.hour == 9
+        assert dt.minute == 30
 
     def test_custom_time_with_date_on_end(self):
         """Test --time option with date on end command."""
         self.worklog.start_task("Task", custom_time="2025-12-10 09:00")
         result = self.worklog.end_task("Task", custom_time="2025-12-10 17:30")
         
-        self.assertTrue(result)
+        assert result
         entry = self.worklog.data.entries[-1]
         end_dt = datetime.fromisoformat(entry.end_time)
-        self.assertEqual(end_dt.year, 2025)
-        self.assertEqual(end_dt.month, 12)
-        self.assertEqual(end_dt.day, 10)
-        self.assertEqual(end_dt.hour, 17)
-        self.assertEqual(end_dt.minute, 30)
+        assert end_dt.year == 2025
+        assert end_dt.month == 12
+        assert end_dt.day == 10
+        assert end_dt.hour == 17
+        assert end_dt.minute == 30
 
     def test_project_on_start(self):
         """Test --project option on start command."""
         result = self.worklog.start_task("Fix bug", project="Backend API")
         
-        self.assertTrue(result)
-        self.assertIn("Fix bug", self.worklog.data.active_tasks)
-        self.assertEqual(self.worklog.data.active_task_projects.get("Fix bug"), "Backend API")
+        assert result
+        assert "Fix bug" in self.worklog.data.active_tasks
+        assert self.worklog.data.active_task_projects.get("Fix bug") == "Backend API"
 
     def test_project_saved_in_entry(self):
         """Test project is saved in completed task entry."""
@@ -588,7 +1135,7 @@ class TestNewFeatures(unittest.TestCase):
         self.worklog.end_task("Fix bug")
         
         entry = self.worklog.data.entries[-1]
-        self.assertEqual(entry.project, "Backend API")
+        assert entry.project == "Backend API"
 
     def test_project_filter_in_list(self):
         """Test --project filter in list_entries."""
@@ -605,12 +1152,12 @@ class TestNewFeatures(unittest.TestCase):
         # Filter by project (Backend matches both "Backend" and "Backend API")
         entries = [e for e in self.worklog.data.entries 
                    if e.project and "backend" in e.project.lower()]
-        self.assertEqual(len(entries), 2)
+        assert len(entries) == 2
         
         # Filter by exact project
         entries = [e for e in self.worklog.data.entries 
                    if e.project and e.project == "Frontend"]
-        self.assertEqual(len(entries), 1)
+        assert len(entries) == 1
 
     def test_task_without_project(self):
         """Test task without project has None as project."""
@@ -618,10 +1165,10 @@ class TestNewFeatures(unittest.TestCase):
         self.worklog.end_task("Simple Task")
         
         entry = self.worklog.data.entries[-1]
-        self.assertIsNone(entry.project)
+        assert entry.project is None
 
 
-class TestDateTimeValidation(unittest.TestCase):
+class TestDateTimeValidation:
     """Test datetime format validation."""
     
     def test_validate_datetime_time_only(self):
@@ -629,46 +1176,65 @@ class TestDateTimeValidation(unittest.TestCase):
         from src.worklog.validators import WorkLogValidator
         
         result = WorkLogValidator.validate_datetime_format("14:30")
-        self.assertEqual(result.hour, 14)
-        self.assertEqual(result.minute, 30)
+        assert result.hour == 14
+        assert result.minute == 30
         # Should use today's date
-        self.assertEqual(result.date(), datetime.now().date())
+        assert result.date() == datetime.now().date()
+
+    def test_validate_datetime_time_edge_cases(self):
+        """Test boundary and non-padded times agree across fast and slow paths."""
+        from src.worklog.validators import WorkLogValidator
+        
+        for value, expected in (("00:00", (0, 0)), ("23:59", (23, 59)), ("9:05", (9, 5)),
+                                ("2025-12-10 9:05", (9, 5))):
+            result = WorkLogValidator.validate_datetime_format(value)
+            assert (result.hour, result.minute, result.second, result.microsecond) == expected + (0, 0)
+        for value in ("24:00", "12:60", "ab:cd", "2025-12-10 24:00"):
+            with pytest.raises(ValueError):
+                WorkLogValidator.validate_datetime_format(value)
 
     def test_validate_datetime_full_format(self):
         """Test validation of YYYY-MM-DD HH:MM format."""
         from src.worklog.validators import WorkLogValidator
         
         result = WorkLogValidator.validate_datetime_format("2025-12-10 09:30")
-        self.assertEqual(result.year, 2025)
-        self.assertEqual(result.month, 12)
-        self.assertEqual(result.day, 10)
-        self.assertEqual(result.hour, 9)
-        self.assertEqual(result.minute, 30)
+        assert result.year == 2025
+        assert result.month == 12
+        assert result.day == 10
+        assert result.hour == 9
+        assert result.minute == 30
 
     def test_validate_datetime_invalid_date(self):
         """Test validation fails for invalid date."""
         from src.worklog.validators import WorkLogValidator
         
-        with self.assertRaises(ValueError) as ctx:
+        with pytest.raises(ValueError) as ctx:
             WorkLogValidator.validate_datetime_format("2025-13-10 09:30")
-        self.assertIn("Invalid date", str(ctx.exception))
+        assert "Invalid date" in str(ctx.value)
 
     def test_validate_datetime_invalid_time(self):
         """Test validation fails for invalid time."""
         from src.worklog.validators import WorkLogValidator
         
-        with self.assertRaises(ValueError) as ctx:
+        with pytest.raises(ValueError) as ctx:
             WorkLogValidator.validate_datetime_format("25:30")
-        self.assertIn("Hours must be", str(ctx.exception))
+        assert "Hours must be" in str(ctx.value)
 
     def test_validate_datetime_invalid_format(self):
         """Test validation fails for malformed input."""
         from src.worklog.validators import WorkLogValidator
         
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             WorkLogValidator.validate_datetime_format("not-a-time")
 
+    def test_validate_datetime_single_digit_hour(self):
+        """Test non-padded hours are still accepted outside the HH:MM fast path."""
+        from src.worklog.validators import WorkLogValidator
+        
+        result = WorkLogValidator.validate_datetime_format("9:05")
+        assert (result.hour, result.minute, result.second) == (9, 5, 0)
+        assert result.date() == datetime.now().date()
+
 
-if __name__ == '__main__':
-    # Run all tests
-    unittest.main()
\ No newline at end of file
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
\ No newline at end of file